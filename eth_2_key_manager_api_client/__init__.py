@@ -1,5 +1,6 @@
 """ A client library for accessing Eth2 key manager API """
 from .client import AuthenticatedClient, Client
 from .eth_2_keymanager import Eth2KeyManager
+from .fleet import Eth2KeyManagerFleet
 
-__all__ = ("AuthenticatedClient", "Client", "Eth2KeyManager")
+__all__ = ("AuthenticatedClient", "Client", "Eth2KeyManager", "Eth2KeyManagerFleet")
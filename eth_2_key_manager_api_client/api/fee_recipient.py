@@ -17,7 +17,7 @@ import attr
 import httpx
 
 from eth_2_key_manager_api_client.client import AuthenticatedClient
-from eth_2_key_manager_api_client.helpers import _build_response, _get_kwargs
+from eth_2_key_manager_api_client.helpers import _asend_request, _build_response, _get_kwargs, _send_request
 from eth_2_key_manager_api_client.models.error_response import ErrorResponse
 from eth_2_key_manager_api_client.models.list_fee_recipient_response import ListFeeRecipientResponse
 from eth_2_key_manager_api_client.models.set_fee_recipient_request import SetFeeRecipientRequest
@@ -91,10 +91,7 @@ class DeleteFeeRecipient:
             method=self.METHOD,
         )
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response)
 
@@ -147,8 +144,7 @@ class DeleteFeeRecipient:
             method=self.METHOD,
         )
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response)
 
@@ -246,10 +242,7 @@ class ListFeeRecipient:
             method=self.METHOD,
         )
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ListFeeRecipientResponse)
 
@@ -308,8 +301,7 @@ class ListFeeRecipient:
 
         kwargs = _get_kwargs(client=self.client, endpoint=f"validator/{pubkey}/feerecipient", method=self.METHOD)
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ListFeeRecipientResponse)
 
@@ -409,10 +401,7 @@ class SetFeeRecipient:
 
         kwargs = _get_kwargs(client=self.client, endpoint=f"validator/{pubkey}/feerecipient", method=self.METHOD, json_body=set_fee_recipient_body)
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response)
 
@@ -474,8 +463,7 @@ class SetFeeRecipient:
 
         kwargs = _get_kwargs(client=self.client, endpoint=f"validator/{pubkey}/feerecipient", method=self.METHOD, json_body=set_fee_recipient_body)
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response)
 
@@ -14,10 +14,9 @@ Each class provides access to a specific endpoint. The classes are organized in
 from typing import Any, Optional, Union
 
 import attr
-import httpx
 
 from eth_2_key_manager_api_client.client import AuthenticatedClient
-from eth_2_key_manager_api_client.helpers import _build_response, _get_kwargs
+from eth_2_key_manager_api_client.helpers import _asend_request, _build_response, _get_kwargs, _send_request
 from eth_2_key_manager_api_client.models.error_response import ErrorResponse
 from eth_2_key_manager_api_client.models.list_gas_limit_response import ListGasLimitResponse
 from eth_2_key_manager_api_client.models.set_gas_limit_request import SetGasLimitRequest
@@ -89,10 +88,7 @@ class DeleteGasLimit:
 
         kwargs = _get_kwargs(client=self.client, endpoint=f"validator/{pubkey}/gas_limit", method=self.METHOD)
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response)
 
@@ -148,8 +144,7 @@ class DeleteGasLimit:
 
         kwargs = _get_kwargs(client=self.client, endpoint=f"validator/{pubkey}/gas_limit", method=self.METHOD)
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response)
 
@@ -250,10 +245,7 @@ class GetGasLimit:
 
         kwargs = _get_kwargs(client=self.client, endpoint=f"validator/{pubkey}/gas_limit", method=self.METHOD)
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ListGasLimitResponse)
 
@@ -319,8 +311,7 @@ class GetGasLimit:
 
         kwargs = _get_kwargs(client=self.client, endpoint=f"validator/{pubkey}/gas_limit", method=self.METHOD)
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ListGasLimitResponse)
 
@@ -429,10 +420,7 @@ class SetGasLimit:
             json_body=json_body,
         )
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response)
 
@@ -499,8 +487,7 @@ class SetGasLimit:
             json_body=json_body,
         )
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response)
 
@@ -14,14 +14,13 @@ Each class provides access to a specific endpoint. The classes are organized in
 from typing import List, Optional, Union
 
 import attr
-import httpx
 
 from eth_2_key_manager_api_client.client import AuthenticatedClient
-from eth_2_key_manager_api_client.helpers import _build_response, _get_kwargs
+from eth_2_key_manager_api_client.helpers import _asend_request, _build_response, _get_kwargs, _send_request
+from eth_2_key_manager_api_client.keystore_encoding import KeystoreEncodingCache
 from eth_2_key_manager_api_client.models.delete_keys_json_body import DeleteKeysJsonBody
 from eth_2_key_manager_api_client.models.delete_keys_response import DeleteKeysResponse
 from eth_2_key_manager_api_client.models.error_response import ErrorResponse
-from eth_2_key_manager_api_client.models.import_keystores_json_body import ImportKeystoresJsonBody
 from eth_2_key_manager_api_client.models.import_keystores_response import ImportKeystoresResponse
 from eth_2_key_manager_api_client.models.list_keys_response import ListKeysResponse
 from eth_2_key_manager_api_client.types import UNSET, Response, Unset
@@ -35,6 +34,9 @@ class ImportKeystores:
     The endpoint returns the following HTTP status code if successful:
         - 200: OK
 
+    Keystores are encoded through `keystore_encoding_cache`, Client.keystore_encoding_cache by default. Set it to
+    None for one-off imports of more keystores than should stay in memory.
+
     Typical usage example:
         ```python
         import eth_2_key_manager_api_client
@@ -118,6 +120,11 @@ class ImportKeystores:
     client: AuthenticatedClient
     ENDPOINT: str = "keystores"
     METHOD: str = "POST"
+    keystore_encoding_cache: Optional[KeystoreEncodingCache] = attr.ib(kw_only=True, repr=False)
+
+    @keystore_encoding_cache.default
+    def _keystore_encoding_cache_default(self) -> Optional[KeystoreEncodingCache]:
+        return self.client.keystore_encoding_cache
 
     def sync_detailed(
         self,
@@ -144,23 +151,18 @@ class ImportKeystores:
         Returns:
             Response object containing the response from the server, response headers, status code and ImportKeystoresResponse object if the request succeeds, otherwise an ErrorResponse object.
         """
-        import_keystores_body = ImportKeystoresJsonBody(
-            keystores=keystores,
-            passwords=passwords,
-            slashing_protection=slashing_protection_data,
-        )
+        # with a cache, keystores are encoded once and reused by retries, bulk import chunks and fleet fan-outs
+        keystore_encoding_cache = self.keystore_encoding_cache if self.keystore_encoding_cache is not None else KeystoreEncodingCache(max_bytes=0)
+        import_keystores_body = keystore_encoding_cache.build_import_keystores_body(self.client.json_codec, keystores, passwords, slashing_protection_data)
 
         kwargs = _get_kwargs(
             client=self.client,
             endpoint=self.ENDPOINT,
             method=self.METHOD,
-            json_body=import_keystores_body,
+            content=import_keystores_body,
         )
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ImportKeystoresResponse)
 
@@ -221,21 +223,18 @@ class ImportKeystores:
             Response object containing the response from the server, response headers, status code and ImportKeystoresResponse object if the request succeeds, otherwise an ErrorResponse object.
         """
 
-        import_keystores_body = ImportKeystoresJsonBody(
-            keystores=keystores,
-            passwords=passwords,
-            slashing_protection=slashing_protection_data,
-        )
+        # with a cache, keystores are encoded once and reused by retries, bulk import chunks and fleet fan-outs
+        keystore_encoding_cache = self.keystore_encoding_cache if self.keystore_encoding_cache is not None else KeystoreEncodingCache(max_bytes=0)
+        import_keystores_body = keystore_encoding_cache.build_import_keystores_body(self.client.json_codec, keystores, passwords, slashing_protection_data)
 
         kwargs = _get_kwargs(
             client=self.client,
             endpoint=self.ENDPOINT,
             method=self.METHOD,
-            json_body=import_keystores_body,
+            content=import_keystores_body,
         )
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ImportKeystoresResponse)
 
@@ -331,10 +330,7 @@ class ListKeys:
 
         kwargs = _get_kwargs(client=self.client, endpoint=self.ENDPOINT, method=self.METHOD)
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ListKeysResponse)
 
@@ -371,8 +367,7 @@ class ListKeys:
 
         kwargs = _get_kwargs(client=self.client, endpoint=self.ENDPOINT, method=self.METHOD)
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ListKeysResponse)
 
@@ -477,10 +472,7 @@ class DeleteKeys:
             json_body=delete_keys_body,
         )
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=DeleteKeysResponse)
 
@@ -560,8 +552,7 @@ class DeleteKeys:
             json_body=delete_keys_body,
         )
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=DeleteKeysResponse)
 
@@ -14,10 +14,9 @@ Each class provides access to a specific endpoint. The classes are organized in
 from typing import Dict, List, Optional, Union
 
 import attr
-import httpx
 
 from eth_2_key_manager_api_client.client import AuthenticatedClient
-from eth_2_key_manager_api_client.helpers import _build_response, _get_kwargs
+from eth_2_key_manager_api_client.helpers import _asend_request, _build_response, _get_kwargs, _send_request
 from eth_2_key_manager_api_client.models.delete_remote_keys_json_body import DeleteRemoteKeysJsonBody
 from eth_2_key_manager_api_client.models.delete_remote_keys_response import DeleteRemoteKeysResponse
 from eth_2_key_manager_api_client.models.error_response import ErrorResponse
@@ -100,10 +99,7 @@ class DeleteRemoteKeys:
             json_body=json_body,
         )
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=DeleteRemoteKeysResponse)
 
@@ -160,8 +156,7 @@ class DeleteRemoteKeys:
             json_body=json_body,
         )
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=DeleteRemoteKeysResponse)
 
@@ -282,10 +277,7 @@ class ImportRemoteKeys:
             json_body=json_body,
         )
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ImportRemoteKeysResponse)
 
@@ -353,8 +345,7 @@ class ImportRemoteKeys:
             json_body=json_body,
         )
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ImportRemoteKeysResponse)
 
@@ -446,10 +437,7 @@ class ListRemoteKeys:
 
         kwargs = _get_kwargs(client=self.client, endpoint=self.ENDPOINT, method=self.METHOD)
 
-        response = httpx.request(
-            verify=self.client.verify_ssl,
-            **kwargs,
-        )
+        response = _send_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ListRemoteKeysResponse)
 
@@ -487,8 +475,7 @@ class ListRemoteKeys:
 
         kwargs = _get_kwargs(client=self.client, endpoint=self.ENDPOINT, method=self.METHOD)
 
-        async with httpx.AsyncClient(verify=self.client.verify_ssl) as _client:
-            response = await _client.request(**kwargs)
+        response = await _asend_request(client=self.client, kwargs=kwargs)
 
         return _build_response(client=self.client, response=response, cls=ListRemoteKeysResponse)
 
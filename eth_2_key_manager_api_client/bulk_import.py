@@ -0,0 +1,376 @@
+"""
+Provides the BulkImportKeystores class, which imports large numbers of keystores in adaptively sized chunks.
+
+Validator clients decrypt imported keystores serially, so a single POST /eth/v1/keystores request with thousands of
+scrypt keystores easily exceeds the request timeout. BulkImportKeystores splits the input into chunks and sizes each
+chunk so that a request takes roughly `target_latency` seconds based on the latency observed for previous chunks.
+Chunks whose request times out reading or writing are split in half and retried. Connect and pool timeouts say nothing
+about the chunk size, those chunks are reported with the error status. The statuses of all chunks are merged back into
+a single ImportKeystoresResponse in input order. Within a timeouts.deadline, chunks which can't be sent before the
+deadline are reported with the error status.
+
+Slashing protection data is indexed by pubkey once, and each chunk only carries the EIP-3076 records of its own
+keystores.
+
+`sync_from_pairs` / `asyncio_from_pairs` pull (keystore, password) pairs from an iterable one chunk at a time, e.g. from
+a KeystoreLoader reading a directory or archive, so the keystores never have to be loaded into memory all at once.
+"""
+import asyncio
+import json
+import time
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import attr
+import httpx
+
+from eth_2_key_manager_api_client.api.local_key_manager import ImportKeystores
+from eth_2_key_manager_api_client.client import AuthenticatedClient
+from eth_2_key_manager_api_client.errors import CircuitOpen, DeadlineExceeded
+from eth_2_key_manager_api_client.helpers import _get_parsed
+from eth_2_key_manager_api_client.keystore_precheck import KeystorePrecheck
+from eth_2_key_manager_api_client.models.error_response import ErrorResponse
+from eth_2_key_manager_api_client.models.import_keystores_response import ImportKeystoresResponse
+from eth_2_key_manager_api_client.models.import_keystores_response_data_item import ImportKeystoresResponseDataItem
+from eth_2_key_manager_api_client.models.import_keystores_response_data_item_status import (
+    ImportKeystoresResponseDataItemStatus,
+)
+from eth_2_key_manager_api_client.slashing_protection import SlashingProtectionIndex
+from eth_2_key_manager_api_client.timeouts import get_remaining
+from eth_2_key_manager_api_client.types import UNSET, Response, Unset
+
+# timeouts of requests which reached the node, a smaller chunk may succeed
+_CHUNK_TIMEOUT_EXCEPTIONS = (httpx.ReadTimeout, httpx.WriteTimeout)
+
+
+def _keystore_pubkey(keystore: str) -> Optional[str]:
+    try:
+        pubkey = json.loads(keystore).get("pubkey")
+    except (ValueError, AttributeError):
+        return None
+    return pubkey if isinstance(pubkey, str) else None
+
+
+def _deadline_passed() -> bool:
+    remaining = get_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def _error_items(count: int, message: str) -> List[ImportKeystoresResponseDataItem]:
+    return [ImportKeystoresResponseDataItem(status=ImportKeystoresResponseDataItemStatus.ERROR, message=message) for _ in range(count)]
+
+
+@attr.s(auto_attribs=True)
+class _BulkImportChunk:
+    """A chunk of keystores, kept until its statuses are recorded so that it can be split and retried."""
+
+    indexes: List[int]
+    keystores: List[str]
+    passwords: List[str]
+
+    def split(self) -> Tuple["_BulkImportChunk", "_BulkImportChunk"]:
+        middle = len(self.keystores) // 2
+        return (
+            _BulkImportChunk(self.indexes[:middle], self.keystores[:middle], self.passwords[:middle]),
+            _BulkImportChunk(self.indexes[middle:], self.keystores[middle:], self.passwords[middle:]),
+        )
+
+
+@attr.s(auto_attribs=True)
+class _BulkImportPlan:
+    """Keeps track of the chunks of a single bulk import and the adaptive chunk size.
+
+    Keystores are pulled from the source one chunk at a time, only the chunks in flight are kept in memory.
+    """
+
+    importer: "BulkImportKeystores"
+    source: Iterator[Tuple[str, str]]
+    slashing_protection_data: Union[Unset, str]
+    slashing_protection_index: Optional[SlashingProtectionIndex]
+    chunk_size: int
+    cursor: int = 0
+    retries: Deque[_BulkImportChunk] = attr.ib(factory=deque)
+    results: List[Optional[ImportKeystoresResponseDataItem]] = attr.ib(factory=list)
+    precheck_lock: Optional[asyncio.Lock] = None
+
+    def _pull_chunk(self) -> Optional[_BulkImportChunk]:
+        pairs = list(islice(self.source, self.chunk_size))
+        if not pairs:
+            return None
+        chunk = _BulkImportChunk(list(range(self.cursor, self.cursor + len(pairs))), [keystore for keystore, _ in pairs], [password for _, password in pairs])
+        self.cursor += len(pairs)
+        self.results.extend([None] * len(pairs))
+        return chunk
+
+    def _remove_rejected(self, chunk: _BulkImportChunk, precheck_errors: List[Optional[str]]) -> _BulkImportChunk:
+        """Reports the pairs which failed the precheck and returns the remaining ones."""
+        for index, precheck_error in zip(chunk.indexes, precheck_errors):
+            if precheck_error is not None:
+                self.results[index] = _error_items(1, precheck_error)[0]
+        passed = [i for i, precheck_error in enumerate(precheck_errors) if precheck_error is None]
+        return _BulkImportChunk([chunk.indexes[i] for i in passed], [chunk.keystores[i] for i in passed], [chunk.passwords[i] for i in passed])
+
+    def next_chunk(self) -> Optional[_BulkImportChunk]:
+        if self.retries:
+            return self.retries.popleft()
+        while (chunk := self._pull_chunk()) is not None:
+            # chunks pulled after the deadline fail without being sent, don't spend CPU time on them
+            if self.importer.precheck is not None and not _deadline_passed():
+                chunk = self._remove_rejected(chunk, self.importer.precheck.check(chunk.keystores, chunk.passwords))
+            if chunk.keystores:
+                return chunk
+        return None
+
+    async def anext_chunk(self) -> Optional[_BulkImportChunk]:
+        if self.retries:
+            return self.retries.popleft()
+        while (chunk := self._pull_chunk()) is not None:
+            precheck = self.importer.precheck
+            if precheck is not None and not _deadline_passed():
+                # one precheck at a time, it already uses all CPU cores
+                if self.precheck_lock is None:
+                    self.precheck_lock = asyncio.Lock()
+                async with self.precheck_lock:
+                    precheck_errors = await asyncio.get_running_loop().run_in_executor(None, precheck.check, chunk.keystores, chunk.passwords)
+                chunk = self._remove_rejected(chunk, precheck_errors)
+            if chunk.keystores:
+                return chunk
+        return None
+
+    def chunk_slashing_protection(self, chunk: _BulkImportChunk) -> Union[Unset, str]:
+        if self.slashing_protection_index is None:
+            return self.slashing_protection_data
+
+        pubkeys = [_keystore_pubkey(keystore) for keystore in chunk.keystores]
+        if any(pubkey is None for pubkey in pubkeys):
+            # the pubkey is optional in EIP-2335 keystores, never drop slashing protection data of unknown keys
+            if isinstance(self.slashing_protection_data, Unset):
+                self.slashing_protection_data = self.slashing_protection_index.to_str()
+            return self.slashing_protection_data
+        return self.slashing_protection_index.subset(pubkey for pubkey in pubkeys if pubkey is not None)
+
+    def record_response(self, chunk: _BulkImportChunk, response: Response, elapsed: float) -> None:
+        size = len(chunk.keystores)
+        self.chunk_size = self.importer._next_chunk_size(size, elapsed)
+
+        parsed = _get_parsed(client=self.importer.client, response=response, cls=ImportKeystoresResponse)
+        if isinstance(parsed, ImportKeystoresResponse):
+            data = list(parsed.data[:size])
+            data += _error_items(size - len(data), "No status returned for keystore")
+        elif isinstance(parsed, ErrorResponse):
+            data = _error_items(size, parsed.message)
+        else:
+            data = _error_items(size, f"Unexpected status code: {response.status_code}")
+        for index, data_item in zip(chunk.indexes, data):
+            self.results[index] = data_item
+
+    def record_exception(self, chunk: _BulkImportChunk, exception: Exception) -> None:
+        size = len(chunk.keystores)
+        if isinstance(exception, _CHUNK_TIMEOUT_EXCEPTIONS) and size > self.importer.min_chunk_size:
+            # the chunk took too long, shrink the chunks and retry both halves of this one
+            self.chunk_size = max(self.importer.min_chunk_size, size // 2)
+            self.retries.extend(chunk.split())
+            return
+        for index, data_item in zip(chunk.indexes, _error_items(size, f"{type(exception).__name__}: {exception}")):
+            self.results[index] = data_item
+
+    def response(self) -> ImportKeystoresResponse:
+        data = []
+        for item in self.results:
+            data.extend([item] if item is not None else _error_items(1, "Keystore was not imported"))
+        return ImportKeystoresResponse(data=data)
+
+
+@attr.s(auto_attribs=True)
+class BulkImportKeystores:
+    """Imports large numbers of keystores using POST /eth/v1/keystores in adaptively sized chunks.
+
+    Attributes:
+        client: The API client used to send the requests.
+        initial_chunk_size: The number of keystores sent in the first request.
+        min_chunk_size: The smallest chunk size. Chunks of this size which time out are reported as errors.
+        max_chunk_size: The largest chunk size.
+        target_latency: The desired duration of a single request in seconds. Should be well below the client timeout.
+        max_concurrency: The maximum number of chunks in flight when using the asynchronous method.
+        precheck: Optional KeystorePrecheck verifying the passwords locally before each chunk is sent. Pairs which fail
+            it are reported with the error status and never uploaded.
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(timeout=60.0)
+        response = eth_2_key_manager.bulk_import_keystores.sync(keystores, passwords, slashing_protection_str)
+
+        for data_item in response.data:
+            print(data_item.status)
+        ```
+    """
+
+    client: AuthenticatedClient
+    initial_chunk_size: int = attr.ib(20, kw_only=True)
+    min_chunk_size: int = attr.ib(1, kw_only=True)
+    max_chunk_size: int = attr.ib(500, kw_only=True)
+    target_latency: float = attr.ib(5.0, kw_only=True)
+    max_concurrency: int = attr.ib(2, kw_only=True)
+    precheck: Optional[KeystorePrecheck] = attr.ib(None, kw_only=True)
+
+    def _next_chunk_size(self, chunk_size: int, elapsed: float) -> int:
+        """Sizes the next chunk so that it takes about target_latency seconds, growing at most 2x per request."""
+        if elapsed <= 0:
+            ideal = self.max_chunk_size
+        else:
+            ideal = int(self.target_latency * chunk_size / elapsed)
+        return max(self.min_chunk_size, min(self.max_chunk_size, ideal, chunk_size * 2))
+
+    def _plan(
+        self,
+        source: Iterator[Tuple[str, str]],
+        slashing_protection_data: Union[Unset, str, SlashingProtectionIndex],
+    ) -> _BulkImportPlan:
+        slashing_protection_index: Optional[SlashingProtectionIndex] = None
+        if isinstance(slashing_protection_data, SlashingProtectionIndex):
+            slashing_protection_index, slashing_protection_data = slashing_protection_data, UNSET
+        elif isinstance(slashing_protection_data, str):
+            try:
+                slashing_protection_index = SlashingProtectionIndex.from_str(slashing_protection_data)
+            except ValueError:
+                # let the validator client report the invalid document
+                slashing_protection_index = None
+
+        return _BulkImportPlan(
+            importer=self,
+            source=source,
+            slashing_protection_data=slashing_protection_data,
+            slashing_protection_index=slashing_protection_index,
+            chunk_size=max(self.min_chunk_size, min(self.max_chunk_size, self.initial_chunk_size)),
+        )
+
+    def _run_sync(self, plan: _BulkImportPlan, import_keystores: ImportKeystores) -> ImportKeystoresResponse:
+        while (chunk := plan.next_chunk()) is not None:
+            started = time.perf_counter()
+            try:
+                response = import_keystores.sync_detailed(chunk.keystores, chunk.passwords, plan.chunk_slashing_protection(chunk))
+            except (httpx.HTTPError, CircuitOpen, DeadlineExceeded) as e:
+                plan.record_exception(chunk, e)
+            else:
+                plan.record_response(chunk, response, time.perf_counter() - started)
+
+        return plan.response()
+
+    async def _run_asyncio(self, plan: _BulkImportPlan, import_keystores: ImportKeystores) -> ImportKeystoresResponse:
+        async def worker() -> None:
+            while (chunk := await plan.anext_chunk()) is not None:
+                started = time.perf_counter()
+                try:
+                    response = await import_keystores.asyncio_detailed(chunk.keystores, chunk.passwords, plan.chunk_slashing_protection(chunk))
+                except (httpx.HTTPError, CircuitOpen, DeadlineExceeded) as e:
+                    plan.record_exception(chunk, e)
+                else:
+                    plan.record_response(chunk, response, time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, self.max_concurrency))))
+
+        return plan.response()
+
+    def sync(
+        self,
+        keystores: Sequence[str],
+        passwords: Sequence[str],
+        slashing_protection_data: Union[Unset, str, SlashingProtectionIndex] = UNSET,
+    ) -> ImportKeystoresResponse:
+        """Import Keystores in chunks (synchronous).
+
+        Chunks are sent one after another.
+
+        Args:
+            keystores: List of keystores (strings) to import.
+            passwords: List of passwords to unlock the keystores. `passwords[i]` must unlock `keystores[i]`.
+            slashing_protection_data: Slashing protection data as string or SlashingProtectionIndex. Each chunk only
+                carries the records of its own keystores.
+
+        Raises:
+            ValueError: If keystores and passwords have different lengths.
+
+        Returns:
+            ImportKeystoresResponse with one status per keystore in input order. Keystores of chunks which failed are
+            reported with the error status and the reason in the message.
+        """
+        if len(keystores) != len(passwords):
+            raise ValueError("keystores and passwords must have the same length")
+
+        return self._run_sync(self._plan(zip(keystores, passwords), slashing_protection_data), ImportKeystores(self.client))
+
+    def sync_from_pairs(
+        self,
+        keystore_password_pairs: Iterable[Tuple[str, str]],
+        slashing_protection_data: Union[Unset, str, SlashingProtectionIndex] = UNSET,
+    ) -> ImportKeystoresResponse:
+        """Import Keystores in chunks from an iterable of (keystore, password) pairs (synchronous).
+
+        Pairs are pulled from the iterable one chunk at a time, e.g. from a KeystoreLoader, and only the chunk in
+        flight is kept in memory. Keystores are not added to Client.keystore_encoding_cache.
+
+        Args:
+            keystore_password_pairs: Iterable of (keystore, password) pairs to import.
+            slashing_protection_data: Slashing protection data as string or SlashingProtectionIndex. Each chunk only
+                carries the records of its own keystores.
+
+        Returns:
+            ImportKeystoresResponse with one status per keystore in input order. Keystores of chunks which failed are
+            reported with the error status and the reason in the message.
+        """
+        import_keystores = ImportKeystores(self.client, keystore_encoding_cache=None)
+        return self._run_sync(self._plan(iter(keystore_password_pairs), slashing_protection_data), import_keystores)
+
+    async def asyncio(
+        self,
+        keystores: Sequence[str],
+        passwords: Sequence[str],
+        slashing_protection_data: Union[Unset, str, SlashingProtectionIndex] = UNSET,
+    ) -> ImportKeystoresResponse:
+        """Import Keystores in chunks (asynchronous).
+
+        Up to `max_concurrency` chunks are in flight at the same time.
+
+        Args:
+            keystores: List of keystores (strings) to import.
+            passwords: List of passwords to unlock the keystores. `passwords[i]` must unlock `keystores[i]`.
+            slashing_protection_data: Slashing protection data as string or SlashingProtectionIndex. Each chunk only
+                carries the records of its own keystores.
+
+        Raises:
+            ValueError: If keystores and passwords have different lengths.
+
+        Returns:
+            ImportKeystoresResponse with one status per keystore in input order. Keystores of chunks which failed are
+            reported with the error status and the reason in the message.
+        """
+        if len(keystores) != len(passwords):
+            raise ValueError("keystores and passwords must have the same length")
+
+        return await self._run_asyncio(self._plan(zip(keystores, passwords), slashing_protection_data), ImportKeystores(self.client))
+
+    async def asyncio_from_pairs(
+        self,
+        keystore_password_pairs: Iterable[Tuple[str, str]],
+        slashing_protection_data: Union[Unset, str, SlashingProtectionIndex] = UNSET,
+    ) -> ImportKeystoresResponse:
+        """Import Keystores in chunks from an iterable of (keystore, password) pairs (asynchronous).
+
+        Up to `max_concurrency` chunks are in flight at the same time, pairs are pulled from the iterable one chunk at
+        a time. The iterable is read on the event loop, reading a chunk of keystore files briefly blocks it. Keystores
+        are not added to Client.keystore_encoding_cache.
+
+        Args:
+            keystore_password_pairs: Iterable of (keystore, password) pairs to import.
+            slashing_protection_data: Slashing protection data as string or SlashingProtectionIndex. Each chunk only
+                carries the records of its own keystores.
+
+        Returns:
+            ImportKeystoresResponse with one status per keystore in input order. Keystores of chunks which failed are
+            reported with the error status and the reason in the message.
+        """
+        import_keystores = ImportKeystores(self.client, keystore_encoding_cache=None)
+        return await self._run_asyncio(self._plan(iter(keystore_password_pairs), slashing_protection_data), import_keystores)
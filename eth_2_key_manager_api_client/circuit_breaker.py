@@ -0,0 +1,257 @@
+"""
+Provides the CircuitBreaker class, which fails requests to unreachable validator clients fast.
+
+Without a circuit breaker every request to a host which is down waits out the full `timeout` before failing, and a
+fleet sweep stalls on the dead hosts. A CircuitBreaker keeps one circuit per `base_url`:
+
+| State       | Behaviour                                                                                              |
+|-------------|--------------------------------------------------------------------------------------------------------|
+| `closed`    | Requests are sent. `failure_threshold` consecutive failures open the circuit.                          |
+| `open`      | Requests raise `errors.CircuitOpen` without being sent. After `reset_timeout` seconds it is half-open. |
+| `half_open` | One request probes the node, all others raise `errors.CircuitOpen`. A successful probe closes the      |
+|             | circuit, a failed probe opens it again.                                                                |
+
+Connection errors, timeouts and 5xx responses are failures, every other response proves the node is alive. A GET
+request is its own probe; before any other request, a `GET /eth/v1/keystores` (ListKeys) probe is sent, so that
+imports and deletions are never used to test a node which may still be down.
+
+A CircuitBreaker can be shared by the Eth2KeyManager instances of a fleet, which makes the state of all nodes
+available in one place:
+
+```python
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.circuit_breaker import CircuitBreaker
+
+circuit_breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0)
+async with eth_2_key_manager_api_client.Eth2KeyManagerFleet(nodes, circuit_breaker=circuit_breaker) as fleet:
+    results = await fleet.gather("list_keys")
+    print(circuit_breaker.states)  # {"https://192.168.121.35:7500": CircuitState.CLOSED, ...}
+```
+"""
+import threading
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+import attr
+import httpx
+
+from eth_2_key_manager_api_client.errors import CircuitOpen
+
+PROBE_ENDPOINT = "keystores"
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+@attr.s(auto_attribs=True)
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+
+
+@attr.s(auto_attribs=True)
+class CircuitBreaker:
+    """Keeps a circuit per base_url and rejects requests to nodes whose circuit is open.
+
+    Attributes:
+        failure_threshold: The number of consecutive failures which open a circuit.
+        reset_timeout: The number of seconds a circuit stays open before a probe is let through.
+        probe_endpoint: The endpoint probed with a GET request before other requests are sent to a half-open node.
+        on_state_change: Optional callback called with (base_url, old state, new state) on every transition, e.g. to
+            export the state as a metric or log it.
+        rejected: The number of requests rejected without being sent.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    probe_endpoint: str = PROBE_ENDPOINT
+    on_state_change: Optional[Callable[[str, CircuitState, CircuitState], None]] = attr.ib(default=None, repr=False, eq=False)
+    rejected: int = attr.ib(init=False, default=0)
+    _circuits: Dict[str, _Circuit] = attr.ib(init=False, factory=dict, repr=False, eq=False)
+    # reentrant, so that on_state_change may query the breaker
+    _lock: threading.RLock = attr.ib(init=False, factory=threading.RLock, repr=False, eq=False)
+
+    @property
+    def states(self) -> Dict[str, CircuitState]:
+        """The state of every base_url the breaker has seen a request for."""
+        with self._lock:
+            return {base_url: self._current_state(circuit) for base_url, circuit in self._circuits.items()}
+
+    def get_state(self, base_url: str) -> CircuitState:
+        """Returns the state of the circuit of a base_url.
+
+        Args:
+            base_url: The base URL of the validator client.
+        """
+        with self._lock:
+            circuit = self._circuits.get(base_url)
+            return self._current_state(circuit) if circuit is not None else CircuitState.CLOSED
+
+    def reset(self, base_url: Optional[str] = None) -> None:
+        """Closes the circuit of a base_url, or all circuits.
+
+        Args:
+            base_url: The base URL of the validator client. If None, all circuits are closed.
+        """
+        with self._lock:
+            for url in [base_url] if base_url is not None else list(self._circuits):
+                circuit = self._circuits.get(url)
+                if circuit is not None:
+                    self._transition(url, circuit, CircuitState.CLOSED)
+
+    def _current_state(self, circuit: _Circuit) -> CircuitState:
+        if circuit.state == CircuitState.OPEN and time.monotonic() - circuit.opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return circuit.state
+
+    def _transition(self, base_url: str, circuit: _Circuit, state: CircuitState) -> None:
+        old_state = circuit.state
+        circuit.state = state
+        circuit.probing = False
+        if state == CircuitState.OPEN:
+            circuit.opened_at = time.monotonic()
+        else:
+            circuit.consecutive_failures = 0
+        if old_state != state and self.on_state_change is not None:
+            self.on_state_change(base_url, old_state, state)
+
+    def _acquire(self, base_url: str) -> bool:
+        """Lets a request through or raises CircuitOpen. Returns True if the caller has to probe the node."""
+        with self._lock:
+            circuit = self._circuits.setdefault(base_url, _Circuit())
+            state = self._current_state(circuit)
+            if state == CircuitState.CLOSED:
+                return False
+            if state == CircuitState.HALF_OPEN and not circuit.probing:
+                if circuit.state != CircuitState.HALF_OPEN:
+                    self._transition(base_url, circuit, CircuitState.HALF_OPEN)
+                circuit.probing = True
+                return True
+            self.rejected += 1
+            retry_after = max(0.0, circuit.opened_at + self.reset_timeout - time.monotonic())
+            raise CircuitOpen(base_url, retry_after)
+
+    def _record(self, base_url: str, failed: bool) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(base_url, _Circuit())
+            if not failed:
+                if circuit.state != CircuitState.CLOSED:
+                    self._transition(base_url, circuit, CircuitState.CLOSED)
+                circuit.consecutive_failures = 0
+                return
+            circuit.consecutive_failures += 1
+            if circuit.state == CircuitState.HALF_OPEN or (circuit.state == CircuitState.CLOSED and circuit.consecutive_failures >= self.failure_threshold):
+                self._transition(base_url, circuit, CircuitState.OPEN)
+
+    def _release_probe(self, base_url: str) -> None:
+        """Lets the next request probe again if the probe ended without an outcome, e.g. it was cancelled."""
+        with self._lock:
+            circuit = self._circuits.get(base_url)
+            if circuit is not None and circuit.state == CircuitState.HALF_OPEN:
+                circuit.probing = False
+
+    @staticmethod
+    def _is_failure(outcome: Union[httpx.Response, BaseException]) -> Optional[bool]:
+        """Whether the outcome shows the node is unavailable. None if it says nothing about the node."""
+        if isinstance(outcome, httpx.Response):
+            return outcome.status_code >= 500
+        if isinstance(outcome, httpx.TransportError):
+            return True
+        return None
+
+    def _record_outcome(self, base_url: str, outcome: Union[httpx.Response, BaseException]) -> None:
+        failed = self._is_failure(outcome)
+        if failed is not None:
+            self._record(base_url, failed)
+
+    def _probe_kwargs(self, kwargs: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+        probe_kwargs = {key: value for key, value in kwargs.items() if key != "content"}
+        probe_kwargs.update(method="GET", url=f"{base_url}/eth/v1/{self.probe_endpoint}")
+        return probe_kwargs
+
+    def _check_probe(self, base_url: str, outcome: Union[httpx.Response, Exception]) -> None:
+        """Closes the circuit if the probe succeeded, otherwise opens it again and raises CircuitOpen."""
+        if isinstance(outcome, httpx.Response) and not self._is_failure(outcome):
+            self._record(base_url, failed=False)
+            return
+        self._record(base_url, failed=True)
+        raise CircuitOpen(base_url, self.reset_timeout) from (outcome if isinstance(outcome, Exception) else None)
+
+    def send(self, base_url: str, kwargs: Dict[str, Any], send: Callable[[Dict[str, Any]], httpx.Response]) -> httpx.Response:
+        """Sends a request unless the circuit of its node is open.
+
+        Args:
+            base_url: The base URL of the validator client.
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+            send: Sends a request with the given keyword arguments and returns the HTTP response.
+
+        Raises:
+            errors.CircuitOpen: If the circuit is open, or the probe of a half-open circuit failed.
+
+        Returns:
+            The HTTP response from the API call.
+        """
+        probe = self._acquire(base_url)
+        try:
+            if probe and kwargs["method"] != "GET":
+                # imports and deletions are not sent to a node which may still be down
+                probe_outcome: Union[httpx.Response, Exception]
+                try:
+                    probe_outcome = send(self._probe_kwargs(kwargs, base_url))
+                except Exception as e:
+                    probe_outcome = e
+                self._check_probe(base_url, probe_outcome)
+            try:
+                response = send(kwargs)
+            except Exception as e:
+                self._record_outcome(base_url, e)
+                raise
+            self._record_outcome(base_url, response)
+            return response
+        finally:
+            if probe:
+                self._release_probe(base_url)
+
+    async def asend(self, base_url: str, kwargs: Dict[str, Any], send: Callable[[Dict[str, Any]], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Sends a request asynchronously unless the circuit of its node is open.
+
+        Args:
+            base_url: The base URL of the validator client.
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+            send: Sends a request with the given keyword arguments and returns the HTTP response.
+
+        Raises:
+            errors.CircuitOpen: If the circuit is open, or the probe of a half-open circuit failed.
+
+        Returns:
+            The HTTP response from the API call.
+        """
+        probe = self._acquire(base_url)
+        try:
+            if probe and kwargs["method"] != "GET":
+                # imports and deletions are not sent to a node which may still be down
+                probe_outcome: Union[httpx.Response, Exception]
+                try:
+                    probe_outcome = await send(self._probe_kwargs(kwargs, base_url))
+                except Exception as e:
+                    probe_outcome = e
+                self._check_probe(base_url, probe_outcome)
+            try:
+                response = await send(kwargs)
+            except Exception as e:
+                self._record_outcome(base_url, e)
+                raise
+            self._record_outcome(base_url, response)
+            return response
+        finally:
+            if probe:
+                self._release_probe(base_url)
@@ -5,15 +5,30 @@ Eth 2 Key Manager API specification dictates that all sensitive endpoints must b
 endpoints do require authentication so the AuthenticatedClient is the class you interact with.
 The Client class is never accessed directly.
 
+Both classes own long-lived `httpx.Client` and `httpx.AsyncClient` instances which are shared by all endpoint classes.
+Connections are pooled and reused between requests until the client is closed.
+
 Refer to the API specification: https://ethereum.github.io/keymanager-APIs/
 
 """
 
 
+import asyncio
 import ssl
-from typing import Dict, Union
+from types import TracebackType
+from typing import Any, Dict, Optional, Type, Union
 
 import attr
+import httpx
+
+from eth_2_key_manager_api_client.circuit_breaker import CircuitBreaker
+from eth_2_key_manager_api_client.concurrency_limiter import AIMDConcurrencyLimiter
+from eth_2_key_manager_api_client.json_codec import JSONCodec, get_json_codec
+from eth_2_key_manager_api_client.keystore_encoding import KeystoreEncodingCache
+from eth_2_key_manager_api_client.list_cache import ListCache
+from eth_2_key_manager_api_client.rate_limit import RateLimiter
+from eth_2_key_manager_api_client.retry import RetryPolicy
+from eth_2_key_manager_api_client.single_flight import SingleFlight
 
 
 @attr.s(auto_attribs=True)
@@ -25,28 +40,78 @@ class Client:
         cookies: A dictionary of cookies to be sent with every request.
         headers: A dictionary of headers to be sent with every request.
         timeout: The maximum amount of a time in seconds a request can take. API functions will raise
-            httpx.TimeoutException if this is exceeded.
+            httpx.TimeoutException if this is exceeded. An `httpx.Timeout` sets the connect, read, write and pool
+            timeouts separately.
         verify_ssl: Whether or not to verify the SSL certificate of the API server. This should be True in production,
             but can be set to False for testing purposes.
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document.
         follow_redirects: Whether or not to follow redirects. Default value is False.
+        http2: Whether or not to enable HTTP/2 on the pooled clients. Requires the optional `h2` package, installed with
+            the `http2` extra (`pip install eth-2-key-manager-api-client[http2]`). HTTP/2 is negotiated with the server
+            via TLS ALPN, servers which only speak HTTP/1.1 (and all plain `http://` URLs) transparently fall back to
+            HTTP/1.1. Default value is False.
+        json_codec: The JSON codec used to encode request bodies and decode response bodies. Defaults to orjson or
+            msgspec when installed, otherwise the standard library json module. See the json_codec module.
+        parse_response: Whether or not to parse response bodies. Bodies are decoded lazily on first access of
+            `Response.parsed`. If False, the body is never decoded and `Response.parsed` is always None, which suits
+            callers only checking `Response.status_code`. Default value is True.
+        list_cache: Optional ListCache caching ListKeys / ListRemoteKeys responses, invalidated by key imports and
+            deletions sent through this client. See the list_cache module. Default value is None (no caching).
+        single_flight: Optional SingleFlight merging concurrent identical asynchronous GET requests into one HTTP
+            request. See the single_flight module. Default value is None.
+        keystore_encoding_cache: Optional KeystoreEncodingCache reused by ImportKeystores requests sent through this
+            client, it may be shared by many clients. See the keystore_encoding module. Default value is None (no
+            caching).
+        retry_policy: Optional RetryPolicy repeating requests which failed with transient errors. See the retry
+            module. Default value is None (no retries).
+        circuit_breaker: Optional CircuitBreaker rejecting requests while the node at base_url is failing, it may be
+            shared by many clients. See the circuit_breaker module. Default value is None.
+        concurrency_limiter: Optional AIMDConcurrencyLimiter adapting the number of asynchronous requests in flight to
+            the node at base_url, it may be shared by many clients. See the concurrency_limiter module. Default value
+            is None (no limit).
+        rate_limiter: Optional RateLimiter pacing the requests to the node at base_url with token buckets, per node
+            and per endpoint class. It may be shared by many clients. See the rate_limit module. Default value is None.
+        endpoint_timeouts: Timeouts replacing `timeout` for single endpoint classes, keyed by the endpoint class name,
+            e.g. "ImportKeystores". See the timeouts module. Default value is an empty dict.
+
+    The underlying `httpx.Client` and `httpx.AsyncClient` are created on first use and kept open so that
+    consecutive requests reuse pooled connections. The `httpx.AsyncClient` is bound to the event loop it is first used
+    in, a new one is created when the client is used in another event loop, e.g. by consecutive `asyncio.run` calls.
+    Close them with `close()` / `aclose()` or use the client as a (async) context manager.
 
     Examples:
         >>> from eth_2_key_manager_api_client.client import Client
         >>> client = Client(base_url="http://localhost:7500")
         >>> client.base_url
         'http://localhost:7500'
+        >>> with Client(base_url="http://localhost:7500") as client:
+        ...     client.get_httpx_client().is_closed
+        False
 
     """
 
     base_url: str
     cookies: Dict[str, str] = attr.ib(factory=dict, kw_only=True)
     headers: Dict[str, str] = attr.ib(factory=dict, kw_only=True)
-    timeout: float = attr.ib(5.0, kw_only=True)
+    timeout: Union[float, httpx.Timeout] = attr.ib(5.0, kw_only=True)
     verify_ssl: Union[str, bool, ssl.SSLContext] = attr.ib(True, kw_only=True)
     raise_on_unexpected_status: bool = attr.ib(False, kw_only=True)
     follow_redirects: bool = attr.ib(False, kw_only=True)
+    http2: bool = attr.ib(False, kw_only=True)
+    json_codec: JSONCodec = attr.ib(factory=get_json_codec, kw_only=True)
+    parse_response: bool = attr.ib(True, kw_only=True)
+    list_cache: Optional[ListCache] = attr.ib(None, kw_only=True)
+    single_flight: Optional[SingleFlight] = attr.ib(None, kw_only=True)
+    keystore_encoding_cache: Optional[KeystoreEncodingCache] = attr.ib(None, kw_only=True, repr=False)
+    retry_policy: Optional[RetryPolicy] = attr.ib(None, kw_only=True)
+    circuit_breaker: Optional[CircuitBreaker] = attr.ib(None, kw_only=True)
+    concurrency_limiter: Optional[AIMDConcurrencyLimiter] = attr.ib(None, kw_only=True)
+    rate_limiter: Optional[RateLimiter] = attr.ib(None, kw_only=True)
+    endpoint_timeouts: Dict[str, Union[float, httpx.Timeout]] = attr.ib(factory=dict, kw_only=True)
+    _client: Optional[httpx.Client] = attr.ib(None, init=False, repr=False, eq=False)
+    _async_client: Optional[httpx.AsyncClient] = attr.ib(None, init=False, repr=False, eq=False)
+    _async_client_loop: Optional[asyncio.AbstractEventLoop] = attr.ib(None, init=False, repr=False, eq=False)
 
     def get_headers(self) -> Dict[str, str]:
         """Get headers to be used in all endpoints"""
@@ -63,13 +128,121 @@ class Client:
         """Get a new client matching this one with additional cookies"""
         return attr.evolve(self, cookies={**self.cookies, **cookies})
 
-    def get_timeout(self) -> float:
+    def get_timeout(self, endpoint_class: Optional[str] = None) -> Union[float, httpx.Timeout]:
+        """Get the timeout of requests sent by an endpoint class, or the default timeout if endpoint_class is None"""
+        if endpoint_class is not None and endpoint_class in self.endpoint_timeouts:
+            return self.endpoint_timeouts[endpoint_class]
         return self.timeout
 
-    def with_timeout(self, timeout: float) -> "Client":
+    def with_timeout(self, timeout: Union[float, httpx.Timeout]) -> "Client":
         """Get a new client matching this one with a new timeout (in seconds)"""
         return attr.evolve(self, timeout=timeout)
 
+    def _get_httpx_client_kwargs(self) -> Dict[str, Any]:
+        """Get keyword arguments used to create the underlying httpx clients"""
+        return {
+            "cookies": self.get_cookies(),
+            "verify": self.verify_ssl,
+            "timeout": self.get_timeout(),
+            "follow_redirects": self.follow_redirects,
+            "http2": self.http2,
+        }
+
+    def set_httpx_client(self, client: httpx.Client) -> "Client":
+        """Manually set the underlying httpx.Client
+
+        **NOTE**: This will override any other settings on the client, including cookies, headers, and timeout.
+        """
+        self._client = client
+        return self
+
+    def get_httpx_client(self) -> httpx.Client:
+        """Get the underlying httpx.Client, constructing a new one if not previously set or already closed"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(**self._get_httpx_client_kwargs())
+        return self._client
+
+    def open(self) -> "Client":
+        """Open the underlying httpx.Client so that connections can be pooled and reused"""
+        self.get_httpx_client()
+        return self
+
+    def close(self) -> None:
+        """Close the underlying httpx.Client and release all pooled connections"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "Client":
+        """Enter a context manager for the underlying httpx.Client, it cannot be entered twice (see httpx docs)"""
+        self.get_httpx_client().__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        """Exit a context manager for the underlying httpx.Client (see httpx docs)"""
+        if self._client is not None:
+            self._client.__exit__(exc_type, exc_value, traceback)
+            self._client = None
+
+    def set_async_httpx_client(self, async_client: httpx.AsyncClient) -> "Client":
+        """Manually set the underlying httpx.AsyncClient
+
+        **NOTE**: This will override any other settings on the client, including cookies, headers, and timeout.
+        """
+        self._async_client = async_client
+        self._async_client_loop = None
+        return self
+
+    def get_async_httpx_client(self) -> httpx.AsyncClient:
+        """Get the underlying httpx.AsyncClient, constructing a new one if not previously set, already closed or
+        created in another event loop"""
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        # pooled connections belong to the loop they were opened in and can't be used after it was closed
+        other_loop = loop is not None and self._async_client_loop is not None and self._async_client_loop is not loop
+        if self._async_client is None or self._async_client.is_closed or other_loop:
+            self._async_client = httpx.AsyncClient(**self._get_httpx_client_kwargs())
+            self._async_client_loop = None
+        if self._async_client_loop is None:
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aopen(self) -> "Client":
+        """Open the underlying httpx.AsyncClient so that connections can be pooled and reused"""
+        self.get_async_httpx_client()
+        return self
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx.AsyncClient and release all pooled connections"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+
+    async def __aenter__(self) -> "Client":
+        """Enter a context manager for the underlying httpx.AsyncClient, it cannot be entered twice (see httpx docs)"""
+        await self.get_async_httpx_client().__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        """Exit a context manager for the underlying httpx.AsyncClient (see httpx docs)"""
+        if self._async_client is not None:
+            await self._async_client.__aexit__(exc_type, exc_value, traceback)
+            self._async_client = None
+            self._async_client_loop = None
+
 
 @attr.s(auto_attribs=True)
 class AuthenticatedClient(Client):
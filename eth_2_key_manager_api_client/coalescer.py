@@ -0,0 +1,217 @@
+"""
+Provides opt-in coalescing variants of the batch endpoint classes.
+
+Concurrent asynchronous calls made within a short time window (`max_delay`) are merged into a single API request with
+up to `max_batch_size` items. A call with more than `max_batch_size` items is sent in a request of its own. The
+response data items are split back out to each caller in the order the caller submitted them. Synchronous methods are
+not coalesced.
+
+| Class                     | Coalesced endpoint          |
+|---------------------------|-----------------------------|
+| CoalescedDeleteKeys       | DELETE /eth/v1/keystores    |
+| CoalescedDeleteRemoteKeys | DELETE /eth/v1/remotekeys   |
+| CoalescedImportRemoteKeys | POST /eth/v1/remotekeys     |
+
+The `content` and `headers` of the Response returned to each caller are those of the merged request, `parsed` only
+contains the caller's data items.
+"""
+import abc
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import attr
+
+from eth_2_key_manager_api_client.api.local_key_manager import DeleteKeys
+from eth_2_key_manager_api_client.api.remote_key_manager import DeleteRemoteKeys, ImportRemoteKeys
+from eth_2_key_manager_api_client.models.delete_keys_response import DeleteKeysResponse
+from eth_2_key_manager_api_client.models.delete_remote_keys_response import DeleteRemoteKeysResponse
+from eth_2_key_manager_api_client.models.error_response import ErrorResponse
+from eth_2_key_manager_api_client.models.import_remote_keys_response import ImportRemoteKeysResponse
+from eth_2_key_manager_api_client.slashing_protection import SlashingProtectionIndex
+from eth_2_key_manager_api_client.types import Response
+
+
+@attr.s(auto_attribs=True)
+class _BatchCoalescer(abc.ABC):
+    """Queues items submitted by concurrent callers and sends them as merged batches.
+
+    Attributes:
+        max_batch_size: The maximum number of items sent in a single request. A batch is sent as soon as it is full,
+            items which would not fit into the pending batch are queued in the next one.
+        max_delay: The maximum time in seconds the first queued item waits for other items before the batch is sent.
+    """
+
+    max_batch_size: int = attr.ib(100, kw_only=True)
+    max_delay: float = attr.ib(0.005, kw_only=True)
+    _pending: List[Tuple[List[Any], "asyncio.Future[Response]"]] = attr.ib(init=False, factory=list, repr=False, eq=False)
+    _pending_size: int = attr.ib(init=False, default=0, repr=False, eq=False)
+    _flush_handle: Optional[asyncio.TimerHandle] = attr.ib(init=False, default=None, repr=False, eq=False)
+    _tasks: Set["asyncio.Task[None]"] = attr.ib(init=False, factory=set, repr=False, eq=False)
+
+    async def _coalesce(self, items: Sequence[Any]) -> Response:
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Response]" = loop.create_future()
+        if self._pending and self._pending_size + len(items) > self.max_batch_size:
+            self._flush()
+        self._pending.append((list(items), future))
+        self._pending_size += len(items)
+
+        if self._pending_size >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending, self._pending_size = self._pending, [], 0
+        if batch:
+            # keep a reference to the task until it completes, the event loop only keeps weak references
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[List[Any], "asyncio.Future[Response]"]]) -> None:
+        items = [item for caller_items, _ in batch for item in caller_items]
+
+        try:
+            response = await self._send_batch(items)
+            split_parsed = self._split(response.parsed, [caller_items for caller_items, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), parsed in zip(batch, split_parsed):
+            if not future.done():
+                future.set_result(Response(status_code=response.status_code, content=response.content, headers=response.headers, parsed=parsed))
+
+    @abc.abstractmethod
+    async def _send_batch(self, items: List[Any]) -> Response:
+        """Sends the merged items of a batch in a single request and returns the response."""
+
+    def _split(self, parsed: Any, items_per_caller: List[List[Any]]) -> List[Any]:
+        """Splits the parsed response of a merged request into one parsed response per caller."""
+        if not hasattr(parsed, "data"):
+            # ErrorResponse or no content, every caller gets the same result
+            return [parsed for _ in items_per_caller]
+
+        split_parsed = []
+        offset = 0
+        for caller_items in items_per_caller:
+            sliced = attr.evolve(parsed, data=parsed.data[offset : offset + len(caller_items)])
+            sliced.additional_properties = dict(parsed.additional_properties)
+            split_parsed.append(sliced)
+            offset += len(caller_items)
+        return split_parsed
+
+
+@attr.s(auto_attribs=True)
+class CoalescedDeleteKeys(_BatchCoalescer, DeleteKeys):
+    """DeleteKeys variant which merges concurrent asyncio calls into a single DELETE /eth/v1/keystores request.
+
+    Each caller receives a DeleteKeysResponse containing the statuses of its own pubkeys and slashing protection data
+    filtered down to its own pubkeys.
+
+    Typical usage example:
+        ```python
+        import asyncio
+
+        import eth_2_key_manager_api_client
+        from eth_2_key_manager_api_client.coalescer import CoalescedDeleteKeys
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager()
+        delete_keys = CoalescedDeleteKeys(eth_2_key_manager.client, max_batch_size=200, max_delay=0.01)
+
+        responses = await asyncio.gather(*(delete_keys.asyncio_detailed(pubkeys=[pubkey]) for pubkey in pubkeys))
+        ```
+    """
+
+    async def asyncio_detailed(self, pubkeys: List[str]) -> Response[Union[DeleteKeysResponse, ErrorResponse]]:
+        """Delete Keys (asynchronous, coalesced).
+
+        Queues `pubkeys` and sends them together with the pubkeys of other concurrent callers.
+
+        Args:
+            pubkeys: List of public keys to delete.
+
+        Raises:
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Response object containing the response from the server, response headers, status code and DeleteKeysResponse object for the
+            requested pubkeys if the request succeeds, otherwise an ErrorResponse object.
+        """
+        return await self._coalesce(pubkeys)
+
+    async def _send_batch(self, items: List[Any]) -> Response:
+        return await DeleteKeys.asyncio_detailed(self, pubkeys=items)
+
+    def _split(self, parsed: Any, items_per_caller: List[List[Any]]) -> List[Any]:
+        split_parsed = super()._split(parsed, items_per_caller)
+        if isinstance(parsed, DeleteKeysResponse):
+            try:
+                slashing_protection_index = SlashingProtectionIndex.from_str(parsed.slashing_protection)
+            except ValueError:
+                return split_parsed
+            for sliced, pubkeys in zip(split_parsed, items_per_caller):
+                sliced.slashing_protection = slashing_protection_index.subset(pubkeys)
+        return split_parsed
+
+
+@attr.s(auto_attribs=True)
+class CoalescedDeleteRemoteKeys(_BatchCoalescer, DeleteRemoteKeys):
+    """DeleteRemoteKeys variant which merges concurrent asyncio calls into a single DELETE /eth/v1/remotekeys request."""
+
+    async def asyncio_detailed(self, pubkeys: List[str]) -> Response[Union[DeleteRemoteKeysResponse, ErrorResponse]]:
+        """Delete Remote Keys (asynchronous, coalesced).
+
+        Queues `pubkeys` and sends them together with the pubkeys of other concurrent callers.
+
+        Args:
+            pubkeys: List of public keys to delete.
+
+        Raises:
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Response object containing the response from the server, response headers, status code and DeleteRemoteKeysResponse object for
+            the requested pubkeys if the request succeeds, otherwise an ErrorResponse object.
+        """
+        return await self._coalesce(pubkeys)
+
+    async def _send_batch(self, items: List[Any]) -> Response:
+        return await DeleteRemoteKeys.asyncio_detailed(self, pubkeys=items)
+
+
+@attr.s(auto_attribs=True)
+class CoalescedImportRemoteKeys(_BatchCoalescer, ImportRemoteKeys):
+    """ImportRemoteKeys variant which merges concurrent asyncio calls into a single POST /eth/v1/remotekeys request."""
+
+    async def asyncio_detailed(self, remote_keys: List[Dict]) -> Response[Union[ImportRemoteKeysResponse, ErrorResponse]]:
+        """Import Remote Keys (asynchronous, coalesced).
+
+        Queues `remote_keys` and sends them together with the remote keys of other concurrent callers.
+
+        Args:
+            remote_keys: List of remote keys to import. Each item must contain a pubkey and optional remote signer url.
+
+        Raises:
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Response object containing the response from the server, response headers, status code and ImportRemoteKeysResponse object for
+            the requested keys if the request succeeds, otherwise an ErrorResponse object.
+        """
+        return await self._coalesce(remote_keys)
+
+    async def _send_batch(self, items: List[Any]) -> Response:
+        return await ImportRemoteKeys.asyncio_detailed(self, remote_keys=items)
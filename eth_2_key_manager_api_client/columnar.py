@@ -0,0 +1,215 @@
+"""
+Provides a columnar, memory efficient alternative to ListKeysResponse for very large key inventories.
+
+A validator client backed by a remote signer can report 100k+ keys. ListKeysResponse builds one
+ListKeysResponseDataItem per key, each with its own attribute and `additional_properties` dictionaries.
+ListKeysColumns stores the same data in a few flat buffers instead:
+
+* pubkeys are packed into a single `bytes` object, 48 bytes per key
+* `readonly` flags are stored in a signed char `array` (1 = True, 0 = False, -1 = not reported)
+* each distinct `derivation_path` is stored once, keys refer to it by index in an `array` (-1 = not reported)
+
+Pubkey lookups are O(1) through an index built on first use. ListKeysResponseDataItem objects are only created for
+the items which are actually accessed.
+"""
+import sys
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar, Union
+
+import attr
+
+from eth_2_key_manager_api_client.api.local_key_manager import ListKeys
+from eth_2_key_manager_api_client.helpers import _asend_request, _build_response, _get_kwargs, _send_request
+from eth_2_key_manager_api_client.models.error_response import ErrorResponse
+from eth_2_key_manager_api_client.models.list_keys_response_data_item import ListKeysResponseDataItem
+from eth_2_key_manager_api_client.pubkey import PUBKEY_LENGTH, Pubkey
+from eth_2_key_manager_api_client.types import UNSET, Response
+
+T = TypeVar("T", bound="ListKeysColumns")
+
+
+@attr.s(auto_attribs=True, slots=True)
+class ListKeysColumns:
+    """The keys reported by GET /eth/v1/keystores, stored column by column.
+
+    Attributes:
+        pubkeys: The raw pubkeys of all keys, packed back to back, PUBKEY_LENGTH bytes each.
+        readonly: The readonly flag of each key: 1 = True, 0 = False, -1 = not reported.
+        derivation_path_ids: Index of each key's derivation path in `derivation_paths`, -1 = not reported.
+        derivation_paths: The distinct derivation paths, interned.
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager()
+        list_keys_columns = eth_2_key_manager.list_keys_columnar.sync()
+
+        print(len(list_keys_columns))
+        if "0x99c4c42fac7d1393956bd9e2785ed67cf5aaca4bf56d2fcda94c42d6042aebb1723ce6bac6f0216ff8c5d4f9f013008b" in list_keys_columns:
+            print("Key is loaded")
+        ```
+    """
+
+    pubkeys: bytes = b""
+    readonly: "array[int]" = attr.ib(factory=lambda: array("b"))
+    derivation_path_ids: "array[int]" = attr.ib(factory=lambda: array("i"))
+    derivation_paths: List[str] = attr.ib(factory=list)
+    _index: Optional[Dict[bytes, int]] = attr.ib(default=None, init=False, repr=False, eq=False)
+
+    @classmethod
+    def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
+        """Builds the columns from a decoded ListKeys response body.
+
+        Raises:
+            ValueError: If a pubkey is not a hex encoded 48 byte value.
+        """
+        data = src_dict["data"]
+
+        hex_pubkeys = []
+        for data_item in data:
+            hex_pubkey = data_item["validating_pubkey"].strip()
+            if hex_pubkey[:2] in ("0x", "0X"):
+                hex_pubkey = hex_pubkey[2:]
+            if len(hex_pubkey) != 2 * PUBKEY_LENGTH:
+                raise ValueError(f"Invalid pubkey length: {data_item['validating_pubkey']}")
+            hex_pubkeys.append(hex_pubkey)
+        # a single conversion of all pubkeys is considerably faster than one per key
+        pubkeys = bytes.fromhex("".join(hex_pubkeys))
+
+        readonly = array("b", [-1 if (item_readonly := data_item.get("readonly")) is None else int(bool(item_readonly)) for data_item in data])
+
+        derivation_path_id_by_path: Dict[str, int] = {}
+        derivation_path_ids = array(
+            "i",
+            [
+                -1
+                if (derivation_path := data_item.get("derivation_path")) is None
+                else derivation_path_id_by_path.setdefault(derivation_path, len(derivation_path_id_by_path))
+                for data_item in data
+            ],
+        )
+        derivation_paths = [sys.intern(derivation_path) for derivation_path in derivation_path_id_by_path]
+
+        return cls(pubkeys=pubkeys, readonly=readonly, derivation_path_ids=derivation_path_ids, derivation_paths=derivation_paths)
+
+    def __len__(self) -> int:
+        return len(self.pubkeys) // PUBKEY_LENGTH
+
+    def pubkey_bytes(self, i: int) -> bytes:
+        """Returns the raw pubkey of the i-th key."""
+        if not -len(self) <= i < len(self):
+            raise IndexError("ListKeysColumns index out of range")
+        i %= len(self)
+        return self.pubkeys[i * PUBKEY_LENGTH : (i + 1) * PUBKEY_LENGTH]
+
+    def pubkey(self, i: int) -> str:
+        """Returns the pubkey of the i-th key, hex encoded with 0x prefix."""
+        return f"0x{self.pubkey_bytes(i).hex()}"
+
+    def derivation_path(self, i: int) -> Optional[str]:
+        """Returns the derivation path of the i-th key, None if not reported."""
+        derivation_path_id = self.derivation_path_ids[i]
+        return None if derivation_path_id < 0 else self.derivation_paths[derivation_path_id]
+
+    def is_readonly(self, i: int) -> Optional[bool]:
+        """Returns the readonly flag of the i-th key, None if not reported."""
+        return None if self.readonly[i] < 0 else bool(self.readonly[i])
+
+    def index(self, pubkey: Union[str, bytes, Pubkey]) -> int:
+        """Returns the position of a pubkey in O(1).
+
+        Args:
+            pubkey: Pubkey, raw pubkey or hex encoded pubkey, case insensitive, with or without 0x prefix.
+
+        Raises:
+            KeyError: If the pubkey is not listed.
+        """
+        if self._index is None:
+            # built on first lookup, iteration and materialisation never pay for it
+            self._index = {Pubkey.intern(self.pubkeys[i : i + PUBKEY_LENGTH]): i // PUBKEY_LENGTH for i in range(0, len(self.pubkeys), PUBKEY_LENGTH)}
+        try:
+            return self._index[Pubkey(pubkey)]
+        except ValueError:
+            raise KeyError(pubkey) from None
+
+    def __contains__(self, pubkey: Union[str, bytes, Pubkey]) -> bool:
+        try:
+            self.index(pubkey)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, i: int) -> ListKeysResponseDataItem:
+        """Materialises the i-th key as a ListKeysResponseDataItem."""
+        derivation_path = self.derivation_path(i)
+        readonly = self.is_readonly(i)
+        return ListKeysResponseDataItem(
+            validating_pubkey=self.pubkey(i),
+            derivation_path=UNSET if derivation_path is None else derivation_path,
+            readonly=UNSET if readonly is None else readonly,
+        )
+
+    def __iter__(self) -> Iterator[ListKeysResponseDataItem]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def iter_pubkeys(self) -> Iterator[str]:
+        """Yields the hex encoded pubkeys with 0x prefix without materialising data items."""
+        for i in range(0, len(self.pubkeys), PUBKEY_LENGTH):
+            yield f"0x{self.pubkeys[i : i + PUBKEY_LENGTH].hex()}"
+
+
+@attr.s(auto_attribs=True)
+class ListKeysColumnar(ListKeys):
+    """ListKeys variant which parses the response into ListKeysColumns instead of ListKeysResponse.
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager()
+        response = eth_2_key_manager.list_keys_columnar.sync_detailed()
+
+        if response.status_code == 200:
+            print(f"Number of keys: {len(response.parsed)}")
+        ```
+    """
+
+    def sync_detailed(self) -> Response[Union[ListKeysColumns, ErrorResponse]]:  # type: ignore[override]
+        """List Keys (synchronous, columnar).
+
+        List all validating pubkeys known to and decrypted by this keymanager binary
+
+        Raises:
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Response object containing the response from the server, response headers, status code and ListKeysColumns object if the request succeeds, otherwise an ErrorResponse object.
+        """
+
+        kwargs = _get_kwargs(client=self.client, endpoint=self.ENDPOINT, method=self.METHOD)
+
+        response = _send_request(client=self.client, kwargs=kwargs)
+
+        return _build_response(client=self.client, response=response, cls=ListKeysColumns)
+
+    async def asyncio_detailed(self) -> Response[Union[ListKeysColumns, ErrorResponse]]:  # type: ignore[override]
+        """List Keys (asynchronous, columnar).
+
+        List all validating pubkeys known to and decrypted by this keymanager binary
+
+        Raises:
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Response object containing the response from the server, response headers, status code and ListKeysColumns object if the request succeeds, otherwise an ErrorResponse object.
+        """
+
+        kwargs = _get_kwargs(client=self.client, endpoint=self.ENDPOINT, method=self.METHOD)
+
+        response = await _asend_request(client=self.client, kwargs=kwargs)
+
+        return _build_response(client=self.client, response=response, cls=ListKeysColumns)
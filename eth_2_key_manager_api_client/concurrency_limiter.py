@@ -0,0 +1,179 @@
+"""
+Provides the AIMDConcurrencyLimiter class, which finds the number of concurrent requests each validator client handles.
+
+Validator clients handle concurrent key manager requests very differently, so any fixed concurrency is too low for
+some and overloads others. An AIMDConcurrencyLimiter bounds the asynchronous requests in flight per `base_url` and
+adapts the bound with additive increase / multiplicative decrease (AIMD), the scheme TCP congestion control uses:
+
+- Every successful response received while the node was using its whole limit raises the limit by `increase / limit`,
+  i.e. by about `increase` per round of `limit` requests.
+- A timeout, a 429 or 5xx response, a dropped connection, or a response slower than `latency_threshold` multiplies
+  the limit by `decrease_factor`. Requests which were already in flight when the limit was cut do not cut it again.
+
+The limit stays within `min_limit` and `max_limit`. Requests above the limit wait for a slot, first come first served.
+
+By default only errors cut the limit: the latency of ImportKeystores is dominated by the key derivation of each
+keystore, so a fixed latency threshold would treat large imports as overload. Set `latency_threshold` when the
+workload is uniform, e.g. sweeps of list requests.
+
+Only the asynchronous API is limited. The limiter may be shared by many Eth2KeyManager instances, for example all
+nodes of an Eth2KeyManagerFleet (raise its `max_concurrency_per_node` to let the limiter decide):
+
+```python
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.concurrency_limiter import AIMDConcurrencyLimiter
+
+concurrency_limiter = AIMDConcurrencyLimiter(max_limit=32)
+async with eth_2_key_manager_api_client.Eth2KeyManagerFleet(
+    nodes, max_concurrency_per_node=32, concurrency_limiter=concurrency_limiter
+) as fleet:
+    results = await fleet.gather("list_keys")
+    print(concurrency_limiter.limits)  # {"https://192.168.121.35:7500": 11.4, ...}
+```
+"""
+import asyncio
+import collections
+import time
+from typing import Awaitable, Callable, Deque, Dict, Optional, Union
+
+import attr
+import httpx
+
+# errors showing the node is overloaded, other errors (e.g. connection refused) say nothing about its capacity
+_OVERLOAD_EXCEPTIONS = (httpx.TimeoutException, httpx.RemoteProtocolError)
+
+
+@attr.s(auto_attribs=True)
+class _NodeLimit:
+    limit: float
+    in_flight: int = 0
+    last_decrease: float = 0.0
+    waiters: "Deque[asyncio.Future[None]]" = attr.ib(factory=collections.deque)
+
+
+@attr.s(auto_attribs=True)
+class AIMDConcurrencyLimiter:
+    """Limits the asynchronous requests in flight per base_url, adapting the limits with AIMD.
+
+    Attributes:
+        initial_limit: The limit of a node before any response was received.
+        min_limit: The lowest limit.
+        max_limit: The highest limit.
+        increase: The number the limit grows by per round of `limit` successful requests.
+        decrease_factor: The factor the limit is multiplied by when the node is overloaded.
+        latency_threshold: Responses slower than this number of seconds count as overload. None to only count errors.
+    """
+
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 64
+    increase: float = 1.0
+    decrease_factor: float = 0.5
+    latency_threshold: Optional[float] = None
+    _nodes: Dict[str, _NodeLimit] = attr.ib(init=False, factory=dict, repr=False, eq=False)
+
+    @property
+    def limits(self) -> Dict[str, float]:
+        """The current limit of every base_url the limiter has seen a request for."""
+        return {base_url: node.limit for base_url, node in self._nodes.items()}
+
+    def get_limit(self, base_url: str) -> float:
+        """Returns the current limit of a base_url.
+
+        Args:
+            base_url: The base URL of the validator client.
+        """
+        node = self._nodes.get(base_url)
+        return node.limit if node is not None else float(self.initial_limit)
+
+    def get_in_flight(self, base_url: str) -> int:
+        """Returns the number of requests in flight to a base_url.
+
+        Args:
+            base_url: The base URL of the validator client.
+        """
+        node = self._nodes.get(base_url)
+        return node.in_flight if node is not None else 0
+
+    def _node(self, base_url: str) -> _NodeLimit:
+        node = self._nodes.get(base_url)
+        if node is None:
+            node = self._nodes[base_url] = _NodeLimit(limit=float(self.initial_limit))
+        return node
+
+    @staticmethod
+    def _capacity(node: _NodeLimit) -> int:
+        return max(1, int(node.limit))
+
+    async def _acquire(self, node: _NodeLimit) -> None:
+        if node.in_flight < self._capacity(node) and not node.waiters:
+            node.in_flight += 1
+            return
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        node.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over just before the cancellation, pass it on
+                node.in_flight -= 1
+                self._wake(node)
+            else:
+                try:
+                    node.waiters.remove(waiter)
+                except ValueError:  # pragma: no cover
+                    pass
+            raise
+
+    def _wake(self, node: _NodeLimit) -> None:
+        while node.waiters and node.in_flight < self._capacity(node):
+            waiter = node.waiters.popleft()
+            if not waiter.done():
+                node.in_flight += 1
+                waiter.set_result(None)
+
+    def _is_overload(self, outcome: Union[httpx.Response, BaseException], latency: float) -> Optional[bool]:
+        """Whether the outcome shows the node is overloaded. None if it says nothing about the node's capacity."""
+        if isinstance(outcome, httpx.Response):
+            if outcome.status_code == httpx.codes.TOO_MANY_REQUESTS or outcome.status_code >= 500:
+                return True
+            return self.latency_threshold is not None and latency > self.latency_threshold
+        if isinstance(outcome, _OVERLOAD_EXCEPTIONS):
+            return True
+        return None
+
+    def _update(self, node: _NodeLimit, overload: Optional[bool], started: float, saturated: bool) -> None:
+        if overload:
+            # one cut per episode: requests sent before the last cut were sent at the old limit
+            if started >= node.last_decrease:
+                node.limit = max(float(self.min_limit), node.limit * self.decrease_factor)
+                node.last_decrease = time.monotonic()
+        elif overload is not None and saturated:
+            node.limit = min(float(self.max_limit), node.limit + self.increase / node.limit)
+
+    async def asend(self, base_url: str, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Sends a request once the node has a free slot, and adapts the node's limit to the outcome.
+
+        Args:
+            base_url: The base URL of the validator client.
+            send: Sends the request and returns the HTTP response.
+
+        Returns:
+            The HTTP response from the API call.
+        """
+        node = self._node(base_url)
+        await self._acquire(node)
+        saturated = node.in_flight >= self._capacity(node)
+        started = time.monotonic()
+        outcome: Union[httpx.Response, BaseException, None] = None
+        try:
+            outcome = await send()
+            return outcome
+        except BaseException as e:
+            outcome = e
+            raise
+        finally:
+            node.in_flight -= 1
+            if outcome is not None:
+                self._update(node, self._is_overload(outcome, time.monotonic() - started), started, saturated)
+            self._wake(node)
@@ -0,0 +1,55 @@
+"""
+Maps HTTP requests to the endpoint classes sending them, so that settings can be configured per endpoint class.
+
+| Endpoint class      | Request                                          |
+|---------------------|--------------------------------------------------|
+| ListKeys            | GET /eth/v1/keystores                            |
+| ImportKeystores     | POST /eth/v1/keystores                           |
+| DeleteKeys          | DELETE /eth/v1/keystores                         |
+| ListRemoteKeys      | GET /eth/v1/remotekeys                           |
+| ImportRemoteKeys    | POST /eth/v1/remotekeys                          |
+| DeleteRemoteKeys    | DELETE /eth/v1/remotekeys                        |
+| ListFeeRecipient    | GET /eth/v1/validator/{pubkey}/feerecipient      |
+| SetFeeRecipient     | POST /eth/v1/validator/{pubkey}/feerecipient     |
+| DeleteFeeRecipient  | DELETE /eth/v1/validator/{pubkey}/feerecipient   |
+| GetGasLimit         | GET /eth/v1/validator/{pubkey}/gas_limit         |
+| SetGasLimit         | POST /eth/v1/validator/{pubkey}/gas_limit        |
+| DeleteGasLimit      | DELETE /eth/v1/validator/{pubkey}/gas_limit      |
+
+Classes built on these endpoints share their settings, e.g. bulk_import_keystores and import_keystores_streaming send
+ImportKeystores requests.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+ENDPOINT_CLASSES: Dict[Tuple[str, str], str] = {
+    ("GET", "keystores"): "ListKeys",
+    ("POST", "keystores"): "ImportKeystores",
+    ("DELETE", "keystores"): "DeleteKeys",
+    ("GET", "remotekeys"): "ListRemoteKeys",
+    ("POST", "remotekeys"): "ImportRemoteKeys",
+    ("DELETE", "remotekeys"): "DeleteRemoteKeys",
+    ("GET", "validator/{pubkey}/feerecipient"): "ListFeeRecipient",
+    ("POST", "validator/{pubkey}/feerecipient"): "SetFeeRecipient",
+    ("DELETE", "validator/{pubkey}/feerecipient"): "DeleteFeeRecipient",
+    ("GET", "validator/{pubkey}/gas_limit"): "GetGasLimit",
+    ("POST", "validator/{pubkey}/gas_limit"): "SetGasLimit",
+    ("DELETE", "validator/{pubkey}/gas_limit"): "DeleteGasLimit",
+}
+
+
+def get_endpoint_class(kwargs: Dict[str, Any]) -> Optional[str]:
+    """Returns the name of the endpoint class sending a request.
+
+    Args:
+        kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+
+    Returns:
+        The name of the endpoint class, e.g. "ImportKeystores", or None if the request is not a Key Manager API request.
+    """
+    _, _, endpoint = httpx.URL(kwargs["url"]).path.partition("/eth/v1/")
+    parts = endpoint.split("/")
+    if len(parts) == 3 and parts[0] == "validator":
+        endpoint = f"validator/{{pubkey}}/{parts[2]}"
+    return ENDPOINT_CLASSES.get((kwargs["method"], endpoint))
@@ -30,4 +30,44 @@ class ConfigurationMissing(Exception):
         )
 
 
-__all__ = ["UnexpectedStatus", "ModelClassUnspecified", "ConfigurationMissing"]
+class InterchangeMismatch(Exception):
+    """Raised by InterchangeMerger when slashing protection documents of different chains or formats are merged."""
+
+    def __init__(self, field: str, expected: str, actual: str):
+        self.field = field
+        self.expected = expected
+        self.actual = actual
+
+        super().__init__(f"Slashing protection interchange {field} mismatch: expected {expected}, got {actual}")
+
+
+class KeyStateUnavailable(Exception):
+    """Raised by Reconciler when the keys currently loaded by the validator client cannot be listed."""
+
+    def __init__(self, endpoint: str, status_code: int):
+        self.endpoint = endpoint
+        self.status_code = status_code
+
+        super().__init__(f"Unable to list the current keys, {endpoint} returned status code: {status_code}")
+
+
+class CircuitOpen(Exception):
+    """Raised by CircuitBreaker when a request is rejected because the circuit of its validator client is open."""
+
+    def __init__(self, base_url: str, retry_after: float):
+        self.base_url = base_url
+        self.retry_after = retry_after
+
+        super().__init__(f"Circuit open for {base_url}, requests are rejected for the next {retry_after:.1f} seconds")
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a request can't be sent before the deadline set with timeouts.deadline."""
+
+    def __init__(self, overdue: float):
+        self.overdue = overdue
+
+        super().__init__(f"Deadline exceeded by {overdue:.3f} seconds")
+
+
+__all__ = ["UnexpectedStatus", "ModelClassUnspecified", "ConfigurationMissing", "InterchangeMismatch", "KeyStateUnavailable", "CircuitOpen", "DeadlineExceeded"]
@@ -1,16 +1,37 @@
 """This module contains the Eth2KeyManager class, which is the main class of the eth-2-key-manager-api-client package."""
 import os
 import ssl
-from typing import Dict, Union
+from types import TracebackType
+from typing import Dict, Optional, Type, Union
 
 import attr
+import httpx
 
 from eth_2_key_manager_api_client.api.fee_recipient import DeleteFeeRecipient, ListFeeRecipient, SetFeeRecipient
 from eth_2_key_manager_api_client.api.gas_limit import DeleteGasLimit, GetGasLimit, SetGasLimit
 from eth_2_key_manager_api_client.api.local_key_manager import DeleteKeys, ImportKeystores, ListKeys
 from eth_2_key_manager_api_client.api.remote_key_manager import DeleteRemoteKeys, ImportRemoteKeys, ListRemoteKeys
+from eth_2_key_manager_api_client.bulk_import import BulkImportKeystores
+from eth_2_key_manager_api_client.circuit_breaker import CircuitBreaker
 from eth_2_key_manager_api_client.client import AuthenticatedClient
+from eth_2_key_manager_api_client.coalescer import (
+    CoalescedDeleteKeys,
+    CoalescedDeleteRemoteKeys,
+    CoalescedImportRemoteKeys,
+)
+from eth_2_key_manager_api_client.columnar import ListKeysColumnar
+from eth_2_key_manager_api_client.concurrency_limiter import AIMDConcurrencyLimiter
+from eth_2_key_manager_api_client.endpoints import ENDPOINT_CLASSES
 from eth_2_key_manager_api_client.errors import ConfigurationMissing
+from eth_2_key_manager_api_client.json_codec import JSONCodec, get_json_codec
+from eth_2_key_manager_api_client.keystore_encoding import KeystoreEncodingCache
+from eth_2_key_manager_api_client.list_cache import ListCache
+from eth_2_key_manager_api_client.rate_limit import RateLimiter
+from eth_2_key_manager_api_client.reconcile import Reconciler
+from eth_2_key_manager_api_client.retry import RetryPolicy
+from eth_2_key_manager_api_client.single_flight import SingleFlight
+from eth_2_key_manager_api_client.streaming import StreamingImportKeystores, StreamingImportRemoteKeys
+from eth_2_key_manager_api_client.timeouts import default_endpoint_timeouts
 
 
 @attr.s(auto_attribs=True, init=False)
@@ -20,7 +41,10 @@ class Eth2KeyManager:
     It provides a centralized way to manage keys for the Ethereum validators. It handles the following operations:
 
     * Importing keystores
+    * Importing large numbers of keystores in adaptively sized chunks
+    * Importing keystore files and remote keys with streamed request bodies
     * Listing keys
+    * Listing very large numbers of keys into compact columnar storage
     * Deleting keys
     * Setting fee recipients
     * Listing fee recipients
@@ -31,19 +55,62 @@ class Eth2KeyManager:
     * Deleting remote keys
     * Importing remote keys
     * Listing remote keys
+    * Reconciling the loaded keys with a desired key set
 
     Args:
         base_url: The base URL of the Eth2 Key Manager API.
         token: The API token to authenticate with the Eth2 Key Manager API.
         cookies: Optional cookies to send with requests.
         headers: Optional headers to send with requests.
-        timeout: The timeout for requests.
+        timeout: The timeout for requests in seconds, or an `httpx.Timeout` with separate connect, read, write and pool
+            timeouts.
         verify_ssl: Whether to verify SSL certificates.
         raise_on_unexpected_status: Whether to raise an exception if a request returns an unexpected status code.
         follow_redirects: Whether to follow redirects.
+        http2: Whether to multiplex requests over HTTP/2 when the validator client supports it. Falls back to
+            HTTP/1.1 otherwise. Requires the optional `h2` package, installed with the `http2` extra
+            (`pip install eth-2-key-manager-api-client[http2]`).
+        coalesce: Whether to merge concurrent asyncio calls of delete_keys, delete_remote_keys and import_remote_keys
+            into batched requests. See the coalescer module.
+        json_codec: The JSON codec used to encode request bodies and decode response bodies. Defaults to orjson or
+            msgspec when installed, otherwise the standard library json module. See the json_codec module.
+        parse_response: Whether to parse response bodies. If False, `Response.parsed` is always None and bodies are
+            never decoded. Suits health checks and loops which only check `Response.status_code`. bulk_import_keystores
+            and reconcile still parse the bodies they need.
+        list_cache_ttl: If set, list_keys / list_remote_keys responses are cached for this many seconds and the cache
+            is invalidated whenever keys are imported or deleted through this instance. See the list_cache module.
+        single_flight: Whether concurrent identical asyncio reads (e.g. list_keys, list_fee_recipient for the same
+            pubkey) share one HTTP request and receive the same Response. See the single_flight module.
+        keystore_encoding_cache: If set, keystores are encoded for import_keystores, bulk_import_keystores and
+            reconcile once and reused by retries, chunks and other instances sharing the cache. The cache keeps the
+            keystores in memory until they are evicted or the cache is cleared. See the keystore_encoding module.
+        retry_policy: If set, requests failing with connection errors, timeouts or 5xx responses are repeated with
+            backoff as far as it is safe for the endpoint. See the retry module.
+        circuit_breaker: If set, requests fail fast with errors.CircuitOpen while the node is failing. The same
+            CircuitBreaker can be passed to many instances, it keeps one circuit per base_url. See the circuit_breaker
+            module.
+        concurrency_limiter: If set, the asyncio requests in flight are limited per base_url, and the limit adapts to
+            how well the node copes with them. See the concurrency_limiter module.
+        rate_limiter: If set, requests are paced with token buckets for the whole node and per endpoint class, e.g.
+            strict for ImportKeystores and loose for ListFeeRecipient. See the rate_limit module.
+        endpoint_timeouts: Timeouts replacing `timeout` for single endpoint classes, e.g. {"ImportKeystores": 600.0}.
+            Defaults to timeouts.default_endpoint_timeouts, which gives ImportKeystores read and write timeouts of at
+            least 300 seconds. Pass an empty dict to use `timeout` for all requests. See the timeouts module.
 
     Raises:
         ConfigurationMissing: If the base_url or token is not provided.
+        ValueError: If endpoint_timeouts contains an unknown endpoint class name.
+
+    All endpoint classes share the pooled HTTP connections of a single AuthenticatedClient. Close the connections
+    with `close()` / `aclose()` when done, or use the instance as a context manager:
+
+    ```python
+    with eth_2_key_manager_api_client.Eth2KeyManager() as eth_2_key_manager:
+        eth_2_key_manager.list_keys.sync_detailed()
+
+    async with eth_2_key_manager_api_client.Eth2KeyManager() as eth_2_key_manager:
+        await eth_2_key_manager.list_keys.asyncio_detailed()
+    ```
     """
 
     def __init__(
@@ -52,10 +119,22 @@ class Eth2KeyManager:
         token: Union[str, None] = None,
         cookies: Dict[str, str] = {},
         headers: Dict[str, str] = {},
-        timeout: float = 10.0,
+        timeout: Union[float, httpx.Timeout] = 10.0,
         verify_ssl: Union[str, bool, ssl.SSLContext] = False,
         raise_on_unexpected_status: bool = False,
         follow_redirects: bool = False,
+        http2: bool = False,
+        coalesce: bool = False,
+        json_codec: Optional[JSONCodec] = None,
+        parse_response: bool = True,
+        list_cache_ttl: Optional[float] = None,
+        single_flight: bool = False,
+        keystore_encoding_cache: Optional[KeystoreEncodingCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        concurrency_limiter: Optional[AIMDConcurrencyLimiter] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        endpoint_timeouts: Optional[Dict[str, Union[float, httpx.Timeout]]] = None,
     ):
         if base_url is None:
             base_url = os.getenv("ETH_2_KEY_MANAGER_API_BASE_URL")
@@ -63,6 +142,11 @@ class Eth2KeyManager:
             token = os.getenv("ETH_2_KEY_MANAGER_API_TOKEN")
         if base_url is None or token is None:
             raise ConfigurationMissing
+        if endpoint_timeouts is None:
+            endpoint_timeouts = default_endpoint_timeouts(timeout)
+        unknown_endpoints = set(endpoint_timeouts) - set(ENDPOINT_CLASSES.values())
+        if unknown_endpoints:
+            raise ValueError(f"Unknown endpoint classes: {', '.join(sorted(unknown_endpoints))}")
 
         self.client = AuthenticatedClient(
             base_url=base_url,
@@ -73,16 +157,74 @@ class Eth2KeyManager:
             verify_ssl=verify_ssl,
             raise_on_unexpected_status=raise_on_unexpected_status,
             follow_redirects=follow_redirects,
+            http2=http2,
+            json_codec=json_codec if json_codec is not None else get_json_codec(),
+            parse_response=parse_response,
+            list_cache=ListCache(ttl=list_cache_ttl) if list_cache_ttl is not None else None,
+            single_flight=SingleFlight() if single_flight else None,
+            keystore_encoding_cache=keystore_encoding_cache,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            concurrency_limiter=concurrency_limiter,
+            rate_limiter=rate_limiter,
+            endpoint_timeouts=endpoint_timeouts,
         )
         self.import_keystores = ImportKeystores(self.client)
+        self.bulk_import_keystores = BulkImportKeystores(self.client)
+        self.import_keystores_streaming = StreamingImportKeystores(self.client)
         self.list_keys = ListKeys(self.client)
-        self.delete_keys = DeleteKeys(self.client)
+        self.list_keys_columnar = ListKeysColumnar(self.client)
+        self.delete_keys = CoalescedDeleteKeys(self.client) if coalesce else DeleteKeys(self.client)
         self.set_fee_recipient = SetFeeRecipient(self.client)
         self.list_fee_recipient = ListFeeRecipient(self.client)
         self.delete_fee_recipient = DeleteFeeRecipient(self.client)
         self.set_gas_limit = SetGasLimit(self.client)
         self.get_gas_limit = GetGasLimit(self.client)
         self.delete_gas_limit = DeleteGasLimit(self.client)
-        self.delete_remote_keys = DeleteRemoteKeys(self.client)
-        self.import_remote_keys = ImportRemoteKeys(self.client)
+        self.delete_remote_keys = CoalescedDeleteRemoteKeys(self.client) if coalesce else DeleteRemoteKeys(self.client)
+        self.import_remote_keys = CoalescedImportRemoteKeys(self.client) if coalesce else ImportRemoteKeys(self.client)
+        self.import_remote_keys_streaming = StreamingImportRemoteKeys(self.client)
         self.list_remote_keys = ListRemoteKeys(self.client)
+        self.reconcile = Reconciler(self.client)
+
+    def open(self) -> "Eth2KeyManager":
+        """Open the pooled synchronous HTTP connections shared by all endpoint classes."""
+        self.client.open()
+        return self
+
+    def close(self) -> None:
+        """Close the pooled synchronous HTTP connections shared by all endpoint classes."""
+        self.client.close()
+
+    async def aopen(self) -> "Eth2KeyManager":
+        """Open the pooled asynchronous HTTP connections shared by all endpoint classes."""
+        await self.client.aopen()
+        return self
+
+    async def aclose(self) -> None:
+        """Close the pooled asynchronous HTTP connections shared by all endpoint classes."""
+        await self.client.aclose()
+
+    def __enter__(self) -> "Eth2KeyManager":
+        self.client.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        self.client.__exit__(exc_type, exc_value, traceback)
+
+    async def __aenter__(self) -> "Eth2KeyManager":
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        await self.client.__aexit__(exc_type, exc_value, traceback)
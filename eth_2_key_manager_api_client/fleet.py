@@ -0,0 +1,186 @@
+"""This module contains the Eth2KeyManagerFleet class, which runs key manager operations across many validator clients."""
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import attr
+
+from eth_2_key_manager_api_client.eth_2_keymanager import Eth2KeyManager
+
+Operation = Union[str, Callable[..., Awaitable[Any]]]
+
+
+@attr.s(auto_attribs=True)
+class FleetResult:
+    """The outcome of a single operation executed against a single validator client.
+
+    Attributes:
+        node: The name of the validator client the operation was executed against.
+        result: The value returned by the operation, typically a Response object. None if the operation raised.
+        exception: The exception raised by the operation, None if the operation succeeded.
+    """
+
+    node: str
+    result: Any = None
+    exception: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the operation completed without raising an exception."""
+        return self.exception is None
+
+
+@attr.s(auto_attribs=True, init=False)
+class Eth2KeyManagerFleet:
+    """Eth2KeyManagerFleet runs key manager operations concurrently across many validator clients.
+
+    Each node gets its own Eth2KeyManager instance, and therefore its own pooled connections. The number of
+    operations in flight is bounded both globally and per node, so a sweep over hundreds of validator clients neither
+    opens an unbounded number of sockets nor waits behind the slowest node. Results are yielded as they complete.
+
+    Args:
+        nodes: Iterable of (name, base_url, token) tuples, one per validator client. Names must be unique.
+        max_concurrency: The maximum number of operations in flight across all nodes.
+        max_concurrency_per_node: The maximum number of operations in flight against a single node.
+        **kwargs: Additional keyword arguments passed to every Eth2KeyManager instance (e.g. timeout, verify_ssl, http2).
+            A `circuit_breaker` passed here keeps one circuit per node, so operations against a node which is down
+            fail fast with errors.CircuitOpen instead of stalling the sweep. A `concurrency_limiter` adapts the
+            concurrency of each node within `max_concurrency_per_node`, and a `rate_limiter` paces the requests
+            to each node.
+
+    Raises:
+        ValueError: If a concurrency limit is lower than 1 or a node name is used more than once.
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+
+        nodes = [
+            ("TEKU", "https://192.168.121.35:7500", "410ef40da53b447f76ec52fa43092032"),
+            ("NIMBUS", "http://192.168.121.42:7500", "06ab97c6170c1ae09bf3eb69a300d2795fb6"),
+        ]
+
+        async with eth_2_key_manager_api_client.Eth2KeyManagerFleet(nodes, max_concurrency=32) as fleet:
+            async for fleet_result in fleet.run("list_keys"):
+                if fleet_result.ok:
+                    print(f"{fleet_result.node} - {fleet_result.result.status_code}")
+                else:
+                    print(f"{fleet_result.node} - failed: {fleet_result.exception!r}")
+        ```
+    """
+
+    managers: Dict[str, Eth2KeyManager]
+    max_concurrency: int
+    max_concurrency_per_node: int
+
+    def __init__(
+        self,
+        nodes: Iterable[Tuple[str, str, str]],
+        max_concurrency: int = 64,
+        max_concurrency_per_node: int = 4,
+        **kwargs: Any,
+    ):
+        if max_concurrency < 1 or max_concurrency_per_node < 1:
+            raise ValueError("max_concurrency and max_concurrency_per_node must be greater than 0")
+
+        nodes = list(nodes)
+        names = [name for name, _, _ in nodes]
+        duplicate_names = sorted({name for name in names if names.count(name) > 1})
+        if duplicate_names:
+            raise ValueError(f"Duplicate node names: {', '.join(duplicate_names)}")
+
+        self.managers = {name: Eth2KeyManager(base_url=base_url, token=token, **kwargs) for name, base_url, token in nodes}
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_node = max_concurrency_per_node
+
+    async def run(self, operation: Operation, *args: Any, nodes: Optional[Iterable[str]] = None, **kwargs: Any) -> AsyncIterator[FleetResult]:
+        """Run an operation once against every node and yield the per-node results as they complete.
+
+        Args:
+            operation: Either the name of an endpoint attribute of Eth2KeyManager (e.g. "list_keys"), whose
+                `asyncio_detailed` method is called, or a coroutine function taking the node's Eth2KeyManager as first argument.
+            *args: Positional arguments passed to the operation.
+            nodes: Names of the nodes to run the operation against. Defaults to all nodes.
+            **kwargs: Keyword arguments passed to the operation.
+
+        Yields:
+            FleetResult for each node, in order of completion.
+        """
+        node_names = list(self.managers) if nodes is None else list(nodes)
+
+        async for fleet_result in self.run_many((node, operation, args, kwargs) for node in node_names):
+            yield fleet_result
+
+    async def run_many(self, calls: Iterable[Tuple[str, Operation, Sequence[Any], Dict[str, Any]]]) -> AsyncIterator[FleetResult]:
+        """Run many operations against the nodes and yield the results as they complete.
+
+        Calls targeting the same node are started in the order given, with at most `max_concurrency_per_node` in flight.
+        Results are yielded as the calls complete, not in the order given; each FleetResult only names its node.
+
+        Args:
+            calls: Iterable of (node, operation, args, kwargs) tuples. See `run` for the meaning of operation.
+
+        Yields:
+            FleetResult for each call, in order of completion.
+        """
+        calls_per_node: Dict[str, List[Tuple[Operation, Sequence[Any], Dict[str, Any]]]] = {}
+        for node, operation, args, kwargs in calls:
+            if node not in self.managers:
+                raise KeyError(f"Unknown node: {node}")
+            calls_per_node.setdefault(node, []).append((operation, args, kwargs))
+
+        global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        results: "asyncio.Queue[FleetResult]" = asyncio.Queue()
+
+        async def worker(node: str, node_calls: Iterable[Tuple[Operation, Sequence[Any], Dict[str, Any]]]) -> None:
+            for operation, args, kwargs in node_calls:
+                async with global_semaphore:
+                    try:
+                        result = await self._call(node, operation, args, kwargs)
+                    except Exception as e:
+                        await results.put(FleetResult(node=node, exception=e))
+                    else:
+                        await results.put(FleetResult(node=node, result=result))
+
+        workers = []
+        for node, node_calls in calls_per_node.items():
+            node_calls_iterator = iter(node_calls)
+            for _ in range(min(self.max_concurrency_per_node, len(node_calls))):
+                workers.append(asyncio.ensure_future(worker(node, node_calls_iterator)))
+
+        try:
+            for _ in range(sum(len(node_calls) for node_calls in calls_per_node.values())):
+                yield await results.get()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def gather(self, operation: Operation, *args: Any, nodes: Optional[Iterable[str]] = None, **kwargs: Any) -> Dict[str, FleetResult]:
+        """Run an operation once against every node and return all results keyed by node name.
+
+        Args:
+            operation: See `run`.
+            *args: Positional arguments passed to the operation.
+            nodes: Names of the nodes to run the operation against. Defaults to all nodes.
+            **kwargs: Keyword arguments passed to the operation.
+
+        Returns:
+            Dictionary mapping node name to FleetResult.
+        """
+        return {fleet_result.node: fleet_result async for fleet_result in self.run(operation, *args, nodes=nodes, **kwargs)}
+
+    async def _call(self, node: str, operation: Operation, args: Sequence[Any], kwargs: Dict[str, Any]) -> Any:
+        manager = self.managers[node]
+        if isinstance(operation, str):
+            return await getattr(manager, operation).asyncio_detailed(*args, **kwargs)
+        return await operation(manager, *args, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the pooled asynchronous HTTP connections of all nodes."""
+        await asyncio.gather(*(manager.aclose() for manager in self.managers.values()))
+
+    async def __aenter__(self) -> "Eth2KeyManagerFleet":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
@@ -2,12 +2,14 @@
 
 
 from http import HTTPStatus
-from typing import Any, Dict, Optional, Union, cast
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Union, cast
 
 import httpx
 
 from eth_2_key_manager_api_client import errors
 from eth_2_key_manager_api_client.client import AuthenticatedClient
+from eth_2_key_manager_api_client.endpoints import get_endpoint_class
+from eth_2_key_manager_api_client.json_codec import get_json_codec
 from eth_2_key_manager_api_client.models.delete_keys_json_body import DeleteKeysJsonBody
 from eth_2_key_manager_api_client.models.delete_keys_response import DeleteKeysResponse
 from eth_2_key_manager_api_client.models.delete_remote_keys_json_body import DeleteRemoteKeysJsonBody
@@ -23,8 +25,18 @@ from eth_2_key_manager_api_client.models.list_keys_response import ListKeysRespo
 from eth_2_key_manager_api_client.models.list_remote_keys_response import ListRemoteKeysResponse
 from eth_2_key_manager_api_client.models.set_fee_recipient_request import SetFeeRecipientRequest
 from eth_2_key_manager_api_client.models.set_gas_limit_request import SetGasLimitRequest
+from eth_2_key_manager_api_client.single_flight import SHARED_RESPONSES_EXTENSION
+from eth_2_key_manager_api_client.timeouts import apply_deadline, check_deadline, wait_for_deadline
 from eth_2_key_manager_api_client.types import Response
 
+_ERROR_STATUS_CODES = (
+    HTTPStatus.BAD_REQUEST,
+    HTTPStatus.UNAUTHORIZED,
+    HTTPStatus.NOT_FOUND,
+    HTTPStatus.FORBIDDEN,
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+)
+
 
 def _build_response(
     *,
@@ -39,38 +51,99 @@ def _build_response(
         response: The HTTP response from the API call.
         cls: The response type class. If None, the response type will be Any.
 
+    Raises:
+        errors.ModelClassUnspecified: If the response is successful but the response type class is not specified.
+        errors.UnexpectedStatus: If the response status is undocumented and Client.raise_on_unexpected_status is True.
+
     Returns:
-        The response class instance.
+        The response class instance. Its `parsed` attribute is built on first access, or always None if
+        Client.parse_response is False.
     """
 
-    parsed_response = _parse_response(client=client, response=response, cls=cls)
+    _check_response_status(client=client, response=response, cls=cls)
+
+    # responses shared by concurrent identical requests (see the single_flight module) are built and parsed once
+    shared_responses = response.extensions.get(SHARED_RESPONSES_EXTENSION)
+    if shared_responses is not None and cls in shared_responses:
+        return shared_responses[cls]
 
-    return Response(
+    built_response = Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
         headers=response.headers,
-        parsed=parsed_response,
+        parsed=None,
+        parser=(lambda: _parse_response(client=client, response=response, cls=cls)) if client.parse_response else None,
     )
+    if shared_responses is not None:
+        shared_responses[cls] = built_response
+    return built_response
+
+
+def _get_parsed(*, client: AuthenticatedClient, response: Response, cls: Optional[Any] = None) -> Any:
+    """Returns the parsed body of a built response, also if Client.parse_response is False.
+
+    For helpers which need the body to work at all, e.g. the statuses of imported keystores.
+
+    Args:
+        client: The instance of the API client used to make the request.
+        response: The response built by _build_response.
+        cls: The response type class.
+
+    Returns:
+        The parsed response body, see _parse_response.
+    """
+    if client.parse_response:
+        return response.parsed
+    return _parse_response(
+        client=client,
+        response=httpx.Response(response.status_code, content=response.content, headers=response.headers),
+        cls=cls,
+    )
+
+
+def _check_response_status(
+    *,
+    client: AuthenticatedClient,
+    response: httpx.Response,
+    cls: Optional[Any] = None,
+) -> None:
+    """Raises the errors _parse_response would raise, without decoding the response body.
+
+    Args:
+        client: The instance of the API client used to make the request.
+        response: The HTTP response from the API call.
+        cls: The response type class.
 
+    Raises:
+        errors.ModelClassUnspecified: If the response is successful but the response type class is not specified.
+        errors.UnexpectedStatus: If the response status is undocumented and Client.raise_on_unexpected_status is True.
+    """
 
-def _parse_error_response(response: httpx.Response) -> Optional[ErrorResponse]:
+    if response.status_code == HTTPStatus.OK and cls is None:
+        raise errors.ModelClassUnspecified(response.status_code, response.content)
+
+    if (
+        client.raise_on_unexpected_status
+        and response.status_code not in (HTTPStatus.OK, HTTPStatus.ACCEPTED, HTTPStatus.NO_CONTENT)
+        and response.status_code not in _ERROR_STATUS_CODES
+    ):
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+
+
+def _parse_error_response(response: httpx.Response, client: Optional[AuthenticatedClient] = None) -> Optional[ErrorResponse]:
     """Checks if the response is one of the expected error types and returns the error response.
 
     Args:
         response: The HTTP response from the API call.
+        client: The instance of the client used to make the request. Its JSON codec decodes the response body.
 
     Returns:
         The error response if the response is one of the expected error types, otherwise None.
     """
 
-    if response.status_code in [
-        HTTPStatus.BAD_REQUEST,
-        HTTPStatus.UNAUTHORIZED,
-        HTTPStatus.NOT_FOUND,
-        HTTPStatus.FORBIDDEN,
-        HTTPStatus.INTERNAL_SERVER_ERROR,
-    ]:
-        response_error = ErrorResponse.from_dict(response.json())
+    if response.status_code in _ERROR_STATUS_CODES:
+        json_codec = client.json_codec if client is not None else get_json_codec()
+        response_error = ErrorResponse.from_dict(json_codec.loads(response.content))
 
         return response_error
     return None
@@ -113,7 +186,7 @@ def _parse_response(
         raise errors.ModelClassUnspecified(response.status_code, response.content)
 
     if response.status_code == HTTPStatus.OK and cls is not None:
-        response_200 = cls.from_dict(response.json())
+        response_200 = cls.from_dict(client.json_codec.loads(response.content))
         return response_200
 
     if response.status_code == HTTPStatus.ACCEPTED:
@@ -124,8 +197,9 @@ def _parse_response(
         response_204 = cast(Any, None)
         return response_204
 
-    if _parse_error_response(response) is not None:
-        return _parse_error_response(response)
+    response_error = _parse_error_response(response, client)
+    if response_error is not None:
+        return response_error
 
     if client.raise_on_unexpected_status:
         raise errors.UnexpectedStatus(response.status_code, response.content)
@@ -147,6 +221,7 @@ def _get_kwargs(
         SetFeeRecipientRequest,
         None,
     ] = None,
+    content: Union[bytes, Iterator[bytes], AsyncIterator[bytes], None] = None,
 ) -> Dict[str, Any]:
     """Builds the keyword arguments for the HTTP request.
 
@@ -154,27 +229,170 @@ def _get_kwargs(
         client: The instance of the client used to make the request.
         endpoint: The API endpoint for the request.
         method: The HTTP method for the request.
-        json_body: The JSON body of the request.
+        json_body: The JSON body of the request. It is encoded to bytes with the JSON codec of the client.
+        content: The JSON body of the request, already encoded to bytes, or an iterator / async iterator of bytes which
+            is sent with chunked transfer encoding. Takes precedence over json_body.
 
     Returns:
-        A dictionary of keyword arguments to be passed to the HTTP request.
+        A dictionary of keyword arguments to be passed to the HTTP request. The timeout is the one configured for the
+        endpoint class in Client.endpoint_timeouts, if any. Cookies are not included, they are set on the pooled httpx
+        client owned by the API client.
     """
 
     url = f"{client.base_url}/eth/v1/{endpoint}"
 
     headers: Dict[str, str] = client.get_headers()
-    cookies: Dict[str, Any] = client.get_cookies()
 
     request_kwargs: Dict[str, Any] = {
         "method": method,
         "url": url,
         "headers": headers,
-        "cookies": cookies,
-        "timeout": client.get_timeout(),
+        "timeout": client.get_timeout(get_endpoint_class({"method": method, "url": url})),
         "follow_redirects": client.follow_redirects,
     }
 
-    if json_body is not None:
-        request_kwargs["json"] = json_body.to_dict()
+    if content is not None:
+        headers["Content-Type"] = "application/json"
+        request_kwargs["content"] = content
+    elif json_body is not None:
+        headers["Content-Type"] = "application/json"
+        request_kwargs["content"] = client.json_codec.dumps(json_body.to_dict())
 
     return request_kwargs
+
+
+def _attempt(*, client: AuthenticatedClient, kwargs: Dict[str, Any]) -> httpx.Response:
+    """Sends the HTTP request over the network once, unless the CircuitBreaker of the client rejects it.
+
+    If the client has a RateLimiter, the request waits for its tokens first. Its timeouts are capped to the deadline
+    of the current scope, see timeouts.deadline. The deadline does not bound the total time of a synchronous request.
+    """
+
+    def send(request_kwargs: Dict[str, Any]) -> httpx.Response:
+        if client.rate_limiter is not None:
+            client.rate_limiter.acquire(client.base_url, request_kwargs)
+        return client.get_httpx_client().request(**apply_deadline(request_kwargs))
+
+    check_deadline()
+    if client.circuit_breaker is None:
+        return send(kwargs)
+    return client.circuit_breaker.send(client.base_url, kwargs, send)
+
+
+async def _aattempt(*, client: AuthenticatedClient, kwargs: Dict[str, Any]) -> httpx.Response:
+    """Sends the HTTP request over the network once asynchronously, unless the CircuitBreaker of the client rejects it.
+
+    If the client has a RateLimiter, the request waits for its tokens first. If the client has an
+    AIMDConcurrencyLimiter, the request then waits for a free slot of the node. Its timeouts are capped to the
+    deadline of the current scope and it is cancelled, waits included, once the deadline passes, see timeouts.deadline.
+    """
+
+    async def request(request_kwargs: Dict[str, Any]) -> httpx.Response:
+        if client.rate_limiter is not None:
+            await client.rate_limiter.aacquire(client.base_url, request_kwargs)
+        if client.concurrency_limiter is None:
+            return await client.get_async_httpx_client().request(**apply_deadline(request_kwargs))
+        return await client.concurrency_limiter.asend(client.base_url, lambda: client.get_async_httpx_client().request(**apply_deadline(request_kwargs)))
+
+    async def send(request_kwargs: Dict[str, Any]) -> httpx.Response:
+        return await wait_for_deadline(request(request_kwargs))
+
+    check_deadline()
+    if client.circuit_breaker is None:
+        return await send(kwargs)
+    return await client.circuit_breaker.asend(client.base_url, kwargs, send)
+
+
+def _request(*, client: AuthenticatedClient, kwargs: Dict[str, Any]) -> httpx.Response:
+    """Sends the HTTP request over the network, repeating it as allowed by the RetryPolicy of the client."""
+
+    if client.retry_policy is None:
+        return _attempt(client=client, kwargs=kwargs)
+    return client.retry_policy.send(kwargs, lambda: _attempt(client=client, kwargs=kwargs))
+
+
+async def _arequest(*, client: AuthenticatedClient, kwargs: Dict[str, Any]) -> httpx.Response:
+    """Sends the HTTP request over the network asynchronously, repeating it as allowed by the RetryPolicy of the client."""
+
+    if client.retry_policy is None:
+        return await _aattempt(client=client, kwargs=kwargs)
+    return await client.retry_policy.asend(kwargs, lambda: _aattempt(client=client, kwargs=kwargs))
+
+
+def _send_request(*, client: AuthenticatedClient, kwargs: Dict[str, Any]) -> httpx.Response:
+    """Sends the HTTP request using the pooled httpx.Client owned by the API client.
+
+    If the client has a ListCache, list requests are answered from it and key set changes invalidate it. If the
+    client has a RetryPolicy, requests failing with transient errors are repeated. If the client has a
+    CircuitBreaker, requests to a node whose circuit is open are rejected.
+
+    Args:
+        client: The instance of the client used to make the request.
+        kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+
+    Returns:
+        The HTTP response from the API call.
+    """
+
+    list_cache = client.list_cache
+    if list_cache is None:
+        return _request(client=client, kwargs=kwargs)
+
+    if list_cache.is_mutation(kwargs):
+        list_cache.invalidate()
+        try:
+            return _request(client=client, kwargs=kwargs)
+        finally:
+            # the key set may have changed even if the request failed
+            list_cache.invalidate()
+
+    cached_response = list_cache.lookup(kwargs)
+    if cached_response is not None:
+        return cached_response
+    generation = list_cache.generation
+    response = _request(client=client, kwargs=kwargs)
+    list_cache.store(kwargs, response, generation)
+    return response
+
+
+async def _asend_request(*, client: AuthenticatedClient, kwargs: Dict[str, Any]) -> httpx.Response:
+    """Sends the HTTP request using the pooled httpx.AsyncClient owned by the API client.
+
+    If the client has a ListCache, list requests are answered from it and key set changes invalidate it. If the
+    client has a SingleFlight, concurrent identical GET requests share one HTTP request. If the client has a
+    RetryPolicy, requests failing with transient errors are repeated. If the client has a CircuitBreaker, requests to
+    a node whose circuit is open are rejected. If the client has a RateLimiter, requests are paced. If the client has
+    an AIMDConcurrencyLimiter, the requests in flight to the node are limited.
+
+    Args:
+        client: The instance of the client used to make the request.
+        kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+
+    Returns:
+        The HTTP response from the API call.
+    """
+
+    list_cache = client.list_cache
+    if list_cache is not None and list_cache.is_mutation(kwargs):
+        list_cache.invalidate()
+        try:
+            return await _arequest(client=client, kwargs=kwargs)
+        finally:
+            # the key set may have changed even if the request failed
+            list_cache.invalidate()
+
+    generation = 0
+    if list_cache is not None:
+        cached_response = list_cache.lookup(kwargs)
+        if cached_response is not None:
+            return cached_response
+        generation = list_cache.generation
+
+    if client.single_flight is not None and kwargs["method"] == "GET":
+        response = await client.single_flight.run(kwargs, lambda: _arequest(client=client, kwargs=kwargs))
+    else:
+        response = await _arequest(client=client, kwargs=kwargs)
+
+    if list_cache is not None:
+        list_cache.store(kwargs, response, generation)
+    return response
@@ -0,0 +1,72 @@
+"""
+Provides the JSON codecs used to encode request bodies and decode response bodies.
+
+Import bodies embedding thousands of escaped keystore strings and list responses with many entries spend most of their
+time in JSON encoding and decoding. When installed, one of the following packages is used instead of the standard
+library `json` module, in order of preference:
+
+| Codec    | Package                                                                     |
+|----------|-----------------------------------------------------------------------------|
+| orjson   | `pip install eth-2-key-manager-api-client[orjson]`                          |
+| msgspec  | `pip install eth-2-key-manager-api-client[msgspec]`                         |
+| json     | Python standard library (always used as fallback)                           |
+
+A codec can also be selected explicitly with the `json_codec` argument of Client / AuthenticatedClient / Eth2KeyManager.
+"""
+import json
+from typing import Any, Callable, Optional, Union
+
+import attr
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class JSONCodec:
+    """A pair of functions encoding Python objects to JSON bytes and decoding JSON bytes to Python objects.
+
+    Attributes:
+        name: The name of the codec.
+        dumps: Function encoding a JSON compatible Python object to UTF-8 encoded bytes.
+        loads: Function decoding UTF-8 encoded JSON bytes or str to a Python object.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes] = attr.ib(repr=False)
+    loads: Callable[[Union[bytes, str]], Any] = attr.ib(repr=False)
+
+
+STDLIB_JSON_CODEC = JSONCodec(name="json", dumps=_stdlib_dumps, loads=json.loads)
+
+
+def get_json_codec(name: Optional[str] = None) -> JSONCodec:
+    """Returns a JSON codec by name, or the fastest installed codec.
+
+    Args:
+        name: "orjson", "msgspec" or "json". If None, orjson or msgspec is used when installed, otherwise json.
+
+    Raises:
+        ValueError: If the name is unknown or the package of the requested codec is not installed.
+
+    Returns:
+        The JSONCodec.
+    """
+    if name in (None, "orjson") and orjson is not None:
+        return JSONCodec(name="orjson", dumps=orjson.dumps, loads=orjson.loads)
+    if name in (None, "msgspec") and msgspec is not None:
+        return JSONCodec(name="msgspec", dumps=msgspec.json.encode, loads=msgspec.json.decode)
+    if name in (None, "json"):
+        return STDLIB_JSON_CODEC
+    raise ValueError(f"JSON codec {name} is unknown or its package is not installed")
@@ -0,0 +1,152 @@
+"""
+Provides the KeystoreEncodingCache class, which builds POST /eth/v1/keystores request bodies from pre-encoded keystores.
+
+The API expects each keystore as a JSON string embedded in the request body, so encoding the body escapes every quote
+of every keystore and re-scans the whole keystore text. KeystoreEncodingCache encodes each keystore to a JSON string
+literal once, keeps the result and assembles request bodies by concatenating the cached bytes. Retries, bulk import
+chunks and fleet fan-outs of the same keystores reuse the cached encoding. Slashing protection documents are large and
+rarely sent twice, they are encoded on every call.
+
+The cache is opt-in (`keystore_encoding_cache` on Eth2KeyManager / Eth2KeyManagerFleet) because it keeps the keystores
+in memory after the import returned. ImportKeystores and everything built on it (bulk_import_keystores, reconcile) use
+the cache of their client:
+
+```python
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.keystore_encoding import KeystoreEncodingCache
+
+keystore_encoding_cache = KeystoreEncodingCache(max_bytes=64 * 1024 * 1024)
+async with eth_2_key_manager_api_client.Eth2KeyManagerFleet(nodes, keystore_encoding_cache=keystore_encoding_cache) as fleet:
+    results = await fleet.gather("import_keystores", keystores, passwords)
+keystore_encoding_cache.clear()
+```
+"""
+import threading
+from typing import Dict, List, Sequence, Union, cast
+
+import attr
+
+from eth_2_key_manager_api_client.json_codec import JSONCodec
+from eth_2_key_manager_api_client.types import Unset
+
+
+@attr.s(auto_attribs=True)
+class KeystoreEncodingCache:
+    """A cache of keystores encoded as JSON string literals, one per JSON codec.
+
+    Python caches the hash of a string, so looking up a keystore object which was seen before does not re-scan its text.
+    When the cache is full, the oldest encodings are evicted first.
+
+    Attributes:
+        max_bytes: The maximum total size of the cached keystores and their encodings. 0 disables caching.
+
+    Typical usage example:
+        ```python
+        from eth_2_key_manager_api_client.json_codec import get_json_codec
+        from eth_2_key_manager_api_client.keystore_encoding import KeystoreEncodingCache
+
+        keystore_encoding_cache = KeystoreEncodingCache()
+        body = keystore_encoding_cache.build_import_keystores_body(get_json_codec(), [keystore_str], [keystore_password_str])
+        print(f"Cached: {len(keystore_encoding_cache)} keystores, {keystore_encoding_cache.size_bytes} bytes")
+        ```
+    """
+
+    max_bytes: int = 256 * 1024 * 1024
+    _entries: Dict[str, Dict[str, bytes]] = attr.ib(init=False, factory=dict, repr=False, eq=False)
+    _size_bytes: int = attr.ib(init=False, default=0, repr=False, eq=False)
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock, repr=False, eq=False)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    @property
+    def size_bytes(self) -> int:
+        """The total size of the cached keystores and their encodings."""
+        return self._size_bytes
+
+    def clear(self) -> None:
+        """Removes all cached encodings."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def encode_many(self, json_codec: JSONCodec, values: Sequence[str]) -> List[bytes]:
+        """Returns strings encoded as JSON string literals, from the cache if possible.
+
+        Args:
+            json_codec: The JSON codec used to encode the strings.
+            values: The strings to encode, e.g. keystores.
+
+        Returns:
+            The UTF-8 encoded JSON string literals including the surrounding quotes, in input order.
+        """
+        with self._lock:
+            entries = self._entries.setdefault(json_codec.name, {})
+            encoded = [entries.get(value) for value in values]
+
+        missing = [i for i, encoded_value in enumerate(encoded) if encoded_value is None]
+        if not missing:
+            return cast(List[bytes], encoded)
+
+        for i in missing:
+            encoded[i] = json_codec.dumps(values[i])
+        if self.max_bytes <= 0:
+            return cast(List[bytes], encoded)
+
+        with self._lock:
+            entries = self._entries.setdefault(json_codec.name, {})
+            for i in missing:
+                encoded_value = cast(bytes, encoded[i])
+                # the keystore is kept alive as the key, so it counts as well
+                entry_size = len(values[i]) + len(encoded_value)
+                if values[i] not in entries and entry_size <= self.max_bytes:
+                    entries[values[i]] = encoded_value
+                    self._size_bytes += entry_size
+            self._evict()
+        return cast(List[bytes], encoded)
+
+    def encode(self, json_codec: JSONCodec, value: str) -> bytes:
+        """Returns a string encoded as JSON string literal, from the cache if possible.
+
+        Args:
+            json_codec: The JSON codec used to encode the string.
+            value: The string to encode, e.g. a keystore.
+
+        Returns:
+            The UTF-8 encoded JSON string literal including the surrounding quotes.
+        """
+        return self.encode_many(json_codec, [value])[0]
+
+    def _evict(self) -> None:
+        """Evicts the oldest encodings until the cache fits max_bytes. Must be called with the lock held."""
+        for entries in list(self._entries.values()):
+            while self._size_bytes > self.max_bytes and entries:
+                value = next(iter(entries))
+                self._size_bytes -= len(value) + len(entries.pop(value))
+
+    def build_import_keystores_body(
+        self,
+        json_codec: JSONCodec,
+        keystores: Sequence[str],
+        passwords: Sequence[str],
+        slashing_protection_data: Union[Unset, str, None] = None,
+    ) -> bytes:
+        """Builds the body of a POST /eth/v1/keystores request.
+
+        The result is byte for byte the same as encoding ImportKeystoresJsonBody.to_dict() with the same codec.
+        Passwords and slashing protection data are encoded on every call and never cached.
+
+        Args:
+            json_codec: The JSON codec used to encode the body.
+            keystores: List of keystores (strings) to import.
+            passwords: List of passwords to unlock the keystores. `passwords[i]` must unlock `keystores[i]`.
+            slashing_protection_data: Slashing protection data as string. Unset or None if not sent.
+
+        Returns:
+            The UTF-8 encoded JSON request body.
+        """
+        parts = [b'{"keystores":[', b",".join(self.encode_many(json_codec, keystores)), b'],"passwords":', json_codec.dumps(list(passwords))]
+        if isinstance(slashing_protection_data, str):
+            parts += [b',"slashing_protection":', json_codec.dumps(slashing_protection_data)]
+        parts.append(b"}")
+        return b"".join(parts)
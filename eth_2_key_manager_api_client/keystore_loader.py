@@ -0,0 +1,138 @@
+"""
+Provides the KeystoreLoader class, which reads (keystore, password) pairs lazily from a directory or an archive.
+
+Keystores are expected in the layout of `examples/mock_validator_keystores`: each keystore file
+`keystore-m_12381_3600_<index>_0_0-<timestamp>.json` has its password in a file of the same name with a `.txt`
+extension. The following sources are supported:
+
+| Source      | Order of the pairs          | Notes                                                        |
+|-------------|-----------------------------|--------------------------------------------------------------|
+| Directory   | Sorted by file name         | Only the file names are listed up front                      |
+| Zip archive | Sorted by member name       | Members are decompressed one at a time                       |
+| Tar archive | Archive order               | Read as a stream, optionally compressed (gzip, bz2, xz)      |
+
+Only one keystore is held in memory at a time (in tar archives, also the files still waiting for their counterpart),
+so bundles of tens of thousands of keystores can be imported with flat memory usage:
+
+```python
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.keystore_loader import KeystoreLoader
+
+eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(timeout=60.0)
+response = eth_2_key_manager.bulk_import_keystores.sync_from_pairs(KeystoreLoader("validator_keys.tar.gz"))
+```
+"""
+import fnmatch
+import os
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import attr
+
+KEYSTORE_PATTERN = "keystore-*.json"
+
+
+def _read_password(password_bytes: bytes) -> str:
+    # password files usually end with a newline, which is not part of the password
+    return password_bytes.decode("utf-8").rstrip("\r\n")
+
+
+@attr.s(auto_attribs=True)
+class KeystoreLoader:
+    """Iterates over the (keystore, password) pairs of a directory, zip archive or tar archive.
+
+    Attributes:
+        path: The directory or archive containing the keystore and password files. Archives are recognised by
+            their content, not their extension.
+        password: Password used for keystores without a password file. If None, a missing password file is an error.
+        pattern: Glob pattern matching the keystore file names. Files in sub-directories are included.
+
+    Raises:
+        FileNotFoundError: If the path does not exist.
+        ValueError: If the path is neither a directory nor a zip or tar archive, or a keystore has no password file and
+            no default password is set. Raised on iteration.
+
+    Typical usage example:
+        ```python
+        from eth_2_key_manager_api_client.keystore_loader import KeystoreLoader
+
+        for keystore, password in KeystoreLoader("examples/mock_validator_keystores"):
+            print(len(keystore), len(password))
+        ```
+    """
+
+    path: Union[str, "os.PathLike[str]"]
+    password: Optional[str] = attr.ib(default=None, kw_only=True, repr=False)
+    pattern: str = attr.ib(default=KEYSTORE_PATTERN, kw_only=True)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        path = Path(self.path)
+        if path.is_dir():
+            return self._iter_directory(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Keystore source not found: {path}")
+        if zipfile.is_zipfile(path):
+            return self._iter_zip(path)
+        if tarfile.is_tarfile(path):
+            return self._iter_tar(path)
+        raise ValueError(f"Keystore source is neither a directory nor a zip or tar archive: {path}")
+
+    def _is_keystore(self, name: str) -> bool:
+        return fnmatch.fnmatchcase(PurePosixPath(name).name, self.pattern)
+
+    def _default_password(self, keystore_name: str) -> str:
+        if self.password is None:
+            raise ValueError(f"No password file for keystore: {keystore_name}")
+        return self.password
+
+    def _iter_directory(self, path: Path) -> Iterator[Tuple[str, str]]:
+        for keystore_path in sorted(path.rglob(self.pattern)):
+            password_path = keystore_path.with_suffix(".txt")
+            password = _read_password(password_path.read_bytes()) if password_path.is_file() else self._default_password(str(keystore_path))
+            yield keystore_path.read_text(encoding="utf-8"), password
+
+    def _iter_zip(self, path: Path) -> Iterator[Tuple[str, str]]:
+        with zipfile.ZipFile(path) as archive:
+            names = set(archive.namelist())
+            for name in sorted(filter(self._is_keystore, names)):
+                password_name = str(PurePosixPath(name).with_suffix(".txt"))
+                password = _read_password(archive.read(password_name)) if password_name in names else self._default_password(name)
+                yield archive.read(name).decode("utf-8"), password
+
+    def _iter_tar(self, path: Path) -> Iterator[Tuple[str, str]]:
+        # keystores and passwords which are still waiting for their counterpart, usually the adjacent member
+        pending_keystores: Dict[str, str] = {}
+        pending_passwords: Dict[str, str] = {}
+        with tarfile.open(path, mode="r|*") as archive:
+            for member in archive:
+                # TarFile keeps the headers of all members read so far, which grows with the size of the archive
+                archive.members.clear()  # type: ignore[attr-defined]
+                if not member.isfile():
+                    continue
+                member_path = PurePosixPath(member.name)
+                stem = str(member_path.with_suffix(""))
+                if self._is_keystore(member.name):
+                    keystore = self._read_tar_member(archive, member).decode("utf-8")
+                    if stem in pending_passwords:
+                        yield keystore, pending_passwords.pop(stem)
+                    else:
+                        pending_keystores[stem] = keystore
+                elif member_path.suffix == ".txt" and self._is_keystore(str(member_path.with_suffix(".json"))):
+                    password = _read_password(self._read_tar_member(archive, member))
+                    if stem in pending_keystores:
+                        yield pending_keystores.pop(stem), password
+                    else:
+                        pending_passwords[stem] = password
+
+        for stem, keystore in pending_keystores.items():
+            yield keystore, self._default_password(f"{stem}.json")
+
+    @staticmethod
+    def _read_tar_member(archive: tarfile.TarFile, member: tarfile.TarInfo) -> bytes:
+        member_file = archive.extractfile(member)
+        if member_file is None:  # pragma: no cover
+            raise ValueError(f"Unreadable archive member: {member.name}")
+        with member_file:
+            return member_file.read()
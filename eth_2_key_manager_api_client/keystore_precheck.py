@@ -0,0 +1,199 @@
+"""
+Provides the KeystorePrecheck class, which verifies keystore passwords locally before keystores are uploaded.
+
+Validator clients only discover a wrong password after spending a full key derivation (scrypt with n=262144 for
+keystores generated by the deposit CLI) on it, and a single bad entry can fail a whole ImportKeystores batch.
+KeystorePrecheck derives the key locally as defined in EIP-2335 and compares `sha256(derived_key[16:32] + cipher
+message)` with the checksum of the keystore. Derivations run in a ProcessPoolExecutor across all CPU cores, which is
+started on the first check and reused until `close()`. Results are cached in memory by keystore uuid, checksum and password hash, so checking the same pairs again, e.g. before
+importing them on further nodes, is instant.
+
+Keystores with a key derivation or checksum function not defined in EIP-2335 can't be verified locally and pass the
+check; the validator client reports them.
+"""
+import hashlib
+import hmac
+import json
+import multiprocessing
+import threading
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+import attr
+
+
+def _normalise_password(password: str) -> bytes:
+    """Normalises a password as defined in EIP-2335: NFKD normalisation, control codes removed, UTF-8 encoded."""
+    normalised = unicodedata.normalize("NFKD", password)
+    return "".join(c for c in normalised if not (ord(c) < 0x20 or 0x7F <= ord(c) <= 0x9F)).encode("utf-8")
+
+
+def check_keystore_password(keystore: str, password: str) -> Optional[str]:
+    """Verifies a keystore password against the checksum of an EIP-2335 keystore.
+
+    Args:
+        keystore: The keystore as JSON string.
+        password: The password to verify.
+
+    Returns:
+        None if the password unlocks the keystore or the keystore's functions are not defined in EIP-2335, otherwise
+        the reason why the pair would be rejected.
+    """
+    try:
+        crypto = json.loads(keystore)["crypto"]
+        kdf, checksum, cipher = crypto["kdf"], crypto["checksum"], crypto["cipher"]
+        kdf_params = kdf["params"]
+        if checksum["function"] != "sha256":
+            return None
+
+        if kdf["function"] == "scrypt":
+            n, r, p = kdf_params["n"], kdf_params["r"], kdf_params["p"]
+            derived_key = hashlib.scrypt(
+                _normalise_password(password),
+                salt=bytes.fromhex(kdf_params["salt"]),
+                n=n,
+                r=r,
+                p=p,
+                dklen=kdf_params["dklen"],
+                # the memory scrypt needs, hashlib's default limit of 32 MiB is too low for n=262144
+                maxmem=128 * r * (n + p + 2),
+            )
+        elif kdf["function"] == "pbkdf2" and kdf_params.get("prf") == "hmac-sha256":
+            derived_key = hashlib.pbkdf2_hmac(
+                "sha256", _normalise_password(password), bytes.fromhex(kdf_params["salt"]), kdf_params["c"], dklen=kdf_params["dklen"]
+            )
+        else:
+            return None
+
+        expected_checksum = bytes.fromhex(checksum["message"])
+        actual_checksum = hashlib.sha256(derived_key[16:32] + bytes.fromhex(cipher["message"])).digest()
+    except (ValueError, KeyError, TypeError) as e:
+        return f"Invalid keystore: {type(e).__name__}: {e}"
+
+    if not hmac.compare_digest(expected_checksum, actual_checksum):
+        return "Invalid keystore password"
+    return None
+
+
+def _cache_key(keystore: str, password: str) -> Optional[Tuple[str, str, str]]:
+    try:
+        decoded = json.loads(keystore)
+        uuid, checksum = str(decoded.get("uuid", "")), str(decoded["crypto"]["checksum"]["message"])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return uuid, checksum, hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+def _default_start_method() -> str:
+    # forking a process which runs event loops or holds locks in other threads is unsafe
+    return "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+@attr.s(auto_attribs=True)
+class KeystorePrecheck:
+    """Verifies (keystore, password) pairs locally in a pool of worker processes.
+
+    Attributes:
+        max_workers: The number of worker processes. Defaults to the number of CPU cores.
+        start_method: The multiprocessing start method of the worker processes. Defaults to "forkserver" where
+            available, otherwise "spawn".
+
+    The worker processes are started on the first check which needs them and reused by later checks. Call `close()`
+    or use KeystorePrecheck as context manager to stop them.
+
+    The cache only lives in memory: persisting password hashes would allow testing password guesses far faster than
+    the key derivation of the keystore allows.
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+        from eth_2_key_manager_api_client.keystore_precheck import KeystorePrecheck
+
+        with KeystorePrecheck() as keystore_precheck:
+            errors = keystore_precheck.check(keystores, passwords)
+            for keystore, error in zip(keystores, errors):
+                if error is not None:
+                    print(f"{keystore}: {error}")
+
+            # or let bulk_import_keystores skip and report bad pairs
+            eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(timeout=60.0)
+            eth_2_key_manager.bulk_import_keystores.precheck = keystore_precheck
+            response = eth_2_key_manager.bulk_import_keystores.sync(keystores, passwords)
+        ```
+    """
+
+    max_workers: Optional[int] = None
+    start_method: str = attr.ib(factory=_default_start_method, validator=attr.validators.in_(multiprocessing.get_all_start_methods()))
+    _cache: Dict[Tuple[str, str, str], Optional[str]] = attr.ib(init=False, factory=dict, repr=False, eq=False)
+    _executor: Optional[ProcessPoolExecutor] = attr.ib(init=False, default=None, repr=False, eq=False)
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock, repr=False, eq=False)
+
+    def clear_cache(self) -> None:
+        """Removes all cached results."""
+        self._cache.clear()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context(self.start_method))
+            return self._executor
+
+    def close(self) -> None:
+        """Stops the worker processes. A later check starts new ones."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> "KeystorePrecheck":
+        """Enter a context manager which stops the worker processes on exit"""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        """Exit the context manager and stop the worker processes"""
+        self.close()
+
+    def check(self, keystores: Sequence[str], passwords: Sequence[str]) -> List[Optional[str]]:
+        """Verifies the passwords of keystores.
+
+        Args:
+            keystores: List of keystores (strings).
+            passwords: List of passwords. `passwords[i]` must unlock `keystores[i]`.
+
+        Raises:
+            ValueError: If keystores and passwords have different lengths.
+
+        Returns:
+            One entry per keystore: None if the pair passed the check, otherwise the reason why it would be rejected.
+        """
+        if len(keystores) != len(passwords):
+            raise ValueError("keystores and passwords must have the same length")
+
+        results: List[Optional[str]] = [None] * len(keystores)
+        cache_keys = [_cache_key(keystore, password) for keystore, password in zip(keystores, passwords)]
+        unchecked = []
+        for i, cache_key in enumerate(cache_keys):
+            if cache_key is not None and cache_key in self._cache:
+                results[i] = self._cache[cache_key]
+            else:
+                unchecked.append(i)
+
+        if len(unchecked) > 1 and self.max_workers != 1:
+            executor = self._get_executor()
+            checked = list(executor.map(check_keystore_password, [keystores[i] for i in unchecked], [passwords[i] for i in unchecked]))
+        else:
+            checked = [check_keystore_password(keystores[i], passwords[i]) for i in unchecked]
+
+        for i, result in zip(unchecked, checked):
+            results[i] = result
+            cache_key = cache_keys[i]
+            if cache_key is not None:
+                self._cache[cache_key] = result
+        return results
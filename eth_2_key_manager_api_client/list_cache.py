@@ -0,0 +1,106 @@
+"""
+Provides the ListCache class, an opt-in TTL cache for the ListKeys and ListRemoteKeys responses of a single node.
+
+Every GET /eth/v1/keystores and GET /eth/v1/remotekeys request makes the validator client serialise its whole key set.
+Controllers which poll these endpoints to answer "is key X loaded here?" can enable ListCache with the `list_cache_ttl`
+argument of Eth2KeyManager: responses are reused for `ttl` seconds, and all cached responses are dropped whenever a
+POST or DELETE request to one of these endpoints (ImportKeystores, DeleteKeys, ImportRemoteKeys, DeleteRemoteKeys and
+everything built on them) is sent through the same client. A request which failed or timed out may still have changed
+the key set, so the cache is invalidated regardless of the outcome.
+
+Only successful (200) responses are cached. Changes made by other clients of the node are visible after at most `ttl`
+seconds.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import attr
+import httpx
+
+CACHED_ENDPOINTS = ("keystores", "remotekeys")
+
+
+@attr.s(auto_attribs=True)
+class ListCache:
+    """A TTL cache of list responses with write-through invalidation.
+
+    Attributes:
+        ttl: The number of seconds a response is reused for.
+        endpoints: The endpoints whose GET responses are cached and whose POST / DELETE requests invalidate the cache.
+        hits: The number of requests answered from the cache.
+        misses: The number of cacheable requests sent to the node.
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(list_cache_ttl=10.0)
+        eth_2_key_manager.list_keys.sync_detailed()  # sent to the node
+        eth_2_key_manager.list_keys.sync_detailed()  # answered from the cache
+        eth_2_key_manager.delete_keys.sync_detailed([pubkey])  # invalidates the cache
+
+        print(eth_2_key_manager.client.list_cache.hits)
+        ```
+    """
+
+    ttl: float = 5.0
+    endpoints: Tuple[str, ...] = CACHED_ENDPOINTS
+    hits: int = attr.ib(init=False, default=0)
+    misses: int = attr.ib(init=False, default=0)
+    _entries: Dict[str, Tuple[float, httpx.Response]] = attr.ib(init=False, factory=dict, repr=False, eq=False)
+    _generation: int = attr.ib(init=False, default=0, repr=False, eq=False)
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock, repr=False, eq=False)
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every invalidation, responses requested before an invalidation are never stored."""
+        return self._generation
+
+    def _is_cached_endpoint(self, kwargs: Dict[str, Any]) -> bool:
+        path = httpx.URL(kwargs["url"]).path
+        return any(path.endswith(f"/eth/v1/{endpoint}") for endpoint in self.endpoints)
+
+    def is_mutation(self, kwargs: Dict[str, Any]) -> bool:
+        """Whether a request changes the key set listed by a cached endpoint.
+
+        Args:
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+        """
+        return kwargs["method"] != "GET" and self._is_cached_endpoint(kwargs)
+
+    def lookup(self, kwargs: Dict[str, Any]) -> Optional[httpx.Response]:
+        """Returns the cached response of a GET request, None if it is not cached, expired or not cacheable.
+
+        Args:
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+        """
+        if kwargs["method"] != "GET" or not self._is_cached_endpoint(kwargs):
+            return None
+        with self._lock:
+            entry = self._entries.get(kwargs["url"])
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def store(self, kwargs: Dict[str, Any], response: httpx.Response, generation: int) -> None:
+        """Caches the response of a GET request if it is cacheable.
+
+        Args:
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+            response: The HTTP response from the API call.
+            generation: The generation when the request was sent. Stale responses are discarded.
+        """
+        if kwargs["method"] != "GET" or response.status_code != httpx.codes.OK or not self._is_cached_endpoint(kwargs):
+            return
+        with self._lock:
+            if generation == self._generation:
+                self._entries[kwargs["url"]] = (time.monotonic() + self.ttl, response)
+
+    def invalidate(self) -> None:
+        """Drops all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
@@ -1,11 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, cast
 
 import attr
 
+from eth_2_key_manager_api_client.types import _additional_properties_eq_key
+
 T = TypeVar("T", bound="DeleteRemoteKeysJsonBody")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeleteRemoteKeysJsonBody:
     """
     Attributes:
@@ -13,13 +15,14 @@ class DeleteRemoteKeysJsonBody:
     """
 
     pubkeys: List[str]
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         pubkeys = self.pubkeys
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "pubkeys": pubkeys,
@@ -37,9 +40,20 @@ class DeleteRemoteKeysJsonBody:
             pubkeys=pubkeys,
         )
 
-        delete_remote_keys_json_body.additional_properties = d
+        if d:
+            delete_remote_keys_json_body.additional_properties = d
         return delete_remote_keys_json_body
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -1,16 +1,16 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
 from eth_2_key_manager_api_client.models.delete_remote_keys_response_data_item_status import (
     DeleteRemoteKeysResponseDataItemStatus,
 )
-from eth_2_key_manager_api_client.types import UNSET, Unset
+from eth_2_key_manager_api_client.types import UNSET, Unset, _additional_properties_eq_key
 
 T = TypeVar("T", bound="DeleteRemoteKeysResponseDataItem")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DeleteRemoteKeysResponseDataItem:
     """
     Attributes:
@@ -25,7 +25,7 @@ class DeleteRemoteKeysResponseDataItem:
 
     status: DeleteRemoteKeysResponseDataItemStatus
     message: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         status = self.status.value
@@ -33,7 +33,8 @@ class DeleteRemoteKeysResponseDataItem:
         message = self.message
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "status": status,
@@ -56,9 +57,20 @@ class DeleteRemoteKeysResponseDataItem:
             message=message,
         )
 
-        delete_remote_keys_response_data_item.additional_properties = d
+        if d:
+            delete_remote_keys_response_data_item.additional_properties = d
         return delete_remote_keys_response_data_item
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -1,13 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
-from eth_2_key_manager_api_client.types import UNSET, Unset
+from eth_2_key_manager_api_client.types import UNSET, Unset, _additional_properties_eq_key
 
 T = TypeVar("T", bound="FeeRecipient")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class FeeRecipient:
     """
     Attributes:
@@ -20,14 +20,15 @@ class FeeRecipient:
 
     ethaddress: str
     pubkey: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         ethaddress = self.ethaddress
         pubkey = self.pubkey
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "ethaddress": ethaddress,
@@ -50,9 +51,20 @@ class FeeRecipient:
             pubkey=pubkey,
         )
 
-        fee_recipient.additional_properties = d
+        if d:
+            fee_recipient.additional_properties = d
         return fee_recipient
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -1,13 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
-from eth_2_key_manager_api_client.types import UNSET, Unset
+from eth_2_key_manager_api_client.types import UNSET, Unset, _additional_properties_eq_key
 
 T = TypeVar("T", bound="GasLimit")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class GasLimit:
     """
     Attributes:
@@ -19,14 +19,15 @@ class GasLimit:
 
     gas_limit: str
     pubkey: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         gas_limit = self.gas_limit
         pubkey = self.pubkey
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "gas_limit": gas_limit,
@@ -49,9 +50,20 @@ class GasLimit:
             pubkey=pubkey,
         )
 
-        gas_limit.additional_properties = d
+        if d:
+            gas_limit.additional_properties = d
         return gas_limit
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -1,13 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
 import attr
 
-from eth_2_key_manager_api_client.types import UNSET, Unset
+from eth_2_key_manager_api_client.types import UNSET, Unset, _additional_properties_eq_key
 
 T = TypeVar("T", bound="ImportKeystoresJsonBody")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ImportKeystoresJsonBody:
     """
     Attributes:
@@ -23,7 +23,7 @@ class ImportKeystoresJsonBody:
     keystores: List[str]
     passwords: List[str]
     slashing_protection: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         keystores = self.keystores
@@ -33,7 +33,8 @@ class ImportKeystoresJsonBody:
         slashing_protection = self.slashing_protection
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "keystores": keystores,
@@ -60,9 +61,20 @@ class ImportKeystoresJsonBody:
             slashing_protection=slashing_protection,
         )
 
-        import_keystores_json_body.additional_properties = d
+        if d:
+            import_keystores_json_body.additional_properties = d
         return import_keystores_json_body
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from eth_2_key_manager_api_client.types import _additional_properties_eq_key
+
 if TYPE_CHECKING:
     from eth_2_key_manager_api_client.models.import_keystores_response_data_item import ImportKeystoresResponseDataItem
 
@@ -9,7 +11,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="ImportKeystoresResponse")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ImportKeystoresResponse:
     """
     Attributes:
@@ -18,7 +20,7 @@ class ImportKeystoresResponse:
     """
 
     data: List["ImportKeystoresResponseDataItem"]
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         data = []
@@ -28,7 +30,8 @@ class ImportKeystoresResponse:
             data.append(data_item)
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "data": data,
@@ -55,9 +58,20 @@ class ImportKeystoresResponse:
             data=data,
         )
 
-        import_keystores_response.additional_properties = d
+        if d:
+            import_keystores_response.additional_properties = d
         return import_keystores_response
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from eth_2_key_manager_api_client.types import _additional_properties_eq_key
+
 if TYPE_CHECKING:
     from eth_2_key_manager_api_client.models.import_remote_keys_json_body_remote_keys_item import (
         ImportRemoteKeysJsonBodyRemoteKeysItem,
@@ -11,7 +13,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="ImportRemoteKeysJsonBody")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ImportRemoteKeysJsonBody:
     """
     Attributes:
@@ -19,7 +21,7 @@ class ImportRemoteKeysJsonBody:
     """
 
     remote_keys: List["ImportRemoteKeysJsonBodyRemoteKeysItem"]
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         remote_keys = []
@@ -29,7 +31,8 @@ class ImportRemoteKeysJsonBody:
             remote_keys.append(remote_keys_item)
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "remote_keys": remote_keys,
@@ -56,9 +59,20 @@ class ImportRemoteKeysJsonBody:
             remote_keys=remote_keys,
         )
 
-        import_remote_keys_json_body.additional_properties = d
+        if d:
+            import_remote_keys_json_body.additional_properties = d
         return import_remote_keys_json_body
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
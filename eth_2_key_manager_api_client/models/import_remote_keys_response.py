@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from eth_2_key_manager_api_client.types import _additional_properties_eq_key
+
 if TYPE_CHECKING:
     from eth_2_key_manager_api_client.models.import_remote_keys_response_data_item import (
         ImportRemoteKeysResponseDataItem,
@@ -11,7 +13,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="ImportRemoteKeysResponse")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ImportRemoteKeysResponse:
     """
     Attributes:
@@ -20,7 +22,7 @@ class ImportRemoteKeysResponse:
     """
 
     data: List["ImportRemoteKeysResponseDataItem"]
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         data = []
@@ -30,7 +32,8 @@ class ImportRemoteKeysResponse:
             data.append(data_item)
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "data": data,
@@ -57,9 +60,20 @@ class ImportRemoteKeysResponse:
             data=data,
         )
 
-        import_remote_keys_response.additional_properties = d
+        if d:
+            import_remote_keys_response.additional_properties = d
         return import_remote_keys_response
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
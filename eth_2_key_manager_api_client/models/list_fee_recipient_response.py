@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from eth_2_key_manager_api_client.types import _additional_properties_eq_key
+
 if TYPE_CHECKING:
     from eth_2_key_manager_api_client.models.list_fee_recipient_response_data import ListFeeRecipientResponseData
 
@@ -9,7 +11,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="ListFeeRecipientResponse")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ListFeeRecipientResponse:
     """
     Attributes:
@@ -17,13 +19,14 @@ class ListFeeRecipientResponse:
     """
 
     data: "ListFeeRecipientResponseData"
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         data = self.data.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "data": data,
@@ -43,9 +46,20 @@ class ListFeeRecipientResponse:
             data=data,
         )
 
-        list_fee_recipient_response.additional_properties = d
+        if d:
+            list_fee_recipient_response.additional_properties = d
         return list_fee_recipient_response
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -1,13 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import attr
 
-from eth_2_key_manager_api_client.types import UNSET, Unset
+from eth_2_key_manager_api_client.types import UNSET, Unset, _additional_properties_eq_key
 
 T = TypeVar("T", bound="ListRemoteKeysResponseDataItem")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ListRemoteKeysResponseDataItem:
     """
     Attributes:
@@ -22,7 +22,7 @@ class ListRemoteKeysResponseDataItem:
     pubkey: str
     url: Union[Unset, str] = UNSET
     readonly: Union[Unset, bool] = UNSET
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         pubkey = self.pubkey
@@ -30,7 +30,8 @@ class ListRemoteKeysResponseDataItem:
         readonly = self.readonly
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "pubkey": pubkey,
@@ -58,9 +59,20 @@ class ListRemoteKeysResponseDataItem:
             readonly=readonly,
         )
 
-        list_remote_keys_response_data_item.additional_properties = d
+        if d:
+            list_remote_keys_response_data_item.additional_properties = d
         return list_remote_keys_response_data_item
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
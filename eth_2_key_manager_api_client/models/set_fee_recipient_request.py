@@ -1,11 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from eth_2_key_manager_api_client.types import _additional_properties_eq_key
+
 T = TypeVar("T", bound="SetFeeRecipientRequest")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class SetFeeRecipientRequest:
     """
     Attributes:
@@ -14,13 +16,14 @@ class SetFeeRecipientRequest:
     """
 
     ethaddress: str
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         ethaddress = self.ethaddress
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "ethaddress": ethaddress,
@@ -38,9 +41,20 @@ class SetFeeRecipientRequest:
             ethaddress=ethaddress,
         )
 
-        set_fee_recipient_request.additional_properties = d
+        if d:
+            set_fee_recipient_request.additional_properties = d
         return set_fee_recipient_request
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
@@ -1,11 +1,13 @@
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import attr
 
+from eth_2_key_manager_api_client.types import _additional_properties_eq_key
+
 T = TypeVar("T", bound="SetGasLimitRequest")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class SetGasLimitRequest:
     """
     Attributes:
@@ -13,13 +15,14 @@ class SetGasLimitRequest:
     """
 
     gas_limit: str
-    additional_properties: Dict[str, Any] = attr.ib(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = attr.ib(init=False, default=None, eq=_additional_properties_eq_key)
 
     def to_dict(self) -> Dict[str, Any]:
         gas_limit = self.gas_limit
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "gas_limit": gas_limit,
@@ -37,9 +40,20 @@ class SetGasLimitRequest:
             gas_limit=gas_limit,
         )
 
-        set_gas_limit_request.additional_properties = d
+        if d:
+            set_gas_limit_request.additional_properties = d
         return set_gas_limit_request
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, additional_properties: Dict[str, Any]) -> None:
+        self._additional_properties = additional_properties
+
     @property
     def additional_keys(self) -> List[str]:
         return list(self.additional_properties.keys())
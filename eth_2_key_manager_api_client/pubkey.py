@@ -0,0 +1,108 @@
+"""
+Provides the Pubkey class, a compact binary representation of a validator's BLS public key.
+
+The API represents pubkeys as 98 character hex strings with 0x prefix, which are case insensitive, so comparing them
+requires normalising both sides every time. Pubkey is a `bytes` subclass holding the 48 raw bytes instead: it is
+normalised once when created, hashing and comparison run at C speed on 48 bytes with the hash cached by the
+interpreter, and each instance takes about two thirds of the memory of the hex string.
+
+`Pubkey.intern` returns a single shared instance per key, for inventories which are kept around and compared
+repeatedly, e.g. across the nodes of a fleet. Lookups of an interned pubkey in a dict keyed by interned pubkeys find
+the key by identity, and the hex form of an interned pubkey is computed once. The pubkey indexes of the
+slashing_protection, reconcile and columnar modules hold interned pubkeys. The intern table
+keeps the `max_interned` most recently interned pubkeys, older ones are released (`bytes` subclasses cannot be weakly
+referenced).
+"""
+import threading
+from collections import OrderedDict
+from typing import Tuple, Union
+
+PUBKEY_LENGTH = 48
+
+
+class Pubkey(bytes):
+    """A validator's BLS public key backed by its 48 raw bytes.
+
+    Args:
+        value: Hex encoded pubkey (case insensitive, with or without 0x prefix), 48 raw bytes or a Pubkey.
+
+    Raises:
+        ValueError: If the value is not a hex encoded or raw 48 byte value.
+
+    Typical usage example:
+        ```python
+        from eth_2_key_manager_api_client.pubkey import Pubkey
+
+        pubkey = Pubkey("0x99C4C42FAC7D1393956BD9E2785ED67CF5AACA4BF56D2FCDA94C42D6042AEBB1723CE6BAC6F0216FF8C5D4F9F013008B")
+
+        assert pubkey == Pubkey("99c4c42fac7d1393956bd9e2785ed67cf5aaca4bf56d2fcda94c42d6042aebb1723ce6bac6f0216ff8c5d4f9f013008b")
+        print(pubkey)  # 0x99c4c42fac7d1393956bd9e2785ed67cf5aaca4bf56d2fcda94c42d6042aebb1723ce6bac6f0216ff8c5d4f9f013008b
+        ```
+    """
+
+    __slots__ = ()
+
+    max_interned = 1 << 18
+    # the canonical instance and its hex form per pubkey, least recently interned first
+    _interned: "OrderedDict[bytes, Tuple[Pubkey, str]]" = OrderedDict()
+    _interned_lock = threading.Lock()
+
+    def __new__(cls, value: Union[str, bytes]) -> "Pubkey":
+        if type(value) is cls:
+            return value  # type: ignore[return-value]
+
+        if isinstance(value, str):
+            hex_value = value.strip()
+            pubkey = super().__new__(cls, bytes.fromhex(hex_value[2:] if hex_value[:2] in ("0x", "0X") else hex_value))
+        else:
+            pubkey = super().__new__(cls, value)
+        if len(pubkey) != PUBKEY_LENGTH:
+            raise ValueError(f"Invalid pubkey length: {value!r}")
+        return pubkey
+
+    @classmethod
+    def intern(cls, value: Union[str, bytes]) -> "Pubkey":
+        """Returns the canonical instance of a pubkey.
+
+        All calls with the same pubkey return the same instance, so long-lived inventories of many nodes share one
+        object per key. Up to `max_interned` pubkeys are kept, the least recently interned ones are released first.
+
+        Args:
+            value: Hex encoded pubkey (case insensitive, with or without 0x prefix), 48 raw bytes or a Pubkey.
+
+        Raises:
+            ValueError: If the value is not a hex encoded or raw 48 byte value.
+        """
+        pubkey = cls(value)
+        with cls._interned_lock:
+            entry = cls._interned.get(pubkey)
+            if entry is not None:
+                cls._interned.move_to_end(pubkey)
+                return entry[0]
+            cls._interned[pubkey] = (pubkey, f"0x{pubkey.hex()}")
+            while len(cls._interned) > cls.max_interned:
+                cls._interned.popitem(last=False)
+            return pubkey
+
+    @classmethod
+    def clear_interned(cls) -> None:
+        """Releases all interned pubkeys."""
+        with cls._interned_lock:
+            cls._interned.clear()
+
+    @property
+    def hex_str(self) -> str:
+        """The canonical hex form of the pubkey: lower case with 0x prefix. Cached for interned pubkeys."""
+        entry = Pubkey._interned.get(self)
+        if entry is not None and entry[0] is self:
+            return entry[1]
+        return f"0x{self.hex()}"
+
+    def __str__(self) -> str:
+        return self.hex_str
+
+    def __repr__(self) -> str:
+        return f"Pubkey('{self.hex_str}')"
+
+    def __reduce__(self):  # type: ignore[no-untyped-def]
+        return Pubkey, (bytes(self),)
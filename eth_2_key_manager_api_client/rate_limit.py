@@ -0,0 +1,169 @@
+"""
+Provides the RateLimiter class, which paces the requests sent to each validator client with token buckets.
+
+Some operators cap the request rate on the validator API port, and bursts of requests, e.g. from `asyncio.gather`,
+either trigger 429 responses or take CPU time the validator client needs for its duties. A RateLimiter holds a token
+bucket per `base_url` for all requests (`node`) and one per `base_url` and endpoint class (`endpoints`, see the
+endpoints module for the names). Every request, including every retry, takes a token from each bucket which applies to
+it and waits until tokens are available:
+
+```python
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.rate_limit import RateLimit, RateLimiter
+
+rate_limiter = RateLimiter(
+    node=RateLimit(rate=20.0, burst=5),
+    endpoints={
+        "ImportKeystores": RateLimit(rate=0.5),
+        "ListFeeRecipient": RateLimit(rate=50.0, burst=10),
+    },
+)
+eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(rate_limiter=rate_limiter)
+```
+
+A bucket refills at `rate` tokens per second and holds at most `burst` tokens, so a node is sent at most `burst`
+requests at once and `rate` requests per second on average. Waiting requests reserve their token when they start
+waiting, so they are sent in the order they arrived and at evenly spaced times. The buckets are shared by all threads
+and coroutines using the RateLimiter, which may also be shared by many Eth2KeyManager instances, e.g. the nodes of an
+Eth2KeyManagerFleet.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import attr
+
+from eth_2_key_manager_api_client.endpoints import ENDPOINT_CLASSES, get_endpoint_class
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RateLimit:
+    """The rate limit of a token bucket.
+
+    Attributes:
+        rate: The average number of requests per second.
+        burst: The maximum number of requests sent at once, i.e. the capacity of the bucket.
+    """
+
+    rate: float
+    burst: int = 1
+
+
+@attr.s(auto_attribs=True)
+class TokenBucket:
+    """A token bucket, thread-safe and shared by synchronous and asynchronous callers.
+
+    Attributes:
+        rate_limit: The rate and capacity of the bucket. The bucket starts full.
+    """
+
+    rate_limit: RateLimit
+    _tokens: float = attr.ib(init=False, repr=False, eq=False)
+    _updated: float = attr.ib(init=False, factory=time.monotonic, repr=False, eq=False)
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._tokens = float(self.rate_limit.burst)
+
+    def reserve(self) -> float:
+        """Takes a token, which may not be available yet.
+
+        Returns:
+            The number of seconds until the token is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.rate_limit.burst), self._tokens + (now - self._updated) * self.rate_limit.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate_limit.rate)
+
+    def refund(self) -> None:
+        """Returns a reserved token which was not used."""
+        with self._lock:
+            self._tokens = min(float(self.rate_limit.burst), self._tokens + 1)
+
+    def acquire(self) -> None:
+        """Takes a token, sleeping until it is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Takes a token, sleeping asynchronously until it is available."""
+        delay = self.reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+
+
+@attr.s(auto_attribs=True)
+class RateLimiter:
+    """Paces requests per base_url and per base_url and endpoint class.
+
+    Attributes:
+        node: The rate limit of all requests to a node. None for no node-wide limit.
+        endpoints: The rate limits of single endpoint classes, keyed by the endpoint class name, e.g. "ImportKeystores".
+
+    Raises:
+        ValueError: If an endpoint class name is unknown, or a rate is not positive or a burst is lower than 1.
+    """
+
+    node: Optional[RateLimit] = None
+    endpoints: Dict[str, RateLimit] = attr.ib(factory=dict)
+    _buckets: Dict[Tuple[str, str], TokenBucket] = attr.ib(init=False, factory=dict, repr=False, eq=False)
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        unknown_endpoints = set(self.endpoints) - set(ENDPOINT_CLASSES.values())
+        if unknown_endpoints:
+            raise ValueError(f"Unknown endpoint classes: {', '.join(sorted(unknown_endpoints))}")
+        for rate_limit in [self.node, *self.endpoints.values()]:
+            if rate_limit is not None and (rate_limit.rate <= 0 or rate_limit.burst < 1):
+                raise ValueError(f"Invalid rate limit: {rate_limit}")
+
+    def _bucket(self, base_url: str, name: str, rate_limit: RateLimit) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get((base_url, name))
+            if bucket is None:
+                bucket = self._buckets[(base_url, name)] = TokenBucket(rate_limit)
+            return bucket
+
+    def get_buckets(self, base_url: str, kwargs: Dict[str, Any]) -> List[TokenBucket]:
+        """Returns the buckets a request takes tokens from, the endpoint class bucket first.
+
+        Args:
+            base_url: The base URL of the validator client.
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+        """
+        buckets = []
+        endpoint_class = get_endpoint_class(kwargs)
+        if endpoint_class is not None and endpoint_class in self.endpoints:
+            buckets.append(self._bucket(base_url, endpoint_class, self.endpoints[endpoint_class]))
+        if self.node is not None:
+            buckets.append(self._bucket(base_url, "", self.node))
+        return buckets
+
+    def acquire(self, base_url: str, kwargs: Dict[str, Any]) -> None:
+        """Waits until a request may be sent.
+
+        Args:
+            base_url: The base URL of the validator client.
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+        """
+        for bucket in self.get_buckets(base_url, kwargs):
+            bucket.acquire()
+
+    async def aacquire(self, base_url: str, kwargs: Dict[str, Any]) -> None:
+        """Waits asynchronously until a request may be sent.
+
+        Args:
+            base_url: The base URL of the validator client.
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+        """
+        for bucket in self.get_buckets(base_url, kwargs):
+            await bucket.aacquire()
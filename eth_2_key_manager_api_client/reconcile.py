@@ -0,0 +1,301 @@
+"""
+Provides the Reconciler class, which brings the keys loaded by a validator client in line with a desired key set.
+
+The keys currently loaded are listed once with GET /eth/v1/keystores and GET /eth/v1/remotekeys and indexed by pubkey.
+Only the difference between the desired and the current key set is sent to the validator client, so keystores which
+are already loaded are not imported (and decrypted) again.
+
+The plan is executed in the following order, so a key moving between a local keystore and a remote signer is never
+loaded twice at the same time:
+
+1. DELETE /eth/v1/keystores
+2. DELETE /eth/v1/remotekeys
+3. POST /eth/v1/keystores (in adaptively sized chunks, see the bulk_import module)
+4. POST /eth/v1/remotekeys
+
+Keys reported as `readonly` by the validator client are never deleted. With `prune`, an empty desired key set would
+delete every key of the validator client, so it is refused unless `allow_empty` is set.
+"""
+import asyncio
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import attr
+
+from eth_2_key_manager_api_client.api.local_key_manager import DeleteKeys, ListKeys
+from eth_2_key_manager_api_client.api.remote_key_manager import DeleteRemoteKeys, ImportRemoteKeys, ListRemoteKeys
+from eth_2_key_manager_api_client.bulk_import import BulkImportKeystores, _keystore_pubkey
+from eth_2_key_manager_api_client.client import AuthenticatedClient
+from eth_2_key_manager_api_client.errors import KeyStateUnavailable
+from eth_2_key_manager_api_client.helpers import _get_parsed
+from eth_2_key_manager_api_client.models.import_keystores_response import ImportKeystoresResponse
+from eth_2_key_manager_api_client.models.list_keys_response import ListKeysResponse
+from eth_2_key_manager_api_client.models.list_remote_keys_response import ListRemoteKeysResponse
+from eth_2_key_manager_api_client.pubkey import Pubkey
+from eth_2_key_manager_api_client.slashing_protection import SlashingProtectionIndex
+from eth_2_key_manager_api_client.types import UNSET, Response, Unset
+
+
+def _batches(items: Sequence, batch_size: int) -> List[List]:
+    return [list(items[i : i + batch_size]) for i in range(0, len(items), max(1, batch_size))]
+
+
+@attr.s(auto_attribs=True)
+class ReconcilePlan:
+    """The changes required to bring a validator client in line with the desired key set.
+
+    Attributes:
+        import_keystores: (keystore, password) tuples of the keystores to import. Keystores without a pubkey are always imported.
+        delete_keys: Pubkeys of the local keys to delete.
+        import_remote_keys: Remote keys to import, each containing a pubkey and optional remote signer url.
+        delete_remote_keys: Pubkeys of the remote keys to delete.
+    """
+
+    import_keystores: List[Tuple[str, str]] = attr.ib(factory=list)
+    delete_keys: List[str] = attr.ib(factory=list)
+    import_remote_keys: List[Dict[str, str]] = attr.ib(factory=list)
+    delete_remote_keys: List[str] = attr.ib(factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the validator client already matches the desired key set."""
+        return not (self.import_keystores or self.delete_keys or self.import_remote_keys or self.delete_remote_keys)
+
+
+@attr.s(auto_attribs=True)
+class ReconcileResult:
+    """The outcome of executing a ReconcilePlan.
+
+    Attributes:
+        plan: The executed plan.
+        delete_keys: Responses of the DELETE /eth/v1/keystores batches. The slashing protection data of the deleted
+            keys is contained in the DeleteKeysResponse objects.
+        delete_remote_keys: Responses of the DELETE /eth/v1/remotekeys batches.
+        import_keystores: Merged ImportKeystoresResponse of all imported keystores, None if no keystore was imported.
+        import_remote_keys: Responses of the POST /eth/v1/remotekeys batches.
+    """
+
+    plan: ReconcilePlan
+    delete_keys: List[Response] = attr.ib(factory=list)
+    delete_remote_keys: List[Response] = attr.ib(factory=list)
+    import_keystores: Optional[ImportKeystoresResponse] = None
+    import_remote_keys: List[Response] = attr.ib(factory=list)
+
+
+@attr.s(auto_attribs=True)
+class Reconciler:
+    """Reconciles the keys loaded by a validator client with a desired set of local keystores and remote keys.
+
+    Attributes:
+        client: The API client used to send the requests.
+        batch_size: The maximum number of pubkeys or remote keys sent in a single delete or remote key import request.
+        prune: Whether to delete keys which are loaded but not part of the desired key set. Keys moving between a
+            local keystore and a remote signer are always deleted from their current location.
+        allow_empty: Whether an empty desired key set is accepted with `prune`, which deletes all keys which are not
+            readonly.
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(timeout=60.0)
+
+        desired_local = [(keystore_str, keystore_password_str)]
+        desired_remote = [{"pubkey": "0x93247f2209abcacf57b75a51da...", "url": "https://remote.signer"}]
+
+        plan = eth_2_key_manager.reconcile.plan_sync(desired_local, desired_remote)
+        if not plan.is_empty:
+            result = eth_2_key_manager.reconcile.sync(desired_local, desired_remote, slashing_protection_str)
+        ```
+    """
+
+    client: AuthenticatedClient
+    batch_size: int = attr.ib(100, kw_only=True)
+    prune: bool = attr.ib(True, kw_only=True)
+    allow_empty: bool = attr.ib(False, kw_only=True)
+
+    def _check_desired(self, desired_local: Sequence[Tuple[str, str]], desired_remote: Sequence[Dict[str, str]]) -> None:
+        if self.prune and not self.allow_empty and not desired_local and not desired_remote:
+            raise ValueError("The desired key set is empty, pruning would delete all keys. Set allow_empty to delete them.")
+
+    def _compute_plan(
+        self,
+        list_keys_response: Response,
+        list_remote_keys_response: Response,
+        desired_local: Sequence[Tuple[str, str]],
+        desired_remote: Sequence[Dict[str, str]],
+    ) -> ReconcilePlan:
+        # the current keys are needed even if the client does not parse responses
+        list_keys = _get_parsed(client=self.client, response=list_keys_response, cls=ListKeysResponse)
+        if not isinstance(list_keys, ListKeysResponse):
+            raise KeyStateUnavailable(ListKeys(self.client).ENDPOINT, list_keys_response.status_code)
+        list_remote_keys = _get_parsed(client=self.client, response=list_remote_keys_response, cls=ListRemoteKeysResponse)
+        if not isinstance(list_remote_keys, ListRemoteKeysResponse):
+            raise KeyStateUnavailable(ListRemoteKeys(self.client).ENDPOINT, list_remote_keys_response.status_code)
+
+        current_remote = {Pubkey.intern(data_item.pubkey): data_item for data_item in list_remote_keys.data}
+        # some validator clients also list remote keys in ListKeys, those are managed through the remote key endpoints
+        current_local = {
+            pubkey: data_item
+            for pubkey, data_item in ((Pubkey.intern(data_item.validating_pubkey), data_item) for data_item in list_keys.data)
+            if pubkey not in current_remote
+        }
+
+        desired_local_pubkeys: Set[Pubkey] = set()
+        for keystore, _ in desired_local:
+            keystore_pubkey = _keystore_pubkey(keystore)
+            if keystore_pubkey is not None:
+                desired_local_pubkeys.add(Pubkey.intern(keystore_pubkey))
+        desired_remote_by_pubkey = {Pubkey.intern(remote_key["pubkey"]): remote_key for remote_key in desired_remote}
+
+        conflicting_pubkeys = desired_local_pubkeys & desired_remote_by_pubkey.keys()
+        if conflicting_pubkeys:
+            raise ValueError(f"Pubkeys must not be both local and remote: {', '.join(pubkey.hex_str for pubkey in sorted(conflicting_pubkeys))}")
+
+        plan = ReconcilePlan()
+
+        for keystore, password in desired_local:
+            keystore_pubkey = _keystore_pubkey(keystore)
+            if keystore_pubkey is None or Pubkey.intern(keystore_pubkey) not in current_local:
+                plan.import_keystores.append((keystore, password))
+
+        for pubkey, data_item in current_local.items():
+            if data_item.readonly is True:
+                continue
+            if pubkey in desired_remote_by_pubkey or (self.prune and pubkey not in desired_local_pubkeys):
+                plan.delete_keys.append(data_item.validating_pubkey)
+
+        for pubkey, remote_key in desired_remote_by_pubkey.items():
+            current_remote_key = current_remote.get(pubkey)
+            if current_remote_key is None:
+                plan.import_remote_keys.append(remote_key)
+            elif current_remote_key.readonly is not True and remote_key.get("url", current_remote_key.url) != current_remote_key.url:
+                # the remote signer url changed, the key has to be deleted and imported again
+                plan.delete_remote_keys.append(current_remote_key.pubkey)
+                plan.import_remote_keys.append(remote_key)
+
+        for pubkey, current_remote_key in current_remote.items():
+            if current_remote_key.readonly is True:
+                continue
+            if pubkey in desired_local_pubkeys or (self.prune and pubkey not in desired_remote_by_pubkey):
+                plan.delete_remote_keys.append(current_remote_key.pubkey)
+
+        return plan
+
+    def plan_sync(self, desired_local: Sequence[Tuple[str, str]], desired_remote: Sequence[Dict[str, str]]) -> ReconcilePlan:
+        """Compute the changes required to reach the desired key set without applying them (synchronous).
+
+        Args:
+            desired_local: (keystore, password) tuples of the keystores which should be loaded.
+            desired_remote: Remote keys which should be loaded, each containing a pubkey and optional remote signer url.
+
+        Raises:
+            ValueError: If a pubkey is part of both desired_local and desired_remote, or the desired key set is empty
+                while prune is set and allow_empty is not.
+            errors.KeyStateUnavailable: If the current keys cannot be listed.
+
+        Returns:
+            ReconcilePlan with the keys to import and delete.
+        """
+        self._check_desired(desired_local, desired_remote)
+        return self._compute_plan(
+            ListKeys(self.client).sync_detailed(),
+            ListRemoteKeys(self.client).sync_detailed(),
+            desired_local,
+            desired_remote,
+        )
+
+    async def plan_asyncio(self, desired_local: Sequence[Tuple[str, str]], desired_remote: Sequence[Dict[str, str]]) -> ReconcilePlan:
+        """Compute the changes required to reach the desired key set without applying them (asynchronous).
+
+        Args:
+            desired_local: (keystore, password) tuples of the keystores which should be loaded.
+            desired_remote: Remote keys which should be loaded, each containing a pubkey and optional remote signer url.
+
+        Raises:
+            ValueError: If a pubkey is part of both desired_local and desired_remote, or the desired key set is empty
+                while prune is set and allow_empty is not.
+            errors.KeyStateUnavailable: If the current keys cannot be listed.
+
+        Returns:
+            ReconcilePlan with the keys to import and delete.
+        """
+        self._check_desired(desired_local, desired_remote)
+        list_keys_response, list_remote_keys_response = await asyncio.gather(
+            ListKeys(self.client).asyncio_detailed(),
+            ListRemoteKeys(self.client).asyncio_detailed(),
+        )
+        return self._compute_plan(list_keys_response, list_remote_keys_response, desired_local, desired_remote)
+
+    def sync(
+        self,
+        desired_local: Sequence[Tuple[str, str]],
+        desired_remote: Sequence[Dict[str, str]],
+        slashing_protection_data: Union[Unset, str, SlashingProtectionIndex] = UNSET,
+    ) -> ReconcileResult:
+        """Bring the validator client in line with the desired key set (synchronous).
+
+        Args:
+            desired_local: (keystore, password) tuples of the keystores which should be loaded.
+            desired_remote: Remote keys which should be loaded, each containing a pubkey and optional remote signer url.
+            slashing_protection_data: Slashing protection data of the keystores as string or SlashingProtectionIndex.
+
+        Raises:
+            ValueError: If a pubkey is part of both desired_local and desired_remote, or the desired key set is empty
+                while prune is set and allow_empty is not.
+            errors.KeyStateUnavailable: If the current keys cannot be listed.
+            httpx.TimeoutException: If a request takes longer than Client.timeout.
+
+        Returns:
+            ReconcileResult with the executed plan and the responses of all requests sent.
+        """
+        plan = self.plan_sync(desired_local, desired_remote)
+        result = ReconcileResult(plan=plan)
+
+        for pubkeys in _batches(plan.delete_keys, self.batch_size):
+            result.delete_keys.append(DeleteKeys(self.client).sync_detailed(pubkeys=pubkeys))
+        for pubkeys in _batches(plan.delete_remote_keys, self.batch_size):
+            result.delete_remote_keys.append(DeleteRemoteKeys(self.client).sync_detailed(pubkeys=pubkeys))
+        if plan.import_keystores:
+            keystores, passwords = zip(*plan.import_keystores)
+            result.import_keystores = BulkImportKeystores(self.client).sync(keystores, passwords, slashing_protection_data)
+        for remote_keys in _batches(plan.import_remote_keys, self.batch_size):
+            result.import_remote_keys.append(ImportRemoteKeys(self.client).sync_detailed(remote_keys=remote_keys))
+
+        return result
+
+    async def asyncio(
+        self,
+        desired_local: Sequence[Tuple[str, str]],
+        desired_remote: Sequence[Dict[str, str]],
+        slashing_protection_data: Union[Unset, str, SlashingProtectionIndex] = UNSET,
+    ) -> ReconcileResult:
+        """Bring the validator client in line with the desired key set (asynchronous).
+
+        Args:
+            desired_local: (keystore, password) tuples of the keystores which should be loaded.
+            desired_remote: Remote keys which should be loaded, each containing a pubkey and optional remote signer url.
+            slashing_protection_data: Slashing protection data of the keystores as string or SlashingProtectionIndex.
+
+        Raises:
+            ValueError: If a pubkey is part of both desired_local and desired_remote, or the desired key set is empty
+                while prune is set and allow_empty is not.
+            errors.KeyStateUnavailable: If the current keys cannot be listed.
+            httpx.TimeoutException: If a request takes longer than Client.timeout.
+
+        Returns:
+            ReconcileResult with the executed plan and the responses of all requests sent.
+        """
+        plan = await self.plan_asyncio(desired_local, desired_remote)
+        result = ReconcileResult(plan=plan)
+
+        for pubkeys in _batches(plan.delete_keys, self.batch_size):
+            result.delete_keys.append(await DeleteKeys(self.client).asyncio_detailed(pubkeys=pubkeys))
+        for pubkeys in _batches(plan.delete_remote_keys, self.batch_size):
+            result.delete_remote_keys.append(await DeleteRemoteKeys(self.client).asyncio_detailed(pubkeys=pubkeys))
+        if plan.import_keystores:
+            keystores, passwords = zip(*plan.import_keystores)
+            result.import_keystores = await BulkImportKeystores(self.client).asyncio(keystores, passwords, slashing_protection_data)
+        for remote_keys in _batches(plan.import_remote_keys, self.batch_size):
+            result.import_remote_keys.append(await ImportRemoteKeys(self.client).asyncio_detailed(remote_keys=remote_keys))
+
+        return result
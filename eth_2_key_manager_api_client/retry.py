@@ -0,0 +1,191 @@
+"""
+Provides the RetryPolicy class, which repeats requests failing with transient errors.
+
+A validator client restarting, a load balancer dropping a connection or a node briefly overloaded by a bulk import
+surface as `httpx.ConnectError`, `httpx.ReadTimeout` or a 5xx response. With a RetryPolicy set on the client (the
+`retry_policy` argument of Eth2KeyManager), such requests are repeated with exponential backoff and full jitter until
+they succeed, `max_attempts` is reached or the next attempt would start after the time `budget` of the call or the
+deadline of the current scope (see timeouts.deadline).
+
+Whether a failed request is repeated depends on whether repeating it is safe:
+
+| Request                                              | Repeated on                                              |
+|------------------------------------------------------|----------------------------------------------------------|
+| GET and DELETE                                       | `retry_exceptions` and `retry_statuses`                  |
+| POST /eth/v1/keystores and POST /eth/v1/remotekeys   | `retry_exceptions` and `retry_statuses`                  |
+| Other POST requests (fee recipient, gas limit, ...)  | Errors raised before the request was sent, and 429       |
+| Streamed request bodies (`*_streaming`)              | Never, the body can't be generated again                 |
+
+Imports are safe to repeat because the Key Manager API reports keys which are already loaded as `duplicate` instead of
+importing them twice. If an import timed out after the node had loaded some of the keys, the repeated import reports
+those keys as `duplicate`.
+"""
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, Tuple, Type, Union
+
+import attr
+import httpx
+
+from eth_2_key_manager_api_client.timeouts import get_remaining
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+IDEMPOTENT_POST_ENDPOINTS = ("keystores", "remotekeys")
+
+# raised before any byte of the request was sent, so the node never saw the request
+_NOT_SENT_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@attr.s(auto_attribs=True)
+class RetryPolicy:
+    """Decides whether and when a failed request is repeated.
+
+    Attributes:
+        max_attempts: The maximum number of attempts per request, including the first one.
+        backoff: The delay in seconds before the first retry. It doubles with every further retry.
+        max_backoff: The maximum delay in seconds between two attempts.
+        jitter: Whether to draw each delay uniformly between 0 and the exponential delay ("full jitter"), which keeps
+            clients failing at the same moment from retrying in lockstep.
+        budget: The maximum number of seconds between the start of the first attempt and the start of the last
+            attempt. None for no limit.
+        retry_statuses: The response status codes which are retried.
+        retry_exceptions: The exceptions which are retried.
+        idempotent_post_endpoints: The endpoints whose POST requests are safe to repeat.
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+        from eth_2_key_manager_api_client.retry import RetryPolicy
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(retry_policy=RetryPolicy(max_attempts=5, budget=120.0))
+        response = eth_2_key_manager.bulk_import_keystores.sync(keystores, passwords)
+        ```
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 10.0
+    jitter: bool = True
+    budget: Optional[float] = 60.0
+    retry_statuses: FrozenSet[int] = RETRY_STATUSES
+    retry_exceptions: Tuple[Type[Exception], ...] = RETRY_EXCEPTIONS
+    idempotent_post_endpoints: Tuple[str, ...] = IDEMPOTENT_POST_ENDPOINTS
+
+    def is_idempotent(self, kwargs: Dict[str, Any]) -> bool:
+        """Whether the request may be repeated after the node may have processed it.
+
+        Args:
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+        """
+        if kwargs["method"] in ("GET", "HEAD", "DELETE", "PUT"):
+            return True
+        path = httpx.URL(kwargs["url"]).path
+        return kwargs["method"] == "POST" and any(path.endswith(f"/eth/v1/{endpoint}") for endpoint in self.idempotent_post_endpoints)
+
+    def is_retryable(self, kwargs: Dict[str, Any], outcome: Union[httpx.Response, Exception]) -> bool:
+        """Whether a request with the given outcome is repeated, not taking attempts and budget into account.
+
+        Args:
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+            outcome: The HTTP response or the exception raised by the attempt.
+        """
+        if not isinstance(kwargs.get("content"), (bytes, type(None))):
+            return False
+        if isinstance(outcome, httpx.Response):
+            if outcome.status_code not in self.retry_statuses:
+                return False
+            # 429 means the node rejected the request without processing it
+            return outcome.status_code == httpx.codes.TOO_MANY_REQUESTS or self.is_idempotent(kwargs)
+        if isinstance(outcome, _NOT_SENT_EXCEPTIONS):
+            return True
+        return isinstance(outcome, self.retry_exceptions) and self.is_idempotent(kwargs)
+
+    def get_delay(self, attempt: int, outcome: Union[httpx.Response, Exception]) -> float:
+        """Returns the number of seconds to wait before the next attempt.
+
+        A `Retry-After` header (in seconds) of the response is honoured, up to `max_backoff`.
+
+        Args:
+            attempt: The number of the failed attempt, starting at 1.
+            outcome: The HTTP response or the exception raised by the attempt.
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if isinstance(outcome, httpx.Response):
+            retry_after = outcome.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), self.max_backoff))
+        return delay
+
+    def _next_delay(self, kwargs: Dict[str, Any], attempt: int, outcome: Union[httpx.Response, Exception], start: float) -> Optional[float]:
+        """Returns the delay before the next attempt, or None if the outcome is final."""
+        if attempt >= self.max_attempts or not self.is_retryable(kwargs, outcome):
+            return None
+        delay = self.get_delay(attempt, outcome)
+        if self.budget is not None and time.monotonic() + delay - start > self.budget:
+            return None
+        remaining = get_remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
+
+    def send(self, kwargs: Dict[str, Any], send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Sends a request, repeating it as long as the policy allows.
+
+        Args:
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+            send: Sends the request and returns the HTTP response.
+
+        Raises:
+            httpx.HTTPError: The exception raised by the last attempt.
+
+        Returns:
+            The HTTP response of the last attempt.
+        """
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            outcome: Union[httpx.Response, Exception]
+            try:
+                outcome = send()
+            except Exception as e:
+                outcome = e
+            delay = self._next_delay(kwargs, attempt, outcome, start)
+            if delay is None:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+            time.sleep(delay)
+            attempt += 1
+
+    async def asend(self, kwargs: Dict[str, Any], send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Sends a request asynchronously, repeating it as long as the policy allows.
+
+        Args:
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+            send: Sends the request and returns the HTTP response.
+
+        Raises:
+            httpx.HTTPError: The exception raised by the last attempt.
+
+        Returns:
+            The HTTP response of the last attempt.
+        """
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            outcome: Union[httpx.Response, Exception]
+            try:
+                outcome = await send()
+            except Exception as e:
+                outcome = e
+            delay = self._next_delay(kwargs, attempt, outcome, start)
+            if delay is None:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,85 @@
+"""
+Provides the SingleFlight class, which merges concurrent identical GET requests into a single HTTP request.
+
+Dashboards refreshing many panels at once and controllers fanning out over the same pubkeys issue the same read, e.g.
+`ListKeys.asyncio()` or `ListFeeRecipient.asyncio(pubkey)`, from many coroutines at the same moment. With SingleFlight
+enabled (`single_flight=True` on Eth2KeyManager), the first coroutine sends the request and every coroutine asking for
+the same (base_url, method, endpoint) while it is in flight awaits the same request. All of them receive the same
+`Response` object, so the body is also parsed only once. When the list cache is enabled as well, later cache hits of
+the response also receive that object.
+
+Only asynchronous GET requests are merged; writes are never merged and a request started after the previous one
+completed is always sent. Callers sharing a Response must not mutate its parsed models.
+
+A caller which is cancelled does not cancel the shared request for the others.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+import attr
+import httpx
+
+SHARED_RESPONSES_EXTENSION = "eth_2_key_manager_api_client.shared_responses"
+
+
+@attr.s(auto_attribs=True)
+class SingleFlight:
+    """Keeps track of the GET requests in flight of a single client.
+
+    Attributes:
+        requests: The number of HTTP requests sent.
+        shared: The number of calls which awaited a request already in flight instead of sending their own.
+
+    Typical usage example:
+        ```python
+        import asyncio
+
+        import eth_2_key_manager_api_client
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(single_flight=True)
+        responses = await asyncio.gather(*(eth_2_key_manager.list_keys.asyncio_detailed() for _ in range(10)))
+
+        assert all(response is responses[0] for response in responses)
+        print(eth_2_key_manager.client.single_flight.shared)  # 9
+        ```
+    """
+
+    requests: int = attr.ib(init=False, default=0)
+    shared: int = attr.ib(init=False, default=0)
+    _in_flight: Dict[Tuple[str, str], "asyncio.Future[httpx.Response]"] = attr.ib(init=False, factory=dict, repr=False, eq=False)
+
+    async def run(self, kwargs: Dict[str, Any], send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Sends a request, or awaits the identical request already in flight.
+
+        Args:
+            kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+            send: Sends the request and returns the HTTP response.
+
+        Returns:
+            The HTTP response, shared by all concurrent identical calls.
+        """
+        key = (kwargs["method"], str(kwargs["url"]))
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._send(send))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done_task: self._done(key, done_task))
+            self.requests += 1
+        else:
+            self.shared += 1
+        # shielded: cancelling one caller must not cancel the request the others are waiting for
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _send(send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        response = await send()
+        # _build_response reuses the Response built for the first caller
+        response.extensions[SHARED_RESPONSES_EXTENSION] = {}
+        return response
+
+    def _done(self, key: Tuple[str, str], task: "asyncio.Future[httpx.Response]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # mark the exception as retrieved in case every caller was cancelled
+            task.exception()
@@ -0,0 +1,259 @@
+"""
+Provides helpers for working with slashing protection data in the EIP-3076 Slashing Protection Interchange Format.
+
+Refer to the specification: https://eips.ethereum.org/EIPS/eip-3076
+"""
+import json
+import os
+from types import TracebackType
+from typing import IO, Any, Dict, Iterable, List, Optional, Type, Union
+
+import attr
+
+from eth_2_key_manager_api_client.errors import InterchangeMismatch
+from eth_2_key_manager_api_client.models.delete_keys_response import DeleteKeysResponse
+from eth_2_key_manager_api_client.pubkey import Pubkey
+
+
+def _minimize_record(pubkey: Pubkey, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merges all records of a pubkey into a single record with the highest block slot and attestation epochs."""
+    signed_blocks = [signed_block for record in records for signed_block in record.get("signed_blocks", [])]
+    signed_attestations = [signed_attestation for record in records for signed_attestation in record.get("signed_attestations", [])]
+
+    minimal_record: Dict[str, Any] = {"pubkey": pubkey.hex_str, "signed_blocks": [], "signed_attestations": []}
+
+    if signed_blocks:
+        minimal_record["signed_blocks"] = [max(signed_blocks, key=lambda signed_block: int(signed_block["slot"]))]
+
+    if signed_attestations:
+        max_source_epoch = max(int(signed_attestation["source_epoch"]) for signed_attestation in signed_attestations)
+        max_target_epoch = max(int(signed_attestation["target_epoch"]) for signed_attestation in signed_attestations)
+        for signed_attestation in signed_attestations:
+            if int(signed_attestation["source_epoch"]) == max_source_epoch and int(signed_attestation["target_epoch"]) == max_target_epoch:
+                # a single attestation holds both maxima, keep it together with its signing root
+                minimal_record["signed_attestations"] = [signed_attestation]
+                break
+        else:
+            minimal_record["signed_attestations"] = [{"source_epoch": str(max_source_epoch), "target_epoch": str(max_target_epoch)}]
+
+    return minimal_record
+
+
+def minimize_slashing_protection(slashing_protection: str) -> str:
+    """Converts an EIP-3076 interchange document into its minimal form.
+
+    The minimal form keeps one record per pubkey containing only the signed block with the highest slot and a single
+    attestation with the highest source and target epochs. This is sufficient for a validator client to refuse to
+    sign anything slashable, while shrinking the document of a long running validator by orders of magnitude.
+    Pass the result as `slashing_protection_data` to ImportKeystores.
+
+    Args:
+        slashing_protection: JSON serialised EIP-3076 interchange document.
+
+    Raises:
+        ValueError: If the document is not valid JSON or does not follow the interchange format.
+
+    Returns:
+        JSON serialised minimal EIP-3076 interchange document.
+    """
+    try:
+        document = json.loads(slashing_protection)
+        records: Dict[Pubkey, List[Dict[str, Any]]] = {}
+        for record in document["data"]:
+            records.setdefault(Pubkey.intern(record["pubkey"]), []).append(record)
+        data = [_minimize_record(pubkey, pubkey_records) for pubkey, pubkey_records in records.items()]
+        metadata = document["metadata"]
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid slashing protection interchange document: {e!r}") from e
+
+    return json.dumps({"metadata": metadata, "data": data}, separators=(",", ":"))
+
+
+@attr.s(auto_attribs=True)
+class SlashingProtectionIndex:
+    """An EIP-3076 interchange document indexed by pubkey.
+
+    The document is parsed once and every record is serialised once. Subsets containing only the records of the
+    requested pubkeys are assembled from the serialised records on demand, which makes it cheap to send each chunk of
+    a bulk import only the slashing protection data of the chunk's keystores.
+
+    Attributes:
+        metadata: The metadata object of the interchange document.
+        records: Serialised `data` records keyed by pubkey.
+
+    Typical usage example:
+        ```python
+        from eth_2_key_manager_api_client.slashing_protection import SlashingProtectionIndex
+
+        with open("slashing_protection_db.json", "r") as f:
+            slashing_protection_index = SlashingProtectionIndex.from_str(f.read())
+
+        slashing_protection_str = slashing_protection_index.subset(["0x99c4c42fac7d...", "0x876a9a7fadb5..."])
+        ```
+    """
+
+    metadata: Dict[str, Any]
+    records: Dict[Pubkey, List[str]] = attr.ib(factory=dict)
+
+    @classmethod
+    def from_str(cls, interchange: str) -> "SlashingProtectionIndex":
+        """Parses and indexes an interchange document.
+
+        Args:
+            interchange: JSON serialised EIP-3076 interchange document.
+
+        Raises:
+            ValueError: If the document is not valid JSON or does not follow the interchange format.
+
+        Returns:
+            SlashingProtectionIndex of the document.
+        """
+        try:
+            document = json.loads(interchange)
+            slashing_protection_index = cls(metadata=document["metadata"])
+            for record in document["data"]:
+                slashing_protection_index.add(record)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid slashing protection interchange document: {e!r}") from e
+        return slashing_protection_index
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Adds a `data` record of an interchange document to the index."""
+        self.records.setdefault(Pubkey.intern(record["pubkey"]), []).append(json.dumps(record, separators=(",", ":")))
+
+    @property
+    def pubkeys(self) -> List[str]:
+        """The pubkeys of all records in the index, lower case with 0x prefix."""
+        return [pubkey.hex_str for pubkey in self.records]
+
+    def __contains__(self, pubkey: Union[str, Pubkey]) -> bool:
+        try:
+            return Pubkey(pubkey) in self.records
+        except ValueError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def subset(self, pubkeys: Iterable[Union[str, Pubkey]]) -> str:
+        """Serialises an interchange document containing only the records of the given pubkeys.
+
+        Args:
+            pubkeys: Pubkey instances or hex encoded pubkeys, case insensitive, with or without 0x prefix. Pubkeys
+                without records and invalid pubkeys are ignored.
+
+        Returns:
+            JSON serialised EIP-3076 interchange document.
+        """
+        requested_pubkeys: Dict[Pubkey, None] = {}
+        for pubkey in pubkeys:
+            try:
+                requested_pubkeys[Pubkey.intern(pubkey)] = None
+            except ValueError:
+                continue
+        data = [record for pubkey in requested_pubkeys for record in self.records.get(pubkey, [])]
+        return f'{{"metadata":{json.dumps(self.metadata, separators=(",", ":"))},"data":[{",".join(data)}]}}'
+
+    def to_str(self) -> str:
+        """Serialises the whole interchange document."""
+        return self.subset(self.records)
+
+
+@attr.s(auto_attribs=True)
+class InterchangeMerger:
+    """Merges EIP-3076 interchange documents into a single document on disk, one document at a time.
+
+    Intended for collecting the `slashing_protection` of many DeleteKeysResponse batches when offboarding keys. The
+    `data` records of each added document are appended to the output file straight away, so only one document is held
+    in memory at a time. All documents must have the same `genesis_validators_root` and `interchange_format_version`.
+
+    The output file is created when the first document is added and completed when the merger is closed. If no
+    document is added the file is not created.
+
+    Attributes:
+        path: The path of the output file.
+        metadata: The metadata of the merged document, None until the first document is added.
+        record_count: The number of `data` records written so far.
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+        from eth_2_key_manager_api_client.slashing_protection import InterchangeMerger
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager()
+
+        with InterchangeMerger("slashing_protection_db.json") as merger:
+            for batch in pubkey_batches:
+                merger.add(eth_2_key_manager.delete_keys.sync(pubkeys=batch))
+        ```
+    """
+
+    path: Union[str, "os.PathLike[str]"]
+    metadata: Optional[Dict[str, Any]] = attr.ib(init=False, default=None)
+    record_count: int = attr.ib(init=False, default=0)
+    _file: Optional[IO[str]] = attr.ib(init=False, default=None, repr=False, eq=False)
+    _closed: bool = attr.ib(init=False, default=False, repr=False, eq=False)
+
+    def add(self, slashing_protection: Union[str, DeleteKeysResponse]) -> int:
+        """Appends the records of an interchange document to the output file.
+
+        Args:
+            slashing_protection: JSON serialised EIP-3076 interchange document or a DeleteKeysResponse.
+
+        Raises:
+            ValueError: If the merger is closed, or the document is not valid JSON or does not follow the interchange format.
+            errors.InterchangeMismatch: If the document belongs to a different chain or format than the previous documents.
+
+        Returns:
+            The number of records appended.
+        """
+        if self._closed:
+            raise ValueError("InterchangeMerger is closed")
+        if isinstance(slashing_protection, DeleteKeysResponse):
+            slashing_protection = slashing_protection.slashing_protection
+
+        try:
+            document = json.loads(slashing_protection)
+            metadata, data = document["metadata"], document["data"]
+            if not isinstance(data, list):
+                raise TypeError("data must be a list")
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid slashing protection interchange document: {e!r}") from e
+
+        if self.metadata is None:
+            self.metadata = metadata
+        else:
+            for field in ("genesis_validators_root", "interchange_format_version"):
+                if metadata.get(field) != self.metadata.get(field):
+                    raise InterchangeMismatch(field, str(self.metadata.get(field)), str(metadata.get(field)))
+
+        if self._file is None:
+            self._file = open(self.path, "w")
+            self._file.write(f'{{"metadata":{json.dumps(self.metadata, separators=(",", ":"))},"data":[')
+
+        for record in data:
+            if self.record_count:
+                self._file.write(",")
+            self._file.write(json.dumps(record, separators=(",", ":")))
+            self.record_count += 1
+
+        return len(data)
+
+    def close(self) -> None:
+        """Completes the merged document and closes the output file."""
+        self._closed = True
+        if self._file is not None:
+            self._file.write("]}")
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "InterchangeMerger":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,426 @@
+"""
+Provides endpoint classes which stream POST /eth/v1/keystores and POST /eth/v1/remotekeys request bodies.
+
+ImportKeystores and ImportRemoteKeys build the whole request body in memory before it is sent. The classes of this
+module generate the body piece by piece while httpx sends it with chunked transfer encoding instead: keystores are read
+from disk one file at a time and each piece is released once it has been written to the connection, so the memory
+used by the client stays flat no matter how many keystores go into one request.
+
+| Class                     | Streams the body of                    |
+|---------------------------|----------------------------------------|
+| StreamingImportKeystores  | ImportKeystores (keystores read from files) |
+| StreamingImportRemoteKeys | ImportRemoteKeys (remote keys from any iterable) |
+
+Streamed bodies can't be replayed, so a streamed request which fails must be restarted from the source files.
+"""
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import attr
+
+from eth_2_key_manager_api_client.client import AuthenticatedClient
+from eth_2_key_manager_api_client.helpers import _asend_request, _build_response, _get_kwargs, _send_request
+from eth_2_key_manager_api_client.json_codec import JSONCodec
+from eth_2_key_manager_api_client.models.error_response import ErrorResponse
+from eth_2_key_manager_api_client.models.import_keystores_response import ImportKeystoresResponse
+from eth_2_key_manager_api_client.models.import_remote_keys_json_body_remote_keys_item import (
+    ImportRemoteKeysJsonBodyRemoteKeysItem,
+)
+from eth_2_key_manager_api_client.models.import_remote_keys_response import ImportRemoteKeysResponse
+from eth_2_key_manager_api_client.types import UNSET, Response, Unset
+
+KeystoreFile = Union[str, "os.PathLike[str]"]
+
+_LENGTH_MISMATCH = "keystore_files and passwords must have the same length"
+
+
+def _read_keystore(keystore_file: KeystoreFile) -> str:
+    return Path(keystore_file).read_text(encoding="utf-8")
+
+
+def _pair(keystore_files: Iterable[KeystoreFile], passwords: Iterable[str]) -> Iterator[Tuple[KeystoreFile, str]]:
+    keystore_file_iterator, password_iterator = iter(keystore_files), iter(passwords)
+    for keystore_file in keystore_file_iterator:
+        password = next(password_iterator, None)
+        if password is None:
+            raise ValueError(_LENGTH_MISMATCH)
+        yield keystore_file, password
+    if next(password_iterator, None) is not None:
+        raise ValueError(_LENGTH_MISMATCH)
+
+
+def _import_keystores_body_tail(json_codec: JSONCodec, passwords: List[str], slashing_protection_data: Union[Unset, str]) -> bytes:
+    tail = b'],"passwords":' + json_codec.dumps(passwords)
+    if isinstance(slashing_protection_data, str):
+        tail += b',"slashing_protection":' + json_codec.dumps(slashing_protection_data)
+    return tail + b"}"
+
+
+def iter_import_keystores_body(
+    json_codec: JSONCodec,
+    keystore_files: Iterable[KeystoreFile],
+    passwords: Iterable[str],
+    slashing_protection_data: Union[Unset, str] = UNSET,
+) -> Iterator[bytes]:
+    """Generates the body of a POST /eth/v1/keystores request, reading one keystore file at a time.
+
+    Only the passwords are kept until the end of the body, the keystores are released once they have been yielded.
+
+    Args:
+        json_codec: The JSON codec used to encode the body.
+        keystore_files: Paths of the keystore files to import.
+        passwords: Passwords to unlock the keystores. `passwords[i]` must unlock the keystore in `keystore_files[i]`.
+        slashing_protection_data: Slashing protection data as string.
+
+    Raises:
+        ValueError: If keystore_files and passwords have different lengths. Raised when the mismatch is reached.
+        OSError: If a keystore file can't be read.
+
+    Yields:
+        The UTF-8 encoded pieces of the JSON request body.
+    """
+    collected_passwords: List[str] = []
+    separator = b'{"keystores":['
+    for keystore_file, password in _pair(keystore_files, passwords):
+        collected_passwords.append(password)
+        yield separator + json_codec.dumps(_read_keystore(keystore_file))
+        separator = b","
+    if not collected_passwords:
+        yield separator
+    yield _import_keystores_body_tail(json_codec, collected_passwords, slashing_protection_data)
+
+
+async def aiter_import_keystores_body(
+    json_codec: JSONCodec,
+    keystore_files: Iterable[KeystoreFile],
+    passwords: Iterable[str],
+    slashing_protection_data: Union[Unset, str] = UNSET,
+) -> AsyncIterator[bytes]:
+    """Generates the body of a POST /eth/v1/keystores request, reading one keystore file at a time in a worker thread.
+
+    Args:
+        json_codec: The JSON codec used to encode the body.
+        keystore_files: Paths of the keystore files to import.
+        passwords: Passwords to unlock the keystores. `passwords[i]` must unlock the keystore in `keystore_files[i]`.
+        slashing_protection_data: Slashing protection data as string.
+
+    Raises:
+        ValueError: If keystore_files and passwords have different lengths. Raised when the mismatch is reached.
+        OSError: If a keystore file can't be read.
+
+    Yields:
+        The UTF-8 encoded pieces of the JSON request body.
+    """
+    collected_passwords: List[str] = []
+    separator = b'{"keystores":['
+    for keystore_file, password in _pair(keystore_files, passwords):
+        collected_passwords.append(password)
+        yield separator + json_codec.dumps(await asyncio.to_thread(_read_keystore, keystore_file))
+        separator = b","
+    if not collected_passwords:
+        yield separator
+    yield _import_keystores_body_tail(json_codec, collected_passwords, slashing_protection_data)
+
+
+def _encode_remote_key(json_codec: JSONCodec, remote_key: Dict) -> bytes:
+    return json_codec.dumps(ImportRemoteKeysJsonBodyRemoteKeysItem.from_dict(remote_key).to_dict())
+
+
+def iter_import_remote_keys_body(json_codec: JSONCodec, remote_keys: Iterable[Dict]) -> Iterator[bytes]:
+    """Generates the body of a POST /eth/v1/remotekeys request, encoding one remote key at a time.
+
+    Args:
+        json_codec: The JSON codec used to encode the body.
+        remote_keys: Remote keys to import. Each item must contain a pubkey and optional remote signer url.
+
+    Yields:
+        The UTF-8 encoded pieces of the JSON request body.
+    """
+    separator = b'{"remote_keys":['
+    for remote_key in remote_keys:
+        yield separator + _encode_remote_key(json_codec, remote_key)
+        separator = b","
+    yield b"]}" if separator == b"," else separator + b"]}"
+
+
+async def aiter_import_remote_keys_body(json_codec: JSONCodec, remote_keys: Union[Iterable[Dict], AsyncIterable[Dict]]) -> AsyncIterator[bytes]:
+    """Generates the body of a POST /eth/v1/remotekeys request, encoding one remote key at a time.
+
+    Args:
+        json_codec: The JSON codec used to encode the body.
+        remote_keys: Remote keys to import, as iterable or async iterable. Each item must contain a pubkey and optional
+            remote signer url.
+
+    Yields:
+        The UTF-8 encoded pieces of the JSON request body.
+    """
+    if not isinstance(remote_keys, AsyncIterable):
+        for piece in iter_import_remote_keys_body(json_codec, remote_keys):
+            yield piece
+        return
+
+    separator = b'{"remote_keys":['
+    async for remote_key in remote_keys:
+        yield separator + _encode_remote_key(json_codec, remote_key)
+        separator = b","
+    yield b"]}" if separator == b"," else separator + b"]}"
+
+
+@attr.s(auto_attribs=True)
+class StreamingImportKeystores:
+    """Contains methods for accessing the POST method of the /eth/v1/keystores endpoint with a streamed request body.
+
+    The endpoint returns the following HTTP status code if successful:
+        - 200: OK
+
+    Typical usage example:
+        ```python
+        from pathlib import Path
+
+        import eth_2_key_manager_api_client
+
+        keystore_files = sorted(Path("validator_keys").glob("keystore-*.json"))
+        passwords = ["validatorkey123"] * len(keystore_files)
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(timeout=600.0)
+        response = eth_2_key_manager.import_keystores_streaming.sync_detailed(keystore_files, passwords)
+
+        if response.status_code == 200:
+            print("Keystores imported successfully")
+        ```
+    """
+
+    client: AuthenticatedClient
+    ENDPOINT: str = "keystores"
+    METHOD: str = "POST"
+
+    def sync_detailed(
+        self,
+        keystore_files: Iterable[KeystoreFile],
+        passwords: Iterable[str],
+        slashing_protection_data: Union[Unset, str] = UNSET,
+    ) -> Response[Union[ImportKeystoresResponse, ErrorResponse]]:
+        """Import Keystores from files with a streamed request body (synchronous).
+
+        Args:
+            keystore_files: Paths of the keystore files to import.
+            passwords: Passwords to unlock the keystores. `passwords[i]` must unlock the keystore in `keystore_files[i]`.
+            slashing_protection_data: Slashing protection data as string.
+
+        Raises:
+            ValueError: If keystore_files and passwords have different lengths. The request is aborted.
+            OSError: If a keystore file can't be read. The request is aborted.
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Response object containing the response from the server, response headers, status code and ImportKeystoresResponse object if the request succeeds, otherwise an ErrorResponse object.
+        """
+
+        kwargs = _get_kwargs(
+            client=self.client,
+            endpoint=self.ENDPOINT,
+            method=self.METHOD,
+            content=iter_import_keystores_body(self.client.json_codec, keystore_files, passwords, slashing_protection_data),
+        )
+
+        response = _send_request(client=self.client, kwargs=kwargs)
+
+        return _build_response(client=self.client, response=response, cls=ImportKeystoresResponse)
+
+    def sync(
+        self,
+        keystore_files: Iterable[KeystoreFile],
+        passwords: Iterable[str],
+        slashing_protection_data: Union[Unset, str] = UNSET,
+    ) -> Optional[Union[ImportKeystoresResponse, ErrorResponse]]:
+        """Import Keystores from files with a streamed request body (synchronous).
+
+        Args:
+            keystore_files: Paths of the keystore files to import.
+            passwords: Passwords to unlock the keystores. `passwords[i]` must unlock the keystore in `keystore_files[i]`.
+            slashing_protection_data: Slashing protection data as string.
+
+        Raises:
+            ValueError: If keystore_files and passwords have different lengths. The request is aborted.
+            OSError: If a keystore file can't be read. The request is aborted.
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Parsed response from the server. ImportKeystoresResponse if the request succeeds, otherwise ErrorResponse.
+        """
+        return self.sync_detailed(keystore_files, passwords, slashing_protection_data).parsed
+
+    async def asyncio_detailed(
+        self,
+        keystore_files: Iterable[KeystoreFile],
+        passwords: Iterable[str],
+        slashing_protection_data: Union[Unset, str] = UNSET,
+    ) -> Response[Union[ImportKeystoresResponse, ErrorResponse]]:
+        """Import Keystores from files with a streamed request body (asynchronous).
+
+        Keystore files are read in a worker thread, so reading them never blocks the event loop.
+
+        Args:
+            keystore_files: Paths of the keystore files to import.
+            passwords: Passwords to unlock the keystores. `passwords[i]` must unlock the keystore in `keystore_files[i]`.
+            slashing_protection_data: Slashing protection data as string.
+
+        Raises:
+            ValueError: If keystore_files and passwords have different lengths. The request is aborted.
+            OSError: If a keystore file can't be read. The request is aborted.
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Response object containing the response from the server, response headers, status code and ImportKeystoresResponse object if the request succeeds, otherwise an ErrorResponse object.
+        """
+
+        kwargs = _get_kwargs(
+            client=self.client,
+            endpoint=self.ENDPOINT,
+            method=self.METHOD,
+            content=aiter_import_keystores_body(self.client.json_codec, keystore_files, passwords, slashing_protection_data),
+        )
+
+        response = await _asend_request(client=self.client, kwargs=kwargs)
+
+        return _build_response(client=self.client, response=response, cls=ImportKeystoresResponse)
+
+    async def asyncio(
+        self,
+        keystore_files: Iterable[KeystoreFile],
+        passwords: Iterable[str],
+        slashing_protection_data: Union[Unset, str] = UNSET,
+    ) -> Optional[Union[ImportKeystoresResponse, ErrorResponse]]:
+        """Import Keystores from files with a streamed request body (asynchronous).
+
+        Args:
+            keystore_files: Paths of the keystore files to import.
+            passwords: Passwords to unlock the keystores. `passwords[i]` must unlock the keystore in `keystore_files[i]`.
+            slashing_protection_data: Slashing protection data as string.
+
+        Raises:
+            ValueError: If keystore_files and passwords have different lengths. The request is aborted.
+            OSError: If a keystore file can't be read. The request is aborted.
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Parsed response from the server. ImportKeystoresResponse if the request succeeds, otherwise ErrorResponse.
+        """
+        return (await self.asyncio_detailed(keystore_files, passwords, slashing_protection_data)).parsed
+
+
+@attr.s(auto_attribs=True)
+class StreamingImportRemoteKeys:
+    """Contains methods for accessing the POST method of the /eth/v1/remotekeys endpoint with a streamed request body.
+
+    The endpoint returns the following HTTP status code if successful:
+        - 200: OK
+
+    Typical usage example:
+        ```python
+        import eth_2_key_manager_api_client
+
+        def remote_keys():
+            with open("pubkeys.txt") as pubkeys_file:
+                for line in pubkeys_file:
+                    yield {"pubkey": line.strip(), "url": "https://remote.signer"}
+
+        eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager()
+        response = eth_2_key_manager.import_remote_keys_streaming.sync_detailed(remote_keys())
+
+        if response.status_code == 200:
+            print("Remote keys imported successfully")
+        ```
+    """
+
+    client: AuthenticatedClient
+    ENDPOINT: str = "remotekeys"
+    METHOD: str = "POST"
+
+    def sync_detailed(self, remote_keys: Iterable[Dict]) -> Response[Union[ImportRemoteKeysResponse, ErrorResponse]]:
+        """Import Remote Keys with a streamed request body (synchronous).
+
+        Args:
+            remote_keys: Remote keys to import. Each item must contain a pubkey and optional remote signer url.
+
+        Raises:
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Response object containing the response from the server, response headers, status code and ImportRemoteKeysResponse object if the request succeeds, otherwise an ErrorResponse object.
+        """
+
+        kwargs = _get_kwargs(
+            client=self.client,
+            endpoint=self.ENDPOINT,
+            method=self.METHOD,
+            content=iter_import_remote_keys_body(self.client.json_codec, remote_keys),
+        )
+
+        response = _send_request(client=self.client, kwargs=kwargs)
+
+        return _build_response(client=self.client, response=response, cls=ImportRemoteKeysResponse)
+
+    def sync(self, remote_keys: Iterable[Dict]) -> Optional[Union[ImportRemoteKeysResponse, ErrorResponse]]:
+        """Import Remote Keys with a streamed request body (synchronous).
+
+        Args:
+            remote_keys: Remote keys to import. Each item must contain a pubkey and optional remote signer url.
+
+        Raises:
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Parsed response from the server. ImportRemoteKeysResponse if the request succeeds, otherwise ErrorResponse.
+        """
+        return self.sync_detailed(remote_keys).parsed
+
+    async def asyncio_detailed(self, remote_keys: Union[Iterable[Dict], AsyncIterable[Dict]]) -> Response[Union[ImportRemoteKeysResponse, ErrorResponse]]:
+        """Import Remote Keys with a streamed request body (asynchronous).
+
+        Args:
+            remote_keys: Remote keys to import, as iterable or async iterable. Each item must contain a pubkey and
+                optional remote signer url.
+
+        Raises:
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Response object containing the response from the server, response headers, status code and ImportRemoteKeysResponse object if the request succeeds, otherwise an ErrorResponse object.
+        """
+
+        kwargs = _get_kwargs(
+            client=self.client,
+            endpoint=self.ENDPOINT,
+            method=self.METHOD,
+            content=aiter_import_remote_keys_body(self.client.json_codec, remote_keys),
+        )
+
+        response = await _asend_request(client=self.client, kwargs=kwargs)
+
+        return _build_response(client=self.client, response=response, cls=ImportRemoteKeysResponse)
+
+    async def asyncio(self, remote_keys: Union[Iterable[Dict], AsyncIterable[Dict]]) -> Optional[Union[ImportRemoteKeysResponse, ErrorResponse]]:
+        """Import Remote Keys with a streamed request body (asynchronous).
+
+        Args:
+            remote_keys: Remote keys to import, as iterable or async iterable. Each item must contain a pubkey and
+                optional remote signer url.
+
+        Raises:
+            errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+        Returns:
+            Parsed response from the server. ImportRemoteKeysResponse if the request succeeds, otherwise ErrorResponse.
+        """
+        return (await self.asyncio_detailed(remote_keys)).parsed
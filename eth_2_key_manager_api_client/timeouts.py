@@ -0,0 +1,157 @@
+"""
+Provides per-endpoint class timeout defaults and per-call deadlines.
+
+`Client.timeout` accepts a float, applied to every phase of a request, or an `httpx.Timeout` with separate connect, read,
+write and pool timeouts. `Client.endpoint_timeouts` overrides it for single endpoint classes (see the endpoints module
+for the names). Eth2KeyManager uses `default_endpoint_timeouts`, which keeps the connect and pool timeouts of all
+requests short, so dead hosts are detected quickly, but allows ImportKeystores requests to upload and decrypt their
+keystores for up to `IMPORT_TIMEOUT` seconds:
+
+```python
+import httpx
+
+import eth_2_key_manager_api_client
+
+eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(
+    timeout=httpx.Timeout(10.0, connect=2.0),
+    endpoint_timeouts={"ImportKeystores": httpx.Timeout(600.0, connect=2.0), "DeleteKeys": 60.0},
+)
+```
+
+`deadline` bounds the total time of everything sent in its scope, across retries, chunks of bulk imports and
+endpoints. No attempt starts after the deadline, every request's timeouts are capped to the time remaining, and
+retries which would start after the deadline are not made. asyncio requests, including their wait for rate limiter
+tokens and concurrency limiter slots, are cancelled once the deadline passes. Requests which can't be completed in
+time raise `errors.DeadlineExceeded`:
+
+```python
+from eth_2_key_manager_api_client.timeouts import deadline
+
+with deadline(30.0):
+    response = eth_2_key_manager.bulk_import_keystores.sync(keystores, passwords)
+```
+
+Synchronous requests can't be cancelled, so for them the deadline is best-effort: httpx applies the capped timeouts to
+each phase of the request separately, e.g. the read timeout to every read from the socket, so a node sending a large
+response slowly can keep a request running past the deadline.
+
+The deadline is kept in a context variable, so it applies to the current thread or asyncio task and to the tasks it
+creates. Requests shared with other callers (see the single_flight and coalescer modules) are bound by the deadline of
+the caller which started them.
+"""
+import asyncio
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Dict, Iterator, Optional, TypeVar, Union
+
+import httpx
+
+from eth_2_key_manager_api_client.errors import DeadlineExceeded
+
+IMPORT_TIMEOUT = 300.0
+
+T = TypeVar("T")
+
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("eth_2_key_manager_api_client_deadline", default=None)
+
+
+def default_endpoint_timeouts(timeout: Union[float, httpx.Timeout]) -> Dict[str, Union[float, httpx.Timeout]]:
+    """Returns the default endpoint_timeouts of Eth2KeyManager for a client timeout.
+
+    Args:
+        timeout: The timeout of the client.
+
+    Returns:
+        A timeout for ImportKeystores with the connect and pool timeouts of the client and read and write timeouts of at
+        least IMPORT_TIMEOUT seconds.
+    """
+    base = httpx.Timeout(timeout)
+    read = None if base.read is None else max(base.read, IMPORT_TIMEOUT)
+    write = None if base.write is None else max(base.write, IMPORT_TIMEOUT)
+    return {"ImportKeystores": httpx.Timeout(connect=base.connect, read=read, write=write, pool=base.pool)}
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Sets a deadline for all requests sent in the scope of the context manager.
+
+    Nested deadlines can only shorten the deadline of the enclosing scope.
+
+    Args:
+        seconds: The number of seconds from now until the deadline.
+    """
+    current = _DEADLINE.get()
+    new = time.monotonic() + seconds
+    token = _DEADLINE.set(new if current is None else min(current, new))
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def get_remaining() -> Optional[float]:
+    """Returns the number of seconds until the deadline of the current scope, None if there is no deadline."""
+    current = _DEADLINE.get()
+    return None if current is None else current - time.monotonic()
+
+
+def check_deadline() -> None:
+    """Raises errors.DeadlineExceeded if the deadline of the current scope has passed."""
+    remaining = get_remaining()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded(-remaining)
+
+
+def apply_deadline(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Caps the timeouts of a request to the time remaining until the deadline of the current scope.
+
+    This is best-effort: httpx applies each timeout to a single phase of the request, e.g. the read timeout to every
+    read from the socket, so it does not bound the total time of the request. asyncio requests are additionally
+    wrapped in `wait_for_deadline`.
+
+    Args:
+        kwargs: The keyword arguments for the HTTP request as returned by _get_kwargs.
+
+    Raises:
+        errors.DeadlineExceeded: If the deadline has passed.
+
+    Returns:
+        The keyword arguments with the capped timeout, or kwargs itself if there is no deadline.
+    """
+    remaining = get_remaining()
+    if remaining is None:
+        return kwargs
+    if remaining <= 0:
+        raise DeadlineExceeded(-remaining)
+
+    timeout = httpx.Timeout(kwargs.get("timeout"))
+
+    def cap(value: Optional[float]) -> float:
+        return remaining if value is None else min(value, remaining)
+
+    return {**kwargs, "timeout": httpx.Timeout(connect=cap(timeout.connect), read=cap(timeout.read), write=cap(timeout.write), pool=cap(timeout.pool))}
+
+
+async def wait_for_deadline(awaitable: Awaitable[T]) -> T:
+    """Awaits a request and cancels it once the deadline of the current scope has passed.
+
+    Args:
+        awaitable: The request.
+
+    Raises:
+        errors.DeadlineExceeded: If the deadline passed before the request completed.
+
+    Returns:
+        The result of the request.
+    """
+    remaining = get_remaining()
+    if remaining is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, max(remaining, 0.0))
+    except asyncio.TimeoutError:
+        remaining = get_remaining()
+        if remaining is None or remaining > 0:
+            raise
+        raise DeadlineExceeded(-remaining) from None
@@ -2,7 +2,7 @@
 
 
 from http import HTTPStatus
-from typing import BinaryIO, Generic, Literal, MutableMapping, Optional, Tuple, TypeVar
+from typing import Any, BinaryIO, Callable, Dict, Generic, Literal, MutableMapping, Optional, Tuple, TypeVar
 
 import attr
 
@@ -33,14 +33,35 @@ class File:
 T = TypeVar("T")
 
 
+def _additional_properties_eq_key(additional_properties: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compares lazily allocated additional_properties of models, treating not allocated as empty"""
+    return additional_properties or {}
+
+
 @attr.s(auto_attribs=True)
 class Response(Generic[T]):
-    """A response from an endpoint"""
+    """A response from an endpoint
+
+    When created with a `parser`, the body is only decoded and `parsed` only built on first access. The result is
+    cached, so the parser runs at most once.
+    """
 
     status_code: HTTPStatus
     content: bytes
     headers: MutableMapping[str, str]
-    parsed: Optional[T]
+    _parsed: Optional[T]
+    _parser: Optional[Callable[[], Optional[T]]] = attr.ib(default=None, kw_only=True, repr=False, eq=False)
+
+    @property
+    def parsed(self) -> Optional[T]:
+        """The parsed response body, built on first access if the response was created with a parser"""
+        if self._parser is not None:
+            self._parsed, self._parser = self._parser(), None
+        return self._parsed
+
+    @parsed.setter
+    def parsed(self, parsed: Optional[T]) -> None:
+        self._parsed, self._parser = parsed, None
 
 
 __all__ = ["File", "Response", "FileJsonType"]
@@ -0,0 +1,57 @@
+"""Benchmark per-pubkey requests: per-call httpx.request vs pooled HTTP/1.1 vs pooled HTTP/2.
+
+Sends `REQUESTS_PER_VALIDATOR` ListFeeRecipient requests to every validator client listed in ../.env and prints
+the time taken by each transport mode. HTTP/2 requires the h2 package, installed with the `http2` extra
+(`pip install eth-2-key-manager-api-client[http2]`), and a validator client API served over TLS, otherwise the pooled
+client falls back to HTTP/1.1.
+"""
+import asyncio
+import time
+
+import httpx
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.helpers import _get_kwargs
+from tests.conftest import parse_file
+
+validators = parse_file("../.env")
+
+REQUESTS_PER_VALIDATOR = 500
+pubkey = "0x99c4c42fac7d1393956bd9e2785ed67cf5aaca4bf56d2fcda94c42d6042aebb1723ce6bac6f0216ff8c5d4f9f013008b"
+
+
+async def per_call_client(validator):
+    # The request path used before pooled clients were introduced: a new connection for every request
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url=validator[1], token=validator[2])
+    kwargs = _get_kwargs(client=eth_2_key_manager.client, endpoint=f"validator/{pubkey}/feerecipient", method="GET")
+
+    async def request():
+        async with httpx.AsyncClient(verify=eth_2_key_manager.client.verify_ssl) as _client:
+            return await _client.request(**kwargs)
+
+    return await asyncio.gather(*(request() for _ in range(REQUESTS_PER_VALIDATOR)))
+
+
+async def pooled_client(validator, http2):
+    async with eth_2_key_manager_api_client.Eth2KeyManager(base_url=validator[1], token=validator[2], http2=http2) as eth_2_key_manager:
+        return await asyncio.gather(*(eth_2_key_manager.list_fee_recipient.asyncio_detailed(pubkey) for _ in range(REQUESTS_PER_VALIDATOR)))
+
+
+async def benchmark(validator):
+    for name, coroutine in [
+        ("per-call httpx.request", per_call_client(validator)),
+        ("pooled HTTP/1.1", pooled_client(validator, http2=False)),
+        ("pooled HTTP/2", pooled_client(validator, http2=True)),
+    ]:
+        start = time.perf_counter()
+        responses = await coroutine
+        elapsed = time.perf_counter() - start
+        print(f"{validator[0]} - {validator[1]} - {name}: {len(responses)} requests in {elapsed:.2f}s ({len(responses) / elapsed:.0f} req/s)")
+
+
+async def main():
+    for validator in validators:
+        await benchmark(validator)
+
+
+asyncio.run(main())
@@ -0,0 +1,44 @@
+"""Benchmark memory and build time of the list response models.
+
+Builds ListKeysResponse, ListRemoteKeysResponse and ListKeysColumns from synthetic response bodies with `KEYS` keys
+and prints the memory retained per key and the time taken by `from_dict`. The decoded JSON body is shown as baseline.
+No validator client is required.
+"""
+import gc
+import time
+import tracemalloc
+
+from eth_2_key_manager_api_client.columnar import ListKeysColumns
+from eth_2_key_manager_api_client.json_codec import get_json_codec
+from eth_2_key_manager_api_client.models.list_keys_response import ListKeysResponse
+from eth_2_key_manager_api_client.models.list_remote_keys_response import ListRemoteKeysResponse
+
+KEYS = 100_000
+
+json_codec = get_json_codec()
+list_keys_body = json_codec.dumps(
+    {"data": [{"validating_pubkey": f"0x{i:096x}", "derivation_path": f"m/12381/3600/{i % 1000}/0/0", "readonly": False} for i in range(KEYS)]}
+)
+list_remote_keys_body = json_codec.dumps({"data": [{"pubkey": f"0x{i:096x}", "url": "https://remote.signer", "readonly": False} for i in range(KEYS)]})
+
+
+def measure(name, build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<40} {retained / KEYS:>8.0f} bytes/key {elapsed * 1000:>8.0f} ms")
+    return result
+
+
+measure("decoded ListKeys JSON (baseline)", lambda: json_codec.loads(list_keys_body))
+measure("ListKeysResponse", lambda: ListKeysResponse.from_dict(json_codec.loads(list_keys_body)))
+measure("ListKeysColumns", lambda: ListKeysColumns.from_dict(json_codec.loads(list_keys_body)))
+measure("decoded ListRemoteKeys JSON (baseline)", lambda: json_codec.loads(list_remote_keys_body))
+measure("ListRemoteKeysResponse", lambda: ListRemoteKeysResponse.from_dict(json_codec.loads(list_remote_keys_body)))
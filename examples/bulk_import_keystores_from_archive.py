@@ -0,0 +1,15 @@
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.keystore_loader import KeystoreLoader
+
+# Keystores are read lazily, one chunk at a time, from a directory or a zip / tar archive such as validator_keys.tar.gz
+keystore_loader = KeystoreLoader("mock_validator_keystores")
+
+with open("mock_validator_keystores/slashing_protection_db.json", "r") as f:
+    slashing_protection_str = f.read()
+
+eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(timeout=60.0)
+
+response = eth_2_key_manager.bulk_import_keystores.sync_from_pairs(keystore_loader, slashing_protection_str)
+
+for data_item in response.data:
+    print(f"{data_item.status}: {data_item.message}")
@@ -0,0 +1,20 @@
+import asyncio
+
+import eth_2_key_manager_api_client
+from tests.conftest import parse_file
+
+validators = parse_file("../.env")
+
+
+async def main():
+    async with eth_2_key_manager_api_client.Eth2KeyManagerFleet(validators, max_concurrency=32, max_concurrency_per_node=4) as fleet:
+        async for fleet_result in fleet.run("list_keys"):
+            if not fleet_result.ok:
+                print(f"{fleet_result.node} - List keys failed: {fleet_result.exception!r}")
+            elif fleet_result.result.status_code == 200:
+                print(f"{fleet_result.node} - Number of keys: {len(fleet_result.result.parsed.data)}")
+            else:
+                print(f"{fleet_result.node} - List keys failed with status code: {fleet_result.result.status_code}")
+
+
+asyncio.run(main())
@@ -1,30 +1,13 @@
 import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.keystore_loader import KeystoreLoader
 
-# Create lists of keystore and password strings, note: the order of the lists must match `passwords[i]` must unlock `keystores[i]`
+# Read the keystore-*.json files and their .txt password files, note: `passwords[i]` must unlock `keystores[i]`
 list_of_keystore_strs: list[str] = []
 list_of_keystore_password_strs: list[str] = []
 
-keystore_files = [
-    "mock_validator_keystores/keystore-m_12381_3600_0_0_0-1669980799.json",
-    "mock_validator_keystores/keystore-m_12381_3600_1_0_0-1680087924.json",
-    "mock_validator_keystores/keystore-m_12381_3600_2_0_0-1680087924.json",
-]
-
-# Read the keystores as strings
-for keystore_file in keystore_files:
-    with open(keystore_file, "r") as f:
-        list_of_keystore_strs.append(f.read())
-
-# Read the passwords as strings
-keystore_password_files = [
-    "mock_validator_keystores/keystore-m_12381_3600_0_0_0-1669980799.txt",
-    "mock_validator_keystores/keystore-m_12381_3600_1_0_0-1680087924.txt",
-    "mock_validator_keystores/keystore-m_12381_3600_2_0_0-1680087924.txt",
-]
-
-for keystore_password_file in keystore_password_files:
-    with open(keystore_password_file, "r") as f:
-        list_of_keystore_password_strs.append(f.read())
+for keystore_str, keystore_password_str in KeystoreLoader("mock_validator_keystores"):
+    list_of_keystore_strs.append(keystore_str)
+    list_of_keystore_password_strs.append(keystore_password_str)
 
 with open("mock_validator_keystores/slashing_protection_db.json", "r") as f:
     slashing_protection_str = f.read()
@@ -6,6 +6,8 @@ import pytest
 
 import eth_2_key_manager_api_client
 
+from .mocks import mock_base_url
+
 
 def parse_file(filename=".env") -> List[Tuple[str, str, str]]:
     with open(filename, "r") as file:
@@ -39,6 +41,16 @@ def set_mock_client_config_env_vars():
     os.environ["ETH_2_KEY_MANAGER_API_TOKEN"] = "token1"
 
 
+@pytest.fixture
+def eth_2_key_manager_with():
+    """Fixture for a factory of Eth2KeyManager instances talking to the mocked key manager, keyword arguments are passed on"""
+
+    def factory(**kwargs) -> eth_2_key_manager_api_client.Eth2KeyManager:
+        return eth_2_key_manager_api_client.Eth2KeyManager(**{"base_url": mock_base_url, "token": "test_token", **kwargs})
+
+    return factory
+
+
 @pytest.fixture
 def keystore_str():
     """Fixture for keystore_dict"""
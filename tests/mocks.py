@@ -1,3 +1,10 @@
+# Standard Library
+import json
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+from pytest_httpx import HTTPXMock
+
 mock_response_400 = {
     "code": 400,
     "message": "Bad request. Request was malformed and could not be processed",
@@ -22,12 +29,55 @@ mock_response_404 = {
 }
 
 
+mock_base_url = "http://localhost:8080"
+mock_pubkey = "0x93247f2209abcacf57b75a51dafae777f9dd38bc7053d1af526f220a7489a6d3a2753e5f3e8b1cfe39b56f43611df74a"
+mock_fee_recipient = "0xabcf8e0d4e9587369b2301d0790347320302cc09"
+
+mock_response_list_keys_200 = {
+    "data": [
+        {
+            "validating_pubkey": mock_pubkey,
+            "derivation_path": "m/12381/3600/0/0/0",
+            "readonly": False,
+        }
+    ]
+}
 mock_response_list_remote_keys_200 = {
     "data": [
         {
-            "pubkey": "0x93247f2209abcacf57b75a51dafae777f9dd38bc7053d1af526f220a7489a6d3a2753e5f3e8b1cfe39b56f43611df74a",
+            "pubkey": mock_pubkey,
             "url": "https://remote.signer",
             "readonly": False,
         }
     ]
 }
+
+
+def mock_key_manager(
+    list_keys_response: Dict[str, Any] = mock_response_list_keys_200,
+    list_remote_keys_response: Dict[str, Any] = mock_response_list_remote_keys_200,
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Returns an httpx_mock callback answering the keystore and remote key endpoints like a key manager, other requests get a 202"""
+
+    def key_manager_callback(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path not in ("/eth/v1/keystores", "/eth/v1/remotekeys"):
+            return httpx.Response(status_code=202)
+        if request.method == "GET":
+            return httpx.Response(status_code=200, json=list_keys_response if path == "/eth/v1/keystores" else list_remote_keys_response)
+
+        body = json.loads(request.content)
+        if request.method == "DELETE" and path == "/eth/v1/keystores":
+            return httpx.Response(status_code=200, json={"data": [{"status": "deleted"} for _ in body["pubkeys"]], "slashing_protection": "{}"})
+        if request.method == "DELETE":
+            return httpx.Response(status_code=200, json={"data": [{"status": "deleted"} for _ in body["pubkeys"]]})
+        if path == "/eth/v1/keystores":
+            return httpx.Response(status_code=200, json={"data": [{"status": "imported"} for _ in body["keystores"]]})
+        return httpx.Response(status_code=200, json={"data": [{"status": "imported"} for _ in body["remote_keys"]]})
+
+    return key_manager_callback
+
+
+def sent_requests(httpx_mock: HTTPXMock) -> List[Tuple[str, str]]:
+    """Returns the method and path of every request sent to httpx_mock"""
+    return [(request.method, request.url.path) for request in httpx_mock.get_requests()]
@@ -0,0 +1,129 @@
+"""Unit tests for the BulkImportKeystores class."""
+
+import json
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.bulk_import import BulkImportKeystores
+from eth_2_key_manager_api_client.models.import_keystores_response import ImportKeystoresResponse
+
+from ..mocks import mock_response_400
+
+keystores = [json.dumps({"pubkey": f"{i:096x}"}) for i in range(10)]
+passwords = [f"password{i}" for i in range(10)]
+
+
+def import_keystores_callback(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    return httpx.Response(status_code=200, json={"data": [{"status": "imported", "message": keystore} for keystore in body["keystores"]]})
+
+
+def requested_chunks(httpx_mock: HTTPXMock):
+    return [json.loads(request.content)["passwords"] for request in httpx_mock.get_requests()]
+
+
+def test_bulk_import_keystores_sync(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(import_keystores_callback)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    eth_2_key_manager.bulk_import_keystores.initial_chunk_size = 3
+    response = eth_2_key_manager.bulk_import_keystores.sync(keystores, passwords, "slashing_protection")
+
+    assert isinstance(response, ImportKeystoresResponse)
+    assert [data_item.message for data_item in response.data] == keystores
+    assert requested_chunks(httpx_mock)[0] == passwords[:3]
+    assert sum(len(chunk) for chunk in requested_chunks(httpx_mock)) == 10
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_keystores_asyncio(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(import_keystores_callback)
+
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+    bulk_import_keystores = BulkImportKeystores(client, initial_chunk_size=2, max_chunk_size=2, max_concurrency=3)
+    response = await bulk_import_keystores.asyncio(keystores, passwords)
+
+    assert [data_item.message for data_item in response.data] == keystores
+    assert sorted(requested_chunks(httpx_mock)) == sorted(passwords[i : i + 2] for i in range(0, 10, 2))
+
+
+def test_bulk_import_keystores_without_parse_response(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(import_keystores_callback)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token", parse_response=False)
+    response = eth_2_key_manager.bulk_import_keystores.sync(keystores, passwords)
+
+    assert [data_item.status for data_item in response.data] == ["imported"] * 10
+    assert [data_item.message for data_item in response.data] == keystores
+
+
+def test_bulk_import_keystores_timeout_splits_chunk(httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(httpx.ReadTimeout("Read timed out"))
+    httpx_mock.add_callback(import_keystores_callback)
+
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+    response = BulkImportKeystores(client, initial_chunk_size=4, max_chunk_size=4).sync(keystores[:4], passwords[:4])
+
+    assert [data_item.message for data_item in response.data] == keystores[:4]
+    assert requested_chunks(httpx_mock) == [passwords[:4], passwords[:2], passwords[2:4]]
+
+
+def test_bulk_import_keystores_connect_timeout_does_not_split_chunk(httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(httpx.ConnectTimeout("Connect timed out"))
+
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+    response = BulkImportKeystores(client, initial_chunk_size=4, max_chunk_size=4).sync(keystores, passwords)
+
+    assert len(httpx_mock.get_requests()) == 3
+    assert all(data_item.status == "error" for data_item in response.data)
+    assert response.data[0].message == "ConnectTimeout: Connect timed out"
+
+
+def test_bulk_import_keystores_error_response(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=400, json=mock_response_400)
+
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+    response = BulkImportKeystores(client, initial_chunk_size=10).sync(keystores, passwords)
+
+    assert len(response.data) == 10
+    assert all(data_item.status == "error" for data_item in response.data)
+    assert response.data[0].message == mock_response_400["message"]
+
+
+def test_bulk_import_keystores_mismatched_lengths():
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+
+    with pytest.raises(ValueError):
+        BulkImportKeystores(client).sync(keystores, passwords[:1])
+
+
+def test_bulk_import_keystores_next_chunk_size():
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+    bulk_import_keystores = BulkImportKeystores(client, target_latency=5.0, max_chunk_size=100)
+
+    assert bulk_import_keystores._next_chunk_size(10, 0.5) == 20
+    assert bulk_import_keystores._next_chunk_size(10, 10.0) == 5
+    assert bulk_import_keystores._next_chunk_size(80, 0.1) == 100
+    assert bulk_import_keystores._next_chunk_size(1, 100.0) == 1
+
+
+def test_bulk_import_keystores_slices_slashing_protection(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(import_keystores_callback)
+
+    slashing_protection = json.dumps(
+        {
+            "metadata": {"interchange_format_version": "5", "genesis_validators_root": "0x00"},
+            "data": [{"pubkey": f"0x{i:096x}", "signed_blocks": [], "signed_attestations": []} for i in range(10)],
+        }
+    )
+
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+    BulkImportKeystores(client, initial_chunk_size=5, max_chunk_size=5).sync(keystores, passwords, slashing_protection)
+
+    for request in httpx_mock.get_requests():
+        body = json.loads(request.content)
+        chunk_pubkeys = [f"0x{json.loads(keystore)['pubkey']}" for keystore in body["keystores"]]
+        assert [record["pubkey"] for record in json.loads(body["slashing_protection"])["data"]] == chunk_pubkeys
@@ -0,0 +1,140 @@
+"""Unit tests for the CircuitBreaker class."""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from eth_2_key_manager_api_client.circuit_breaker import CircuitBreaker, CircuitState
+from eth_2_key_manager_api_client.errors import CircuitOpen
+from eth_2_key_manager_api_client.retry import RetryPolicy
+
+from ..mocks import mock_base_url, mock_pubkey, mock_response_401, mock_response_500, mock_response_list_keys_200, sent_requests
+
+
+def open_circuit(httpx_mock: HTTPXMock, eth_2_key_manager):
+    for _ in range(eth_2_key_manager.client.circuit_breaker.failure_threshold):
+        httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+        with pytest.raises(httpx.ConnectError):
+            eth_2_key_manager.list_keys.sync_detailed()
+
+
+def test_circuit_breaker_opens_after_consecutive_failures(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    transitions = []
+    circuit_breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0, on_state_change=lambda *transition: transitions.append(transition))
+    eth_2_key_manager = eth_2_key_manager_with(circuit_breaker=circuit_breaker)
+
+    open_circuit(httpx_mock, eth_2_key_manager)
+    with pytest.raises(CircuitOpen) as exc_info:
+        eth_2_key_manager.list_keys.sync_detailed()
+
+    assert exc_info.value.base_url == mock_base_url
+    assert 0.0 < exc_info.value.retry_after <= 60.0
+    assert len(httpx_mock.get_requests()) == 3
+    assert circuit_breaker.get_state(mock_base_url) == CircuitState.OPEN
+    assert circuit_breaker.rejected == 1
+    assert transitions == [(mock_base_url, CircuitState.CLOSED, CircuitState.OPEN)]
+
+
+def test_circuit_breaker_success_resets_failures(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+    eth_2_key_manager = eth_2_key_manager_with(circuit_breaker=circuit_breaker)
+    httpx_mock.add_response(status_code=500, json=mock_response_500)
+    httpx_mock.add_response(status_code=401, json=mock_response_401)
+    httpx_mock.add_response(status_code=500, json=mock_response_500)
+
+    for _ in range(3):
+        eth_2_key_manager.list_keys.sync_detailed()
+
+    assert circuit_breaker.get_state(mock_base_url) == CircuitState.CLOSED
+
+
+def test_circuit_breaker_get_request_probes(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    eth_2_key_manager = eth_2_key_manager_with(circuit_breaker=circuit_breaker)
+    open_circuit(httpx_mock, eth_2_key_manager)
+
+    circuit_breaker.reset_timeout = 0.0
+    assert circuit_breaker.get_state(mock_base_url) == CircuitState.HALF_OPEN
+    httpx_mock.add_response(status_code=200, json=mock_response_list_keys_200)
+    response = eth_2_key_manager.list_keys.sync()
+
+    assert response.data[0].validating_pubkey == mock_pubkey
+    assert circuit_breaker.get_state(mock_base_url) == CircuitState.CLOSED
+    assert sent_requests(httpx_mock) == [("GET", "/eth/v1/keystores")] * 2
+
+
+def test_circuit_breaker_probes_before_writes(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    eth_2_key_manager = eth_2_key_manager_with(circuit_breaker=circuit_breaker)
+    open_circuit(httpx_mock, eth_2_key_manager)
+    circuit_breaker.reset_timeout = 0.0
+
+    # the probe fails, the deletion is not sent
+    httpx_mock.add_response(method="GET", status_code=503)
+    with pytest.raises(CircuitOpen):
+        eth_2_key_manager.delete_keys.sync_detailed([mock_pubkey])
+    assert sent_requests(httpx_mock) == [("GET", "/eth/v1/keystores")] * 2
+
+    # the probe succeeds, the deletion is sent
+    httpx_mock.add_response(method="GET", status_code=200, json=mock_response_list_keys_200)
+    httpx_mock.add_response(method="DELETE", status_code=200, json={"data": [{"status": "deleted"}], "slashing_protection": "{}"})
+    response = eth_2_key_manager.delete_keys.sync_detailed([mock_pubkey])
+
+    assert response.status_code == 200
+    assert sent_requests(httpx_mock)[2:] == [("GET", "/eth/v1/keystores"), ("DELETE", "/eth/v1/keystores")]
+    assert circuit_breaker.get_state(mock_base_url) == CircuitState.CLOSED
+
+
+def test_circuit_breaker_per_base_url(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    circuit_breaker = CircuitBreaker(failure_threshold=1)
+    failing = eth_2_key_manager_with(circuit_breaker=circuit_breaker)
+    healthy = eth_2_key_manager_with(base_url="http://localhost:9090", circuit_breaker=circuit_breaker)
+    open_circuit(httpx_mock, failing)
+    httpx_mock.add_response(url="http://localhost:9090/eth/v1/keystores", status_code=200, json=mock_response_list_keys_200)
+
+    healthy.list_keys.sync()
+
+    assert circuit_breaker.states == {mock_base_url: CircuitState.OPEN, "http://localhost:9090": CircuitState.CLOSED}
+    circuit_breaker.reset()
+    assert circuit_breaker.get_state(mock_base_url) == CircuitState.CLOSED
+
+
+def test_circuit_breaker_stops_retries(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+    eth_2_key_manager = eth_2_key_manager_with(circuit_breaker=circuit_breaker, retry_policy=RetryPolicy(max_attempts=5, backoff=0.0))
+    for _ in range(2):
+        httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+
+    with pytest.raises(CircuitOpen):
+        eth_2_key_manager.list_keys.sync_detailed()
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_single_probe_asyncio(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    eth_2_key_manager = eth_2_key_manager_with(circuit_breaker=circuit_breaker)
+    httpx_mock.add_exception(httpx.ConnectTimeout("Connect timed out"))
+    with pytest.raises(httpx.ConnectTimeout):
+        await eth_2_key_manager.list_keys.asyncio_detailed()
+    circuit_breaker.reset_timeout = 0.0
+
+    release = asyncio.Event()
+
+    async def slow_callback(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(status_code=200, json=mock_response_list_keys_200)
+
+    httpx_mock.add_callback(slow_callback)
+    probe = asyncio.ensure_future(eth_2_key_manager.list_keys.asyncio_detailed())
+    await asyncio.sleep(0.01)
+    with pytest.raises(CircuitOpen):
+        await eth_2_key_manager.list_keys.asyncio_detailed()
+    release.set()
+
+    assert (await probe).status_code == 200
+    assert circuit_breaker.get_state(mock_base_url) == CircuitState.CLOSED
+    assert len(httpx_mock.get_requests()) == 2
@@ -1,3 +1,6 @@
+import asyncio
+
+import pytest
 from attr import asdict
 
 from eth_2_key_manager_api_client.client import AuthenticatedClient, Client
@@ -24,6 +27,20 @@ def test_client():
         "verify_ssl": False,
         "raise_on_unexpected_status": True,
         "follow_redirects": True,
+        "http2": False,
+        "json_codec": asdict(c.json_codec),
+        "parse_response": True,
+        "list_cache": None,
+        "single_flight": None,
+        "keystore_encoding_cache": None,
+        "retry_policy": None,
+        "circuit_breaker": None,
+        "concurrency_limiter": None,
+        "rate_limiter": None,
+        "endpoint_timeouts": {},
+        "_client": None,
+        "_async_client": None,
+        "_async_client_loop": None,
     }
 
     assert c.get_headers() == {"header": "value"}
@@ -38,3 +55,63 @@ def test_client():
 def test_authenticated_client():
     ac = AuthenticatedClient("http://192.168.121.93:7500", token="api_token")
     assert ac.get_headers() == {"Authorization": "Bearer api_token"}
+
+
+def test_client_httpx_client_is_reused():
+    c = Client("http://192.168.121.93:7500", cookies={"cookie": "chocolate"}, verify_ssl=False)
+
+    httpx_client = c.get_httpx_client()
+
+    assert c.get_httpx_client() is httpx_client
+    assert httpx_client.cookies["cookie"] == "chocolate"
+
+    c.close()
+
+    assert httpx_client.is_closed
+    assert c.get_httpx_client() is not httpx_client
+
+
+def test_client_context_manager():
+    with Client("http://192.168.121.93:7500") as c:
+        httpx_client = c.get_httpx_client()
+        assert not httpx_client.is_closed
+
+    assert httpx_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_client_async_context_manager():
+    async with Client("http://192.168.121.93:7500") as c:
+        async_httpx_client = c.get_async_httpx_client()
+        assert c.get_async_httpx_client() is async_httpx_client
+        assert not async_httpx_client.is_closed
+
+    assert async_httpx_client.is_closed
+
+
+def test_client_async_httpx_client_per_event_loop():
+    c = Client("http://192.168.121.93:7500")
+
+    async def get_async_httpx_clients():
+        return c.get_async_httpx_client(), c.get_async_httpx_client()
+
+    first, first_again = asyncio.run(get_async_httpx_clients())
+    second, _ = asyncio.run(get_async_httpx_clients())
+
+    assert first is first_again
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_client_open_aclose():
+    c = await Client("http://192.168.121.93:7500").aopen()
+    async_httpx_client = c.get_async_httpx_client()
+
+    await c.aclose()
+
+    assert async_httpx_client.is_closed
+
+
+def test_client_http2():
+    assert not Client("http://192.168.121.93:7500")._get_httpx_client_kwargs()["http2"]
+    assert Client("https://192.168.121.93:7500", http2=True)._get_httpx_client_kwargs()["http2"]
@@ -0,0 +1,144 @@
+"""Unit tests for the coalescing endpoint classes."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.coalescer import (
+    CoalescedDeleteKeys,
+    CoalescedDeleteRemoteKeys,
+    CoalescedImportRemoteKeys,
+    _BatchCoalescer,
+)
+from eth_2_key_manager_api_client.models.delete_keys_response import DeleteKeysResponse
+from eth_2_key_manager_api_client.models.error_response import ErrorResponse
+from eth_2_key_manager_api_client.models.import_remote_keys_response import ImportRemoteKeysResponse
+
+from ..mocks import mock_response_500
+
+pubkeys = [f"0x{i:096x}" for i in range(1, 6)]
+
+
+def slashing_protection(pubkeys):
+    return json.dumps(
+        {
+            "metadata": {
+                "interchange_format_version": "5",
+                "genesis_validators_root": "0x043db0d9a83813551ee2f33450d23797757d430911a9320530ad8a0eabc43efb",
+            },
+            "data": [{"pubkey": pubkey, "signed_blocks": [], "signed_attestations": []} for pubkey in pubkeys],
+        }
+    )
+
+
+def delete_keys_callback(request: httpx.Request) -> httpx.Response:
+    requested_pubkeys = json.loads(request.content)["pubkeys"]
+    return httpx.Response(
+        status_code=200,
+        json={
+            "data": [{"status": "deleted", "message": pubkey} for pubkey in requested_pubkeys],
+            "slashing_protection": slashing_protection(requested_pubkeys),
+        },
+    )
+
+
+def test_eth_2_key_manager_coalesce():
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token", coalesce=True)
+
+    assert isinstance(eth_2_key_manager.delete_keys, CoalescedDeleteKeys)
+    assert isinstance(eth_2_key_manager.delete_remote_keys, CoalescedDeleteRemoteKeys)
+    assert isinstance(eth_2_key_manager.import_remote_keys, CoalescedImportRemoteKeys)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_delete_keys(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(delete_keys_callback)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token", coalesce=True)
+    responses = await asyncio.gather(*(eth_2_key_manager.delete_keys.asyncio_detailed(pubkeys=[pubkey]) for pubkey in pubkeys))
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert json.loads(httpx_mock.get_requests()[0].content)["pubkeys"] == pubkeys
+    for pubkey, response in zip(pubkeys, responses):
+        assert response.status_code == 200
+        assert isinstance(response.parsed, DeleteKeysResponse)
+        assert [data_item.message for data_item in response.parsed.data] == [pubkey]
+        assert [record["pubkey"] for record in json.loads(response.parsed.slashing_protection)["data"]] == [pubkey]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_delete_keys_max_batch_size(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(delete_keys_callback)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    delete_keys = CoalescedDeleteKeys(eth_2_key_manager.client, max_batch_size=2)
+    responses = await asyncio.gather(
+        delete_keys.asyncio(pubkeys=pubkeys[:2]), delete_keys.asyncio(pubkeys=pubkeys[2:3]), delete_keys.asyncio(pubkeys=pubkeys[3:])
+    )
+
+    requested_pubkeys = [json.loads(request.content)["pubkeys"] for request in httpx_mock.get_requests()]
+    assert all(len(batch) <= 2 for batch in requested_pubkeys)
+    assert requested_pubkeys == [pubkeys[:2], pubkeys[2:3], pubkeys[3:]]
+    assert [[data_item.message for data_item in response.data] for response in responses] == [pubkeys[:2], pubkeys[2:3], pubkeys[3:]]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_delete_keys_oversized_call(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(delete_keys_callback)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    delete_keys = CoalescedDeleteKeys(eth_2_key_manager.client, max_batch_size=2)
+    responses = await asyncio.gather(
+        delete_keys.asyncio(pubkeys=pubkeys[:1]), delete_keys.asyncio(pubkeys=pubkeys[1:4]), delete_keys.asyncio(pubkeys=pubkeys[4:])
+    )
+
+    assert [json.loads(request.content)["pubkeys"] for request in httpx_mock.get_requests()] == [pubkeys[:1], pubkeys[1:4], pubkeys[4:]]
+    assert [[data_item.message for data_item in response.data] for response in responses] == [pubkeys[:1], pubkeys[1:4], pubkeys[4:]]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_delete_keys_error_response(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=500, json=mock_response_500)
+
+    delete_keys = CoalescedDeleteKeys(eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client)
+    responses = await asyncio.gather(*(delete_keys.asyncio(pubkeys=[pubkey]) for pubkey in pubkeys))
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert all(isinstance(response, ErrorResponse) for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_delete_keys_exception(httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+
+    delete_keys = CoalescedDeleteKeys(eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client)
+    results = await asyncio.gather(*(delete_keys.asyncio(pubkeys=[pubkey]) for pubkey in pubkeys), return_exceptions=True)
+
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_import_remote_keys(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=200, json={"data": [{"status": "imported"}, {"status": "duplicate"}]})
+
+    import_remote_keys = CoalescedImportRemoteKeys(eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client)
+    responses = await asyncio.gather(
+        import_remote_keys.asyncio(remote_keys=[{"pubkey": pubkeys[0], "url": "https://remote.signer"}]),
+        import_remote_keys.asyncio(remote_keys=[{"pubkey": pubkeys[1], "url": "https://remote.signer"}]),
+    )
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert all(isinstance(response, ImportRemoteKeysResponse) for response in responses)
+    assert [response.data[0].status for response in responses] == ["imported", "duplicate"]
+
+
+def test_coalescer_without_send_batch():
+    class IncompleteCoalescer(_BatchCoalescer):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteCoalescer()
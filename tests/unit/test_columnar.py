@@ -0,0 +1,90 @@
+"""Unit tests for the columnar module."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.columnar import ListKeysColumns
+from eth_2_key_manager_api_client.models.error_response import ErrorResponse
+from eth_2_key_manager_api_client.models.list_keys_response import ListKeysResponse
+from eth_2_key_manager_api_client.pubkey import Pubkey
+from eth_2_key_manager_api_client.types import UNSET
+
+from ..mocks import mock_response_401
+
+pubkeys = [f"0x{i:096x}" for i in range(5)]
+list_keys_response = {
+    "data": [
+        {"validating_pubkey": pubkeys[0], "derivation_path": "m/12381/3600/0/0/0", "readonly": False},
+        {"validating_pubkey": pubkeys[1].upper().replace("0X", "0x"), "derivation_path": "m/12381/3600/1/0/0", "readonly": True},
+        {"validating_pubkey": pubkeys[2], "derivation_path": "m/12381/3600/0/0/0"},
+        {"validating_pubkey": pubkeys[3][2:], "readonly": False},
+        {"validating_pubkey": pubkeys[4]},
+    ]
+}
+
+
+def test_list_keys_columns_from_dict():
+    list_keys_columns = ListKeysColumns.from_dict(list_keys_response)
+
+    assert len(list_keys_columns) == 5
+    assert len(list_keys_columns.pubkeys) == 5 * 48
+    assert list(list_keys_columns.iter_pubkeys()) == pubkeys
+    assert list_keys_columns.derivation_paths == ["m/12381/3600/0/0/0", "m/12381/3600/1/0/0"]
+    assert list(list_keys_columns.derivation_path_ids) == [0, 1, 0, -1, -1]
+    assert list(list_keys_columns.readonly) == [0, 1, -1, 0, -1]
+    assert list_keys_columns.derivation_path(2) == "m/12381/3600/0/0/0"
+    assert list_keys_columns.is_readonly(4) is None
+
+
+def test_list_keys_columns_matches_list_keys_response():
+    list_keys_columns = ListKeysColumns.from_dict(list_keys_response)
+    expected = ListKeysResponse.from_dict(list_keys_response).data
+
+    for pubkey, data_item, expected_data_item in zip(pubkeys, list_keys_columns, expected):
+        assert data_item.validating_pubkey == pubkey
+        assert data_item.derivation_path == expected_data_item.derivation_path
+        assert data_item.readonly == expected_data_item.readonly
+    assert list_keys_columns[-1].readonly is UNSET
+
+
+def test_list_keys_columns_lookup():
+    list_keys_columns = ListKeysColumns.from_dict(list_keys_response)
+
+    assert list_keys_columns.index(pubkeys[3]) == 3
+    assert list_keys_columns.index(pubkeys[1].upper()[2:]) == 1
+    assert list_keys_columns.index(bytes.fromhex(pubkeys[4][2:])) == 4
+    assert pubkeys[2] in list_keys_columns
+    assert f"0x{99:096x}" not in list_keys_columns
+    assert "not hex" not in list_keys_columns
+    assert all(pubkey is Pubkey.intern(pubkey) for pubkey in list_keys_columns._index)
+    with pytest.raises(KeyError):
+        list_keys_columns.index(f"0x{99:096x}")
+    with pytest.raises(IndexError):
+        list_keys_columns.pubkey(5)
+
+
+def test_list_keys_columns_invalid_pubkey():
+    with pytest.raises(ValueError):
+        ListKeysColumns.from_dict({"data": [{"validating_pubkey": "0x1234"}]})
+
+
+def test_list_keys_columnar_sync(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=200, json=list_keys_response)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    list_keys_columns = eth_2_key_manager.list_keys_columnar.sync()
+
+    assert isinstance(list_keys_columns, ListKeysColumns)
+    assert list(list_keys_columns.iter_pubkeys()) == pubkeys
+
+
+@pytest.mark.asyncio
+async def test_list_keys_columnar_asyncio_error(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=401, json=mock_response_401)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    response = await eth_2_key_manager.list_keys_columnar.asyncio_detailed()
+
+    assert response.status_code == 401
+    assert isinstance(response.parsed, ErrorResponse)
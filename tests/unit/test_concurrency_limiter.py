@@ -0,0 +1,143 @@
+"""Unit tests for the AIMDConcurrencyLimiter class."""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from eth_2_key_manager_api_client.concurrency_limiter import AIMDConcurrencyLimiter
+
+from ..mocks import mock_base_url, mock_response_list_keys_200
+
+
+class SlowNode:
+    """Answers requests once released and records the highest number of requests in flight."""
+
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.release = asyncio.Event()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        await self.release.wait()
+        self.in_flight -= 1
+        return httpx.Response(status_code=self.status_code, json=mock_response_list_keys_200)
+
+
+async def run_concurrently(node: SlowNode, coroutines):
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    await asyncio.sleep(0.01)
+    node.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_disabled_by_default(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    node = SlowNode()
+    httpx_mock.add_callback(node)
+
+    eth_2_key_manager = eth_2_key_manager_with()
+    await run_concurrently(node, (eth_2_key_manager.list_keys.asyncio_detailed() for _ in range(6)))
+
+    assert eth_2_key_manager.client.concurrency_limiter is None
+    assert node.max_in_flight == 6
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_bounds_requests_in_flight(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    node = SlowNode()
+    httpx_mock.add_callback(node)
+    concurrency_limiter = AIMDConcurrencyLimiter(initial_limit=2, increase=0.0)
+
+    eth_2_key_manager = eth_2_key_manager_with(concurrency_limiter=concurrency_limiter)
+    responses = await run_concurrently(node, (eth_2_key_manager.list_keys.asyncio_detailed() for _ in range(6)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert node.max_in_flight == 2
+    assert concurrency_limiter.get_in_flight(mock_base_url) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_additive_increase(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    node = SlowNode()
+    node.release.set()
+    httpx_mock.add_callback(node)
+    concurrency_limiter = AIMDConcurrencyLimiter(initial_limit=1, max_limit=3)
+
+    eth_2_key_manager = eth_2_key_manager_with(concurrency_limiter=concurrency_limiter)
+    await eth_2_key_manager.list_keys.asyncio_detailed()
+    assert concurrency_limiter.get_limit(mock_base_url) == 2.0
+
+    # the limit only grows while the node is saturated
+    for _ in range(5):
+        await eth_2_key_manager.list_keys.asyncio_detailed()
+    assert concurrency_limiter.limits == {mock_base_url: 2.0}
+
+    # and never beyond max_limit
+    await asyncio.gather(*(eth_2_key_manager.list_keys.asyncio_detailed() for _ in range(20)))
+    assert concurrency_limiter.get_limit(mock_base_url) == 3.0
+    assert node.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_multiplicative_decrease_once_per_episode(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    node = SlowNode(status_code=503)
+    httpx_mock.add_callback(node)
+    concurrency_limiter = AIMDConcurrencyLimiter(initial_limit=8)
+
+    eth_2_key_manager = eth_2_key_manager_with(concurrency_limiter=concurrency_limiter)
+    await run_concurrently(node, (eth_2_key_manager.list_keys.asyncio_detailed() for _ in range(4)))
+    assert concurrency_limiter.get_limit(mock_base_url) == 4.0
+
+    for _ in range(4):
+        await eth_2_key_manager.list_keys.asyncio_detailed()
+    assert concurrency_limiter.get_limit(mock_base_url) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_outcomes(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    concurrency_limiter = AIMDConcurrencyLimiter(initial_limit=4, latency_threshold=0.0)
+    eth_2_key_manager = eth_2_key_manager_with(concurrency_limiter=concurrency_limiter)
+
+    # connection errors say nothing about the capacity of the node
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+    with pytest.raises(httpx.ConnectError):
+        await eth_2_key_manager.list_keys.asyncio_detailed()
+    assert concurrency_limiter.get_limit(mock_base_url) == 4.0
+
+    httpx_mock.add_exception(httpx.ReadTimeout("Read timed out"))
+    with pytest.raises(httpx.ReadTimeout):
+        await eth_2_key_manager.list_keys.asyncio_detailed()
+    assert concurrency_limiter.get_limit(mock_base_url) == 2.0
+
+    # slower than latency_threshold
+    httpx_mock.add_response(status_code=200, json=mock_response_list_keys_200)
+    await eth_2_key_manager.list_keys.asyncio_detailed()
+    assert concurrency_limiter.get_limit(mock_base_url) == 1.0
+    assert concurrency_limiter.get_in_flight(mock_base_url) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_cancelled_waiter(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    node = SlowNode()
+    httpx_mock.add_callback(node)
+    concurrency_limiter = AIMDConcurrencyLimiter(initial_limit=1, increase=0.0)
+
+    eth_2_key_manager = eth_2_key_manager_with(concurrency_limiter=concurrency_limiter)
+    first = asyncio.ensure_future(eth_2_key_manager.list_keys.asyncio_detailed())
+    waiting = asyncio.ensure_future(eth_2_key_manager.list_keys.asyncio_detailed())
+    last = asyncio.ensure_future(eth_2_key_manager.list_keys.asyncio_detailed())
+    await asyncio.sleep(0.01)
+    waiting.cancel()
+    node.release.set()
+
+    assert (await first).status_code == 200
+    assert (await last).status_code == 200
+    assert waiting.cancelled()
+    assert len(httpx_mock.get_requests()) == 2
+    assert concurrency_limiter.get_in_flight(mock_base_url) == 0
@@ -0,0 +1,25 @@
+"""Unit tests for the endpoints module."""
+
+import pytest
+
+from eth_2_key_manager_api_client.endpoints import get_endpoint_class
+
+pubkey = "0x93247f2209abcacf57b75a51dafae777f9dd38bc7053d1af526f220a7489a6d3a2753e5f3e8b1cfe39b56f43611df74a"
+
+
+@pytest.mark.parametrize(
+    "method, endpoint, endpoint_class",
+    [
+        ("GET", "keystores", "ListKeys"),
+        ("POST", "keystores", "ImportKeystores"),
+        ("DELETE", "remotekeys", "DeleteRemoteKeys"),
+        ("GET", f"validator/{pubkey}/feerecipient", "ListFeeRecipient"),
+        ("POST", f"validator/{pubkey}/gas_limit", "SetGasLimit"),
+        ("PUT", "keystores", None),
+        ("GET", "validator/duties", None),
+    ],
+)
+def test_get_endpoint_class(method, endpoint, endpoint_class):
+    kwargs = {"method": method, "url": f"https://validator.example:7500/prefix/eth/v1/{endpoint}"}
+
+    assert get_endpoint_class(kwargs) == endpoint_class
@@ -1,3 +1,6 @@
+import asyncio
+
+import httpx
 import pytest
 from attr import asdict
 
@@ -47,6 +50,20 @@ def test_class_instance():
         "verify_ssl": False,
         "raise_on_unexpected_status": True,
         "follow_redirects": True,
+        "http2": False,
+        "json_codec": asdict(eth_2_key_manager.client.json_codec),
+        "parse_response": True,
+        "list_cache": None,
+        "single_flight": None,
+        "keystore_encoding_cache": None,
+        "retry_policy": None,
+        "circuit_breaker": None,
+        "concurrency_limiter": None,
+        "rate_limiter": None,
+        "endpoint_timeouts": {"ImportKeystores": httpx.Timeout(10.0, read=300.0, write=300.0)},
+        "_client": None,
+        "_async_client": None,
+        "_async_client_loop": None,
         "token": "token",
         "prefix": "Bearer",
         "auth_header_name": "Authorization",
@@ -55,6 +72,8 @@ def test_class_instance():
     assert eth_2_key_manager.client.get_headers() == {"header": "value", "Authorization": "Bearer token"}
     assert eth_2_key_manager.client.get_cookies() == {"cookie": "chocolate"}
     assert eth_2_key_manager.client.get_timeout() == 10.0
+    assert eth_2_key_manager.client.get_timeout("ListKeys") == 10.0
+    assert eth_2_key_manager.client.get_timeout("ImportKeystores") == httpx.Timeout(10.0, read=300.0, write=300.0)
     assert isinstance(eth_2_key_manager.client.with_headers({"header2": "value2"}), AuthenticatedClient)
     assert eth_2_key_manager.client.with_headers({"header2": "value2"}).get_headers() == {
         "header": "value",
@@ -91,3 +110,63 @@ def test_class_configuration_params():
 #     eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager()
 #     assert eth_2_key_manager.client.base_url == "http://localhost:7501"
 #     assert eth_2_key_manager.client.token == "token1"
+
+
+def test_class_shares_pooled_client(httpx_mock):
+
+    httpx_mock.add_response(status_code=200, json={"data": []})
+    httpx_mock.add_response(status_code=200, json={"data": []})
+
+    with eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:7500", token="token") as eth_2_key_manager:
+        httpx_client = eth_2_key_manager.client.get_httpx_client()
+        eth_2_key_manager.list_keys.sync_detailed()
+        eth_2_key_manager.list_remote_keys.sync_detailed()
+
+        assert eth_2_key_manager.client.get_httpx_client() is httpx_client
+        assert eth_2_key_manager.list_keys.client is eth_2_key_manager.list_remote_keys.client
+
+    assert httpx_client.is_closed
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_class_shares_pooled_async_client(httpx_mock):
+
+    httpx_mock.add_response(status_code=200, json={"data": []})
+    httpx_mock.add_response(status_code=200, json={"data": []})
+
+    async with eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:7500", token="token") as eth_2_key_manager:
+        async_httpx_client = eth_2_key_manager.client.get_async_httpx_client()
+        await eth_2_key_manager.list_keys.asyncio_detailed()
+        await eth_2_key_manager.list_remote_keys.asyncio_detailed()
+
+        assert eth_2_key_manager.client.get_async_httpx_client() is async_httpx_client
+
+    assert async_httpx_client.is_closed
+
+
+def test_class_asyncio_run_twice(httpx_mock):
+
+    httpx_mock.add_response(status_code=200, json={"data": []})
+    httpx_mock.add_response(status_code=200, json={"data": []})
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:7500", token="token")
+
+    async def list_keys():
+        response = await eth_2_key_manager.list_keys.asyncio_detailed()
+        return response, eth_2_key_manager.client.get_async_httpx_client()
+
+    first_response, first_async_httpx_client = asyncio.run(list_keys())
+    second_response, second_async_httpx_client = asyncio.run(list_keys())
+
+    assert first_response.status_code == 200
+    assert second_response.status_code == 200
+    assert second_async_httpx_client is not first_async_httpx_client
+
+
+def test_class_configuration_http2():
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="https://localhost:7500", token="token", http2=True)
+
+    assert eth_2_key_manager.client.http2
+    assert eth_2_key_manager.list_fee_recipient.client.http2
@@ -0,0 +1,98 @@
+"""Unit tests for the Eth2KeyManagerFleet class."""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.fleet import FleetResult
+from eth_2_key_manager_api_client.models.list_keys_response import ListKeysResponse
+
+nodes = [
+    ("TEKU", "http://localhost:7500", "token1"),
+    ("NIMBUS", "http://localhost:7501", "token2"),
+    ("LODESTAR", "http://localhost:7502", "token3"),
+]
+
+
+def test_fleet_instance():
+    fleet = eth_2_key_manager_api_client.Eth2KeyManagerFleet(nodes, timeout=20.0)
+
+    assert list(fleet.managers) == ["TEKU", "NIMBUS", "LODESTAR"]
+    assert fleet.managers["NIMBUS"].client.base_url == "http://localhost:7501"
+    assert fleet.managers["NIMBUS"].client.token == "token2"
+    assert fleet.managers["NIMBUS"].client.timeout == 20.0
+
+
+def test_fleet_invalid_concurrency():
+    with pytest.raises(ValueError):
+        eth_2_key_manager_api_client.Eth2KeyManagerFleet(nodes, max_concurrency=0)
+
+
+def test_fleet_duplicate_node_names():
+    with pytest.raises(ValueError, match="TEKU"):
+        eth_2_key_manager_api_client.Eth2KeyManagerFleet([*nodes, ("TEKU", "http://localhost:7503", "token4")])
+
+
+@pytest.mark.asyncio
+async def test_fleet_run_endpoint(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=200, json={"data": []})
+
+    async with eth_2_key_manager_api_client.Eth2KeyManagerFleet(nodes) as fleet:
+        fleet_results = [fleet_result async for fleet_result in fleet.run("list_keys")]
+
+    assert sorted(fleet_result.node for fleet_result in fleet_results) == ["LODESTAR", "NIMBUS", "TEKU"]
+    assert all(fleet_result.ok for fleet_result in fleet_results)
+    assert all(isinstance(fleet_result.result.parsed, ListKeysResponse) for fleet_result in fleet_results)
+    assert {request.headers["Authorization"] for request in httpx_mock.get_requests()} == {"Bearer token1", "Bearer token2", "Bearer token3"}
+
+
+@pytest.mark.asyncio
+async def test_fleet_run_captures_exceptions(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=200, json={"data": []}, url="http://localhost:7500/eth/v1/keystores")
+    httpx_mock.add_response(status_code=200, json={"data": []}, url="http://localhost:7502/eth/v1/keystores")
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"), url="http://localhost:7501/eth/v1/keystores")
+
+    fleet = eth_2_key_manager_api_client.Eth2KeyManagerFleet(nodes)
+    fleet_results = await fleet.gather("list_keys")
+
+    assert fleet_results["TEKU"].ok
+    assert fleet_results["LODESTAR"].ok
+    assert not fleet_results["NIMBUS"].ok
+    assert isinstance(fleet_results["NIMBUS"].exception, httpx.ConnectError)
+
+
+@pytest.mark.asyncio
+async def test_fleet_run_many_concurrency_limits():
+    in_flight = {"total": 0, "max_total": 0}
+    in_flight_per_node = {name: 0 for name, _, _ in nodes}
+    max_in_flight_per_node = {name: 0 for name, _, _ in nodes}
+
+    async def operation(manager, node):
+        in_flight["total"] += 1
+        in_flight_per_node[node] += 1
+        in_flight["max_total"] = max(in_flight["max_total"], in_flight["total"])
+        max_in_flight_per_node[node] = max(max_in_flight_per_node[node], in_flight_per_node[node])
+        await asyncio.sleep(0.001)
+        in_flight["total"] -= 1
+        in_flight_per_node[node] -= 1
+        return node
+
+    fleet = eth_2_key_manager_api_client.Eth2KeyManagerFleet(nodes, max_concurrency=4, max_concurrency_per_node=2)
+    calls = [(name, operation, (name,), {}) for name, _, _ in nodes for _ in range(10)]
+    fleet_results = [fleet_result async for fleet_result in fleet.run_many(calls)]
+
+    assert len(fleet_results) == 30
+    assert all(isinstance(fleet_result, FleetResult) and fleet_result.result == fleet_result.node for fleet_result in fleet_results)
+    assert in_flight["max_total"] <= 4
+    assert max(max_in_flight_per_node.values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_fleet_run_many_unknown_node():
+    fleet = eth_2_key_manager_api_client.Eth2KeyManagerFleet(nodes)
+
+    with pytest.raises(KeyError):
+        [fleet_result async for fleet_result in fleet.run_many([("PRYSM", "list_keys", (), {})])]
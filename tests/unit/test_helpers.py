@@ -1,5 +1,7 @@
 """Test cases for the helpers module."""
 
+import json
+
 import httpx
 import pytest
 
@@ -141,7 +143,8 @@ def test_get_kwargs_without_json_body():
     )
     kwargs = _get_kwargs(client=client, endpoint="test", method="GET")
     assert kwargs["headers"]["test_header"] == "test_value"
-    assert kwargs["cookies"]["test_cookie"] == "test_value"
+    assert "cookies" not in kwargs
+    assert client.get_httpx_client().cookies["test_cookie"] == "test_value"
     assert kwargs["url"] == "http://localhost:8080/eth/v1/test"
     assert kwargs["method"] == "GET"
     assert kwargs["timeout"] == 5.0
@@ -161,9 +164,50 @@ def test_get_kwargs_with_json_body():
     kwargs = _get_kwargs(client=client, endpoint="test", method="GET", json_body=json_body)
 
     assert kwargs["headers"]["test_header"] == "test_value"
-    assert kwargs["cookies"]["test_cookie"] == "test_value"
+    assert "cookies" not in kwargs
+    assert client.get_httpx_client().cookies["test_cookie"] == "test_value"
     assert kwargs["url"] == "http://localhost:8080/eth/v1/test"
     assert kwargs["method"] == "GET"
     assert kwargs["timeout"] == 5.0
     assert not kwargs["follow_redirects"]
-    assert kwargs["json"] == {"gas_limit": 999999}
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert json.loads(kwargs["content"]) == {"gas_limit": 999999}
+
+
+def test_build_response_parses_lazily(monkeypatch):
+    """Test that _build_response only parses the body on first access of Response.parsed."""
+    response = httpx.Response(200, json=mock_response_list_remote_keys_200)
+    client = AuthenticatedClient(base_url="http://localhost:8080", token="test_token")
+    from_dict_calls = []
+    from_dict = ListRemoteKeysResponse.from_dict.__func__
+    monkeypatch.setattr(ListRemoteKeysResponse, "from_dict", classmethod(lambda cls, src_dict: from_dict_calls.append(src_dict) or from_dict(cls, src_dict)))
+
+    built_response = _build_response(client=client, response=response, cls=ListRemoteKeysResponse)
+
+    assert built_response.status_code == 200
+    assert from_dict_calls == []
+    assert isinstance(built_response.parsed, ListRemoteKeysResponse)
+    assert built_response.parsed is built_response.parsed
+    assert len(from_dict_calls) == 1
+
+
+def test_build_response_status_only():
+    """Test that _build_response does not parse the body when Client.parse_response is False."""
+    response = httpx.Response(200, content=b"not json")
+    client = AuthenticatedClient(base_url="http://localhost:8080", token="test_token", parse_response=False)
+
+    built_response = _build_response(client=client, response=response, cls=ListRemoteKeysResponse)
+
+    assert built_response.status_code == 200
+    assert built_response.content == b"not json"
+    assert built_response.parsed is None
+
+
+def test_build_response_raises_eagerly():
+    """Test that _build_response raises on unexpected status codes before Response.parsed is accessed."""
+    client = AuthenticatedClient(base_url="http://localhost:8080", token="test_token", raise_on_unexpected_status=True, parse_response=False)
+
+    with pytest.raises(errors.UnexpectedStatus):
+        _build_response(client=client, response=httpx.Response(418), cls=ListRemoteKeysResponse)
+    with pytest.raises(errors.ModelClassUnspecified):
+        _build_response(client=client, response=httpx.Response(200, json={}))
@@ -0,0 +1,76 @@
+"""Unit tests for the json_codec module."""
+
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.client import AuthenticatedClient
+from eth_2_key_manager_api_client.json_codec import STDLIB_JSON_CODEC, JSONCodec, get_json_codec
+from eth_2_key_manager_api_client.models.list_keys_response import ListKeysResponse
+
+from ..mocks import mock_response_400
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec", "json"])
+def test_json_codec_round_trip(name):
+    try:
+        json_codec = get_json_codec(name)
+    except ValueError:
+        pytest.skip(f"{name} is not installed")
+
+    obj = {"keystores": ['{"pubkey": "0x99c4"}'], "passwords": ["ünïcödé"]}
+    encoded = json_codec.dumps(obj)
+
+    assert isinstance(encoded, bytes)
+    assert json_codec.loads(encoded) == obj
+    assert json.loads(encoded) == obj
+
+
+def test_get_json_codec_default():
+    assert get_json_codec().name in ("orjson", "msgspec", "json")
+    assert AuthenticatedClient(base_url="http://localhost:8080", token="test_token").json_codec.name == get_json_codec().name
+
+
+def test_get_json_codec_unknown():
+    with pytest.raises(ValueError):
+        get_json_codec("simplejson")
+
+
+def test_custom_json_codec(httpx_mock: HTTPXMock):
+    calls = []
+
+    def dumps(obj):
+        calls.append("dumps")
+        return STDLIB_JSON_CODEC.dumps(obj)
+
+    def loads(content):
+        calls.append("loads")
+        return STDLIB_JSON_CODEC.loads(content)
+
+    httpx_mock.add_response(status_code=200, json={"data": [{"status": "deleted"}], "slashing_protection": "{}"})
+    httpx_mock.add_response(status_code=400, json=mock_response_400)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(
+        base_url="http://localhost:8080", token="test_token", json_codec=JSONCodec(name="custom", dumps=dumps, loads=loads)
+    )
+    eth_2_key_manager.delete_keys.sync(pubkeys=["0x99c4"])
+    response = eth_2_key_manager.list_keys.sync_detailed()
+
+    assert calls == ["dumps", "loads"]
+    assert response.parsed.message == mock_response_400["message"]
+    assert calls == ["dumps", "loads", "loads"]
+    request = httpx_mock.get_requests()[0]
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == {"pubkeys": ["0x99c4"]}
+
+
+def test_json_codec_decodes_response(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=200, json={"data": [{"validating_pubkey": "0x99c4", "readonly": False}]})
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token", json_codec=STDLIB_JSON_CODEC)
+    response = eth_2_key_manager.list_keys.sync_detailed()
+
+    assert isinstance(response.parsed, ListKeysResponse)
+    assert response.parsed.data[0].validating_pubkey == "0x99c4"
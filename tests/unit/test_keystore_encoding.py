@@ -0,0 +1,87 @@
+"""Unit tests for the KeystoreEncodingCache class."""
+
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.json_codec import STDLIB_JSON_CODEC, get_json_codec
+from eth_2_key_manager_api_client.keystore_encoding import KeystoreEncodingCache
+from eth_2_key_manager_api_client.models.import_keystores_json_body import ImportKeystoresJsonBody
+from eth_2_key_manager_api_client.types import UNSET
+
+keystores = [json.dumps({"pubkey": f"{i:096x}", "description": 'quote " and ünicode'}) for i in range(3)]
+passwords = ["password0", 'pass"word1', "pässword2"]
+
+
+@pytest.mark.parametrize("json_codec", [STDLIB_JSON_CODEC, get_json_codec()])
+@pytest.mark.parametrize("slashing_protection_data", [UNSET, '{"data": []}'])
+def test_build_import_keystores_body_matches_model(json_codec, slashing_protection_data):
+    cache = KeystoreEncodingCache()
+    body = cache.build_import_keystores_body(json_codec, keystores, passwords, slashing_protection_data)
+
+    json_body = ImportKeystoresJsonBody(keystores=keystores, passwords=passwords, slashing_protection=slashing_protection_data)
+    assert body == json_codec.dumps(json_body.to_dict())
+    assert len(cache) == len(keystores)
+
+
+def test_encoding_is_cached():
+    calls = []
+
+    def dumps(obj):
+        calls.append(obj)
+        return STDLIB_JSON_CODEC.dumps(obj)
+
+    json_codec = STDLIB_JSON_CODEC.__class__(name="counting", dumps=dumps, loads=json.loads)
+    cache = KeystoreEncodingCache()
+
+    first = cache.build_import_keystores_body(json_codec, keystores, passwords)
+    calls.clear()
+    second = cache.build_import_keystores_body(json_codec, keystores, passwords)
+
+    assert first == second
+    # only the passwords are encoded again
+    assert calls == [passwords]
+    assert cache.size_bytes == sum(len(keystore) + len(STDLIB_JSON_CODEC.dumps(keystore)) for keystore in keystores)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_encoding_cache_eviction():
+    entry_size = len(keystores[0]) + len(STDLIB_JSON_CODEC.dumps(keystores[0]))
+    cache = KeystoreEncodingCache(max_bytes=2 * entry_size)
+
+    for keystore in keystores:
+        cache.encode(STDLIB_JSON_CODEC, keystore)
+    assert len(cache) == 2
+    assert cache.size_bytes <= 2 * entry_size
+
+    disabled_cache = KeystoreEncodingCache(max_bytes=0)
+    assert disabled_cache.encode(STDLIB_JSON_CODEC, keystores[0]) == STDLIB_JSON_CODEC.dumps(keystores[0])
+    assert len(disabled_cache) == 0
+
+
+def test_import_keystores_uses_encoding_cache(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=200, json={"data": [{"status": "imported"} for _ in keystores]})
+    cache = KeystoreEncodingCache()
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token", keystore_encoding_cache=cache)
+    eth_2_key_manager.import_keystores.sync_detailed(keystores, passwords, '{"data": []}')
+
+    request = httpx_mock.get_requests()[0]
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == {"keystores": keystores, "passwords": passwords, "slashing_protection": '{"data": []}'}
+    assert len(cache) == len(keystores)
+
+
+def test_import_keystores_without_encoding_cache(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=200, json={"data": [{"status": "imported"} for _ in keystores]})
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    eth_2_key_manager.import_keystores.sync_detailed(keystores, passwords)
+
+    assert eth_2_key_manager.import_keystores.keystore_encoding_cache is None
+    assert json.loads(httpx_mock.get_requests()[0].content) == {"keystores": keystores, "passwords": passwords}
@@ -0,0 +1,103 @@
+"""Unit tests for the KeystoreLoader class."""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.keystore_encoding import KeystoreEncodingCache
+from eth_2_key_manager_api_client.keystore_loader import KeystoreLoader
+
+files = {f"keystore-m_12381_3600_{i}_0_0-1680087924": (json.dumps({"pubkey": f"{i:096x}"}), f"password{i}") for i in range(3)}
+expected_pairs = [(keystore, password) for keystore, password in files.values()]
+
+
+def write_directory(path):
+    path.mkdir()
+    for name, (keystore, password) in files.items():
+        (path / f"{name}.json").write_text(keystore)
+        (path / f"{name}.txt").write_text(f"{password}\n")
+    (path / "deposit_data-1680087924.json").write_text("[]")
+    return path
+
+
+def test_keystore_loader_directory(tmp_path):
+    assert list(KeystoreLoader(write_directory(tmp_path / "validator_keys"))) == expected_pairs
+
+
+def test_keystore_loader_zip(tmp_path):
+    archive_path = tmp_path / "validator_keys.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        for name, (keystore, password) in reversed(files.items()):
+            archive.writestr(f"validator_keys/{name}.txt", f"{password}\r\n")
+            archive.writestr(f"validator_keys/{name}.json", keystore)
+
+    assert list(KeystoreLoader(archive_path)) == expected_pairs
+
+
+@pytest.mark.parametrize("mode", ["w", "w:gz"])
+def test_keystore_loader_tar(tmp_path, mode):
+    archive_path = tmp_path / "validator_keys.tar"
+    with tarfile.open(archive_path, mode) as archive:
+        for name, (keystore, password) in files.items():
+            # password files before and after their keystore
+            members = [(f"{name}.json", keystore), (f"{name}.txt", f"{password}\n")]
+            for member_name, content in members if name.endswith("0_0_0-1680087924") else reversed(members):
+                data = content.encode()
+                member = tarfile.TarInfo(f"validator_keys/{member_name}")
+                member.size = len(data)
+                archive.addfile(member, io.BytesIO(data))
+
+    assert list(KeystoreLoader(archive_path)) == expected_pairs
+
+
+def test_keystore_loader_missing_password(tmp_path):
+    path = write_directory(tmp_path / "validator_keys")
+    next(path.glob("*.txt")).unlink()
+
+    with pytest.raises(ValueError):
+        list(KeystoreLoader(path))
+    assert [password for _, password in KeystoreLoader(path, password="default")].count("default") == 1
+
+
+def test_keystore_loader_invalid_source(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        iter(KeystoreLoader(tmp_path / "missing"))
+
+    (tmp_path / "keystore.json").write_text("{}")
+    with pytest.raises(ValueError):
+        iter(KeystoreLoader(tmp_path / "keystore.json"))
+
+
+def test_bulk_import_keystores_from_loader(httpx_mock: HTTPXMock, tmp_path):
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(status_code=200, json={"data": [{"status": "imported"} for _ in json.loads(request.content)["keystores"]]})
+    )
+    cache = KeystoreEncodingCache()
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token", keystore_encoding_cache=cache)
+    eth_2_key_manager.bulk_import_keystores.initial_chunk_size = 2
+    response = eth_2_key_manager.bulk_import_keystores.sync_from_pairs(KeystoreLoader(write_directory(tmp_path / "validator_keys")))
+
+    assert [json.loads(request.content)["passwords"] for request in httpx_mock.get_requests()] == [["password0", "password1"], ["password2"]]
+    assert [data_item.status for data_item in response.data] == ["imported"] * 3
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_keystores_from_pairs_asyncio(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(status_code=200, json={"data": [{"status": "imported"} for _ in json.loads(request.content)["keystores"]]})
+    )
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    eth_2_key_manager.bulk_import_keystores.initial_chunk_size = 1
+    response = await eth_2_key_manager.bulk_import_keystores.asyncio_from_pairs(pair for pair in expected_pairs)
+
+    assert sorted(sum((json.loads(request.content)["passwords"] for request in httpx_mock.get_requests()), [])) == [password for _, password in expected_pairs]
+    assert len(response.data) == 3
@@ -0,0 +1,133 @@
+"""Unit tests for the KeystorePrecheck class."""
+
+import hashlib
+import json
+import os
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client import keystore_precheck
+from eth_2_key_manager_api_client.keystore_precheck import KeystorePrecheck, check_keystore_password
+
+MOCK_KEYSTORE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "examples", "mock_validator_keystores")
+
+
+def make_keystore(password: bytes, kdf_function: str = "scrypt", uuid: str = "6d4913af-4cc2-457f-a962-39eca6d0dd37") -> str:
+    salt = os.urandom(32)
+    if kdf_function == "scrypt":
+        kdf_params = {"dklen": 32, "n": 16, "r": 8, "p": 1, "salt": salt.hex()}
+        derived_key = hashlib.scrypt(password, salt=salt, n=16, r=8, p=1, dklen=32)
+    else:
+        kdf_params = {"dklen": 32, "c": 2, "prf": "hmac-sha256", "salt": salt.hex()}
+        derived_key = hashlib.pbkdf2_hmac("sha256", password, salt, 2, dklen=32)
+    cipher_message = os.urandom(32)
+    return json.dumps(
+        {
+            "crypto": {
+                "kdf": {"function": kdf_function, "params": kdf_params, "message": ""},
+                "checksum": {"function": "sha256", "params": {}, "message": hashlib.sha256(derived_key[16:32] + cipher_message).hexdigest()},
+                "cipher": {"function": "aes-128-ctr", "params": {"iv": os.urandom(16).hex()}, "message": cipher_message.hex()},
+            },
+            "uuid": uuid,
+            "version": 4,
+        }
+    )
+
+
+@pytest.mark.parametrize("kdf_function", ["scrypt", "pbkdf2"])
+def test_check_keystore_password(kdf_function):
+    keystore = make_keystore(b"password", kdf_function)
+
+    assert check_keystore_password(keystore, "password") is None
+    # control codes are removed from passwords as defined in EIP-2335
+    assert check_keystore_password(keystore, "pass\x7fword\n") is None
+    assert check_keystore_password(keystore, "wrong password") == "Invalid keystore password"
+
+
+def test_check_keystore_password_mock_keystore():
+    with open(os.path.join(MOCK_KEYSTORE_DIR, "keystore-m_12381_3600_0_0_0-1669980799.json")) as f:
+        keystore = f.read()
+
+    assert check_keystore_password(keystore, "validatorkey") is None
+
+
+def test_check_keystore_password_unverifiable():
+    keystore = json.loads(make_keystore(b"password"))
+    keystore["crypto"]["kdf"]["function"] = "argon2"
+
+    assert check_keystore_password(json.dumps(keystore), "password") is None
+    assert check_keystore_password("not json", "password").startswith("Invalid keystore")
+    assert check_keystore_password(json.dumps({"crypto": {}}), "password").startswith("Invalid keystore")
+
+
+def test_keystore_precheck_process_pool():
+    keystores = [make_keystore(f"password{i}".encode(), uuid=str(i)) for i in range(4)]
+    passwords = ["password0", "wrong", "password2", "wrong"]
+
+    with KeystorePrecheck(max_workers=2, start_method="spawn") as precheck:
+        assert precheck.check(keystores, passwords) == [None, "Invalid keystore password", None, "Invalid keystore password"]
+        executor = precheck._executor
+        precheck.clear_cache()
+        assert precheck.check(keystores[:2], passwords[:2]) == [None, "Invalid keystore password"]
+        # the worker processes are reused
+        assert precheck._executor is executor
+    assert precheck._executor is None
+
+    with pytest.raises(ValueError):
+        KeystorePrecheck().check(keystores, passwords[:1])
+    with pytest.raises(ValueError):
+        KeystorePrecheck(start_method="thread")
+
+
+def test_keystore_precheck_cache(monkeypatch):
+    keystores = [make_keystore(b"password0", uuid="0"), make_keystore(b"password1", uuid="1")]
+    passwords = ["password0", "wrong"]
+    checked = []
+
+    def counting_check(keystore, password):
+        checked.append(password)
+        return check_keystore_password(keystore, password)
+
+    monkeypatch.setattr(keystore_precheck, "check_keystore_password", counting_check)
+    precheck = KeystorePrecheck(max_workers=1)
+
+    first = precheck.check(keystores, passwords)
+    second = precheck.check(keystores, passwords)
+    precheck.check(keystores, ["password0", "password1"])
+
+    assert first == second == [None, "Invalid keystore password"]
+    assert checked == ["password0", "wrong", "password1"]
+
+    precheck.clear_cache()
+    precheck.check(keystores[:1], passwords[:1])
+    assert checked[-1] == "password0"
+
+
+def test_bulk_import_keystores_precheck(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(status_code=200, json={"data": [{"status": "imported"} for _ in json.loads(request.content)["keystores"]]})
+    )
+    keystores = [make_keystore(f"password{i}".encode(), uuid=str(i)) for i in range(3)]
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    eth_2_key_manager.bulk_import_keystores.precheck = KeystorePrecheck(max_workers=1)
+    response = eth_2_key_manager.bulk_import_keystores.sync(keystores, ["password0", "wrong", "password2"])
+
+    assert [json.loads(request.content)["passwords"] for request in httpx_mock.get_requests()] == [["password0", "password2"]]
+    assert [data_item.status for data_item in response.data] == ["imported", "error", "imported"]
+    assert response.data[1].message == "Invalid keystore password"
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_keystores_precheck_asyncio(httpx_mock: HTTPXMock):
+    keystores = [make_keystore(f"password{i}".encode(), uuid=str(i)) for i in range(2)]
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    eth_2_key_manager.bulk_import_keystores.precheck = KeystorePrecheck(max_workers=1)
+    response = await eth_2_key_manager.bulk_import_keystores.asyncio(keystores, ["wrong", "wrong"])
+
+    assert httpx_mock.get_requests() == []
+    assert [data_item.status for data_item in response.data] == ["error", "error"]
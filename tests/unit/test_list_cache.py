@@ -0,0 +1,108 @@
+"""Unit tests for the ListCache class."""
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from eth_2_key_manager_api_client.list_cache import ListCache
+
+from ..mocks import mock_fee_recipient, mock_key_manager, mock_pubkey, mock_response_401, mock_response_list_keys_200, sent_requests
+
+
+def test_list_cache_disabled_by_default(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_callback(mock_key_manager())
+
+    eth_2_key_manager = eth_2_key_manager_with()
+    eth_2_key_manager.list_keys.sync_detailed()
+    eth_2_key_manager.list_keys.sync_detailed()
+
+    assert eth_2_key_manager.client.list_cache is None
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_list_cache_hits_and_invalidation(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_callback(mock_key_manager())
+
+    eth_2_key_manager = eth_2_key_manager_with(list_cache_ttl=60.0)
+    first = eth_2_key_manager.list_keys.sync()
+    second = eth_2_key_manager.list_keys.sync()
+    eth_2_key_manager.list_remote_keys.sync()
+    eth_2_key_manager.list_remote_keys.sync()
+    # unrelated writes keep the cache
+    eth_2_key_manager.set_fee_recipient.sync_detailed(mock_pubkey, mock_fee_recipient)
+    eth_2_key_manager.list_keys.sync()
+    eth_2_key_manager.delete_keys.sync_detailed([mock_pubkey])
+    eth_2_key_manager.list_keys.sync()
+    eth_2_key_manager.list_remote_keys.sync()
+
+    assert first == second
+    assert first is not second
+    assert sent_requests(httpx_mock) == [
+        ("GET", "/eth/v1/keystores"),
+        ("GET", "/eth/v1/remotekeys"),
+        ("POST", "/eth/v1/validator/0x93247f2209abcacf57b75a51dafae777f9dd38bc7053d1af526f220a7489a6d3a2753e5f3e8b1cfe39b56f43611df74a/feerecipient"),
+        ("DELETE", "/eth/v1/keystores"),
+        ("GET", "/eth/v1/keystores"),
+        ("GET", "/eth/v1/remotekeys"),
+    ]
+    assert eth_2_key_manager.client.list_cache.hits == 3
+    assert eth_2_key_manager.client.list_cache.misses == 4
+
+
+def test_list_cache_expiry(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_callback(mock_key_manager())
+
+    eth_2_key_manager = eth_2_key_manager_with(list_cache_ttl=0.0)
+    eth_2_key_manager.list_keys.sync()
+    eth_2_key_manager.list_keys.sync()
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_list_cache_only_caches_ok_responses(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(status_code=401, json=mock_response_401)
+
+    eth_2_key_manager = eth_2_key_manager_with(list_cache_ttl=60.0)
+    eth_2_key_manager.list_keys.sync()
+    eth_2_key_manager.list_keys.sync()
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_list_cache_invalidated_by_failed_mutation(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_callback(mock_key_manager(), method="GET")
+    httpx_mock.add_exception(httpx.ReadTimeout("Read timed out"), method="POST")
+
+    eth_2_key_manager = eth_2_key_manager_with(list_cache_ttl=60.0)
+    eth_2_key_manager.list_remote_keys.sync()
+    with pytest.raises(httpx.ReadTimeout):
+        eth_2_key_manager.import_remote_keys.sync([{"pubkey": mock_pubkey}])
+    eth_2_key_manager.list_remote_keys.sync()
+
+    assert [method for method, _ in sent_requests(httpx_mock)] == ["GET", "POST", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_list_cache_asyncio(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_callback(mock_key_manager())
+
+    eth_2_key_manager = eth_2_key_manager_with(list_cache_ttl=60.0)
+    await eth_2_key_manager.list_remote_keys.asyncio()
+    await eth_2_key_manager.list_remote_keys.asyncio()
+    await eth_2_key_manager.import_remote_keys.asyncio([{"pubkey": mock_pubkey}])
+    await eth_2_key_manager.list_remote_keys.asyncio()
+
+    assert [method for method, _ in sent_requests(httpx_mock)] == ["GET", "POST", "GET"]
+
+
+def test_list_cache_discards_stale_responses():
+    list_cache = ListCache(ttl=60.0)
+    kwargs = {"method": "GET", "url": "http://localhost:8080/eth/v1/keystores"}
+
+    generation = list_cache.generation
+    list_cache.invalidate()
+    list_cache.store(kwargs, httpx.Response(200, json=mock_response_list_keys_200), generation)
+    assert list_cache.lookup(kwargs) is None
+
+    list_cache.store(kwargs, httpx.Response(200, json=mock_response_list_keys_200), list_cache.generation)
+    assert list_cache.lookup(kwargs) is not None
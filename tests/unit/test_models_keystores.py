@@ -1,6 +1,7 @@
 # tests for models
 from eth_2_key_manager_api_client.models.delete_keys_json_body import DeleteKeysJsonBody
 from eth_2_key_manager_api_client.models.import_keystores_json_body import ImportKeystoresJsonBody
+from eth_2_key_manager_api_client.models.list_keys_response_data_item import ListKeysResponseDataItem
 
 
 def test_delete_keys_json_body():
@@ -33,3 +34,27 @@ def test_import_keystores_json_body(keystore_str, keystore_password_str, slashin
     assert import_keystores_json_body.slashing_protection == slashing_protection_str
 
     assert import_keystores_json_body.to_dict() == src_dict
+
+
+def test_list_keys_response_data_item_additional_properties():
+    """Test that ListKeysResponseDataItem is slotted and only allocates additional_properties for unknown keys"""
+
+    pubkey = "0x874bed7931ba14832198a4070b881f89e7ddf81898dd800446ef382344e9726a5e6265acb21f5c8ee2759c313ec6ca0d"
+    data_item = ListKeysResponseDataItem.from_dict({"validating_pubkey": pubkey, "readonly": False})
+
+    assert not hasattr(data_item, "__dict__")
+    assert data_item._additional_properties is None
+    assert data_item.to_dict() == {"validating_pubkey": pubkey, "readonly": False}
+    assert data_item == ListKeysResponseDataItem(validating_pubkey=pubkey, readonly=False)
+
+    data_item_with_extra_key = ListKeysResponseDataItem.from_dict({"validating_pubkey": pubkey, "readonly": False, "extra": 1})
+
+    assert data_item_with_extra_key.additional_keys == ["extra"]
+    assert data_item_with_extra_key["extra"] == 1
+    assert data_item_with_extra_key.to_dict() == {"validating_pubkey": pubkey, "readonly": False, "extra": 1}
+    assert data_item_with_extra_key != data_item
+
+    data_item["extra"] = 1
+    assert data_item == data_item_with_extra_key
+    del data_item["extra"]
+    assert data_item == ListKeysResponseDataItem(validating_pubkey=pubkey, readonly=False)
@@ -0,0 +1,80 @@
+"""Unit tests for the Pubkey class."""
+
+import pickle
+
+import pytest
+
+from eth_2_key_manager_api_client.pubkey import Pubkey
+
+pubkey_hex = "0x99c4c42fac7d1393956bd9e2785ed67cf5aaca4bf56d2fcda94c42d6042aebb1723ce6bac6f0216ff8c5d4f9f013008b"
+
+
+def test_pubkey_forms():
+    pubkey = Pubkey(pubkey_hex)
+
+    assert bytes(pubkey) == bytes.fromhex(pubkey_hex[2:])
+    assert pubkey.hex_str == pubkey_hex
+    assert f"{pubkey}" == pubkey_hex
+    assert str(pubkey) == pubkey_hex
+    assert repr(pubkey) == f"Pubkey('{pubkey_hex}')"
+
+
+def test_pubkey_normalisation():
+    pubkey = Pubkey(pubkey_hex)
+
+    assert Pubkey(pubkey_hex.upper().replace("0X", "0x")) == pubkey
+    assert Pubkey(pubkey_hex[2:]) == pubkey
+    assert Pubkey(f" {pubkey_hex} ") == pubkey
+    assert Pubkey(bytes(pubkey)) == pubkey
+    assert Pubkey(pubkey) is pubkey
+    assert pickle.loads(pickle.dumps(pubkey)) == pubkey
+
+
+def test_pubkey_interning():
+    pubkey = Pubkey.intern(pubkey_hex)
+
+    assert Pubkey.intern(pubkey_hex.upper().replace("0X", "0x")) is pubkey
+    assert Pubkey.intern(bytes(pubkey)) is pubkey
+    assert Pubkey.intern(Pubkey(pubkey_hex)) is pubkey
+    assert Pubkey(pubkey_hex) is not pubkey
+
+    Pubkey.clear_interned()
+    assert Pubkey.intern(pubkey_hex) is not pubkey
+
+
+def test_pubkey_interned_hex_str_is_cached():
+    pubkey = Pubkey.intern(pubkey_hex)
+
+    assert pubkey.hex_str == pubkey_hex
+    assert pubkey.hex_str is pubkey.hex_str
+    assert Pubkey(pubkey_hex).hex_str == pubkey_hex
+
+
+def test_pubkey_intern_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(Pubkey, "max_interned", 2)
+    Pubkey.clear_interned()
+    pubkeys = [Pubkey.intern(f"0x{i:096x}") for i in range(3)]
+
+    # the least recently interned pubkey was released, the others are still canonical
+    assert Pubkey.intern(f"0x{0:096x}") is not pubkeys[0]
+    assert Pubkey.intern(f"0x{2:096x}") is pubkeys[2]
+    assert len(Pubkey._interned) == 2
+    Pubkey.clear_interned()
+
+
+def test_pubkey_hashing_and_ordering():
+    pubkeys = [Pubkey(f"0x{i:096x}") for i in (3, 1, 2)]
+
+    assert {Pubkey(f"0x{1:096x}"): "one"}[pubkeys[1]] == "one"
+    assert len(set(pubkeys) | {Pubkey(f"0x{3:096X}")}) == 3
+    assert sorted(pubkeys) == [pubkeys[1], pubkeys[2], pubkeys[0]]
+    assert pubkeys[0] != pubkey_hex
+    assert pubkeys[0] == bytes(pubkeys[0])
+
+
+@pytest.mark.parametrize("value", ["0x1234", "not hex", b"\x00" * 47, "0x" + "00" * 49])
+def test_pubkey_invalid(value):
+    with pytest.raises(ValueError):
+        Pubkey(value)
+    with pytest.raises(ValueError):
+        Pubkey.intern(value)
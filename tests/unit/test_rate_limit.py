@@ -0,0 +1,87 @@
+"""Unit tests for the RateLimiter class."""
+
+import asyncio
+import time
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from eth_2_key_manager_api_client.rate_limit import RateLimit, RateLimiter, TokenBucket
+
+from ..mocks import mock_base_url, mock_fee_recipient, mock_pubkey, mock_response_list_keys_200
+
+list_fee_recipient_response = {"data": {"pubkey": mock_pubkey, "ethaddress": mock_fee_recipient}}
+
+
+def test_token_bucket_burst_and_rate():
+    bucket = TokenBucket(RateLimit(rate=10.0, burst=3))
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # waiting requests are spaced evenly
+    assert [bucket.reserve() for _ in range(3)] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+    bucket.refund()
+    assert bucket.reserve() == pytest.approx(0.3, abs=0.01)
+
+
+def test_rate_limiter_validation():
+    with pytest.raises(ValueError, match="ImportKeystore"):
+        RateLimiter(endpoints={"ImportKeystore": RateLimit(rate=1.0)})
+    with pytest.raises(ValueError):
+        RateLimiter(node=RateLimit(rate=0.0))
+
+
+def test_rate_limiter_buckets():
+    rate_limiter = RateLimiter(node=RateLimit(rate=20.0), endpoints={"ImportKeystores": RateLimit(rate=0.5)})
+    import_kwargs = {"method": "POST", "url": f"{mock_base_url}/eth/v1/keystores"}
+    list_kwargs = {"method": "GET", "url": f"{mock_base_url}/eth/v1/keystores"}
+
+    import_buckets = rate_limiter.get_buckets(mock_base_url, import_kwargs)
+    list_buckets = rate_limiter.get_buckets(mock_base_url, list_kwargs)
+
+    assert [bucket.rate_limit for bucket in import_buckets] == [RateLimit(rate=0.5), RateLimit(rate=20.0)]
+    assert list_buckets == [import_buckets[1]] and list_buckets[0] is import_buckets[1]
+    assert rate_limiter.get_buckets("http://localhost:9090", list_kwargs)[0] is not list_buckets[0]
+    assert RateLimiter().get_buckets(mock_base_url, import_kwargs) == []
+
+
+def test_rate_limiter_sync(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(status_code=200, json=mock_response_list_keys_200)
+    eth_2_key_manager = eth_2_key_manager_with(rate_limiter=RateLimiter(node=RateLimit(rate=50.0, burst=2)))
+
+    start = time.monotonic()
+    for _ in range(5):
+        eth_2_key_manager.list_keys.sync_detailed()
+
+    # 2 requests from the burst, 3 paced at 20 ms
+    assert time.monotonic() - start >= 0.055
+    assert len(httpx_mock.get_requests()) == 5
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_per_endpoint_class_asyncio(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(url=f"{mock_base_url}/eth/v1/keystores", status_code=200, json=mock_response_list_keys_200)
+    httpx_mock.add_response(url=f"{mock_base_url}/eth/v1/validator/{mock_pubkey}/feerecipient", status_code=200, json=list_fee_recipient_response)
+    rate_limiter = RateLimiter(endpoints={"ListKeys": RateLimit(rate=20.0)})
+    eth_2_key_manager = eth_2_key_manager_with(rate_limiter=rate_limiter)
+
+    start = time.monotonic()
+    await asyncio.gather(*(eth_2_key_manager.list_fee_recipient.asyncio_detailed(mock_pubkey) for _ in range(10)))
+    assert time.monotonic() - start < 0.1
+
+    start = time.monotonic()
+    await asyncio.gather(*(eth_2_key_manager.list_keys.asyncio_detailed() for _ in range(4)))
+    assert time.monotonic() - start >= 0.145
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_cancelled_waiter_refunds_token():
+    bucket = TokenBucket(RateLimit(rate=10.0))
+    await bucket.aacquire()
+
+    waiting = asyncio.ensure_future(bucket.aacquire())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
@@ -0,0 +1,174 @@
+"""Unit tests for the Reconciler class."""
+
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.errors import KeyStateUnavailable
+from eth_2_key_manager_api_client.reconcile import ReconcileResult
+
+from ..mocks import mock_key_manager, mock_response_401
+
+pubkeys = [f"0x{i:096x}" for i in range(6)]
+keystores = [json.dumps({"pubkey": pubkey[2:]}) for pubkey in pubkeys]
+
+list_keys_response = {
+    "data": [
+        {"validating_pubkey": pubkeys[0], "derivation_path": "m/12381/3600/0/0/0", "readonly": False},
+        {"validating_pubkey": pubkeys[1], "derivation_path": "m/12381/3600/1/0/0", "readonly": False},
+        {"validating_pubkey": pubkeys[2], "derivation_path": "m/12381/3600/2/0/0", "readonly": True},
+    ]
+}
+list_remote_keys_response = {
+    "data": [
+        {"pubkey": pubkeys[3], "url": "https://remote.signer", "readonly": False},
+        {"pubkey": pubkeys[4], "url": "https://old.remote.signer", "readonly": False},
+    ]
+}
+
+
+def sent_mutations(httpx_mock: HTTPXMock):
+    return [(request.method, request.url.path, json.loads(request.content)) for request in httpx_mock.get_requests() if request.method != "GET"]
+
+
+def test_reconcile_plan_sync(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(mock_key_manager(list_keys_response, list_remote_keys_response))
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    plan = eth_2_key_manager.reconcile.plan_sync(
+        desired_local=[(keystores[0], "password0"), (keystores[5], "password5")],
+        desired_remote=[
+            {"pubkey": pubkeys[1], "url": "https://remote.signer"},
+            {"pubkey": pubkeys[4].upper().replace("0X", "0x"), "url": "https://remote.signer"},
+        ],
+    )
+
+    assert plan.import_keystores == [(keystores[5], "password5")]
+    assert plan.delete_keys == [pubkeys[1]]
+    assert plan.import_remote_keys == [
+        {"pubkey": pubkeys[1], "url": "https://remote.signer"},
+        {"pubkey": pubkeys[4].upper().replace("0X", "0x"), "url": "https://remote.signer"},
+    ]
+    assert plan.delete_remote_keys == [pubkeys[4], pubkeys[3]]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_reconcile_plan_without_prune(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(mock_key_manager(list_keys_response, list_remote_keys_response))
+
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+    plan = eth_2_key_manager_api_client.reconcile.Reconciler(client, prune=False).plan_sync(desired_local=[(keystores[3], "password3")], desired_remote=[])
+
+    assert plan.import_keystores == [(keystores[3], "password3")]
+    assert plan.delete_keys == []
+    assert plan.delete_remote_keys == [pubkeys[3]]
+
+
+def test_reconcile_plan_is_empty(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(mock_key_manager(list_keys_response, list_remote_keys_response))
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    plan = eth_2_key_manager.reconcile.plan_sync(
+        desired_local=[(keystores[0], "password0"), (keystores[1], "password1")],
+        desired_remote=list_remote_keys_response["data"],
+    )
+
+    assert plan.is_empty
+
+
+def test_reconcile_plan_without_parse_response(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(mock_key_manager(list_keys_response, list_remote_keys_response))
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token", parse_response=False)
+    plan = eth_2_key_manager.reconcile.plan_sync(
+        desired_local=[(keystores[0], "password0"), (keystores[1], "password1")],
+        desired_remote=list_remote_keys_response["data"],
+    )
+
+    assert plan.is_empty
+
+
+def test_reconcile_sync(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(mock_key_manager(list_keys_response, list_remote_keys_response))
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    eth_2_key_manager.reconcile.batch_size = 1
+    result = eth_2_key_manager.reconcile.sync(desired_local=[(keystores[0], "password0"), (keystores[5], "password5")], desired_remote=[])
+
+    assert isinstance(result, ReconcileResult)
+    assert sent_mutations(httpx_mock) == [
+        ("DELETE", "/eth/v1/keystores", {"pubkeys": [pubkeys[1]]}),
+        ("DELETE", "/eth/v1/remotekeys", {"pubkeys": [pubkeys[3]]}),
+        ("DELETE", "/eth/v1/remotekeys", {"pubkeys": [pubkeys[4]]}),
+        ("POST", "/eth/v1/keystores", {"keystores": [keystores[5]], "passwords": ["password5"]}),
+    ]
+    assert result.delete_keys[0].parsed.slashing_protection == "{}"
+    assert len(result.delete_remote_keys) == 2
+    assert [data_item.status for data_item in result.import_keystores.data] == ["imported"]
+    assert result.import_remote_keys == []
+
+
+@pytest.mark.asyncio
+async def test_reconcile_asyncio(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(mock_key_manager(list_keys_response, list_remote_keys_response))
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    result = await eth_2_key_manager.reconcile.asyncio(
+        desired_local=[(keystores[0], "password0"), (keystores[1], "password1")],
+        desired_remote=[{"pubkey": pubkeys[3], "url": "https://remote.signer"}, {"pubkey": pubkeys[5]}],
+    )
+
+    assert sent_mutations(httpx_mock) == [
+        ("DELETE", "/eth/v1/remotekeys", {"pubkeys": [pubkeys[4]]}),
+        ("POST", "/eth/v1/remotekeys", {"remote_keys": [{"pubkey": pubkeys[5]}]}),
+    ]
+    assert result.import_keystores is None
+
+
+def test_reconcile_conflicting_pubkeys(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(mock_key_manager(list_keys_response, list_remote_keys_response))
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+
+    with pytest.raises(ValueError):
+        eth_2_key_manager.reconcile.plan_sync(desired_local=[(keystores[0], "password0")], desired_remote=[{"pubkey": pubkeys[0]}])
+
+
+def test_reconcile_empty_desired_key_set(httpx_mock: HTTPXMock):
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+
+    with pytest.raises(ValueError):
+        eth_2_key_manager.reconcile.sync(desired_local=[], desired_remote=[])
+    assert httpx_mock.get_requests() == []
+
+
+def test_reconcile_empty_desired_key_set_allowed(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(mock_key_manager(list_keys_response, list_remote_keys_response))
+
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+    plan = eth_2_key_manager_api_client.reconcile.Reconciler(client, allow_empty=True).plan_sync(desired_local=[], desired_remote=[])
+
+    assert plan.delete_keys == [pubkeys[0], pubkeys[1]]
+    assert plan.delete_remote_keys == [pubkeys[3], pubkeys[4]]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_empty_desired_key_set_without_prune(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(mock_key_manager(list_keys_response, list_remote_keys_response))
+
+    client = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token").client
+    plan = await eth_2_key_manager_api_client.reconcile.Reconciler(client, prune=False).plan_asyncio(desired_local=[], desired_remote=[])
+
+    assert plan.is_empty
+
+
+def test_reconcile_key_state_unavailable(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=401, json=mock_response_401)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+
+    with pytest.raises(KeyStateUnavailable):
+        eth_2_key_manager.reconcile.sync(desired_local=[(keystores[0], "password0")], desired_remote=[])
+    assert all(request.method == "GET" for request in httpx_mock.get_requests())
@@ -0,0 +1,127 @@
+"""Unit tests for the RetryPolicy class."""
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from eth_2_key_manager_api_client.retry import RetryPolicy
+
+from ..mocks import mock_fee_recipient, mock_pubkey, mock_response_500, mock_response_list_keys_200
+
+import_response = {"data": [{"status": "duplicate", "message": ""}]}
+
+
+def test_retry_disabled_by_default(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+
+    eth_2_key_manager = eth_2_key_manager_with()
+    with pytest.raises(httpx.ConnectError):
+        eth_2_key_manager.list_keys.sync()
+
+    assert eth_2_key_manager.client.retry_policy is None
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_retry_transient_errors(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+    httpx_mock.add_response(status_code=500, json=mock_response_500)
+    httpx_mock.add_response(status_code=200, json=mock_response_list_keys_200)
+
+    eth_2_key_manager = eth_2_key_manager_with(retry_policy=RetryPolicy(backoff=0.0))
+    response = eth_2_key_manager.list_keys.sync()
+
+    assert response.data[0].validating_pubkey == mock_pubkey
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_retry_max_attempts(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    for _ in range(2):
+        httpx_mock.add_response(status_code=503)
+
+    eth_2_key_manager = eth_2_key_manager_with(retry_policy=RetryPolicy(max_attempts=2, backoff=0.0))
+    response = eth_2_key_manager.list_keys.sync_detailed()
+
+    assert response.status_code == 503
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_retry_raises_last_exception(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    for _ in range(3):
+        httpx_mock.add_exception(httpx.ReadTimeout("Read timed out"))
+
+    eth_2_key_manager = eth_2_key_manager_with(retry_policy=RetryPolicy(backoff=0.0))
+    with pytest.raises(httpx.ReadTimeout):
+        eth_2_key_manager.delete_keys.sync([mock_pubkey])
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_retry_budget(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(status_code=503)
+
+    eth_2_key_manager = eth_2_key_manager_with(retry_policy=RetryPolicy(backoff=5.0, jitter=False, budget=1.0))
+    response = eth_2_key_manager.list_keys.sync_detailed()
+
+    assert response.status_code == 503
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_retry_imports(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_exception(httpx.ReadTimeout("Read timed out"))
+    httpx_mock.add_response(status_code=200, json=import_response)
+
+    eth_2_key_manager = eth_2_key_manager_with(retry_policy=RetryPolicy(backoff=0.0))
+    response = eth_2_key_manager.import_remote_keys.sync([{"pubkey": mock_pubkey, "url": "https://remote.signer"}])
+
+    assert response.data[0].status.value == "duplicate"
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 2
+    assert requests[0].content == requests[1].content
+
+
+def test_retry_non_idempotent_post(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_exception(httpx.ReadTimeout("Read timed out"))
+
+    eth_2_key_manager = eth_2_key_manager_with(retry_policy=RetryPolicy(backoff=0.0))
+    with pytest.raises(httpx.ReadTimeout):
+        eth_2_key_manager.set_fee_recipient.sync_detailed(mock_pubkey, mock_fee_recipient)
+    assert len(httpx_mock.get_requests()) == 1
+
+    # a request which was never sent is safe to repeat
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+    httpx_mock.add_response(status_code=202)
+    response = eth_2_key_manager.set_fee_recipient.sync_detailed(mock_pubkey, mock_fee_recipient)
+    assert response.status_code == 202
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_retry_not_repeated_for_streamed_bodies(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+
+    eth_2_key_manager = eth_2_key_manager_with(retry_policy=RetryPolicy(backoff=0.0))
+    with pytest.raises(httpx.ConnectError):
+        eth_2_key_manager.import_remote_keys_streaming.sync_detailed(iter([{"pubkey": mock_pubkey}]))
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_asyncio(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_exception(httpx.RemoteProtocolError("Server disconnected"))
+    httpx_mock.add_response(status_code=200, json=mock_response_list_keys_200)
+
+    eth_2_key_manager = eth_2_key_manager_with(retry_policy=RetryPolicy(backoff=0.0))
+    response = await eth_2_key_manager.list_keys.asyncio()
+
+    assert response.data[0].validating_pubkey == mock_pubkey
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_retry_delay():
+    retry_policy = RetryPolicy(backoff=1.0, max_backoff=5.0, jitter=False)
+
+    assert [retry_policy.get_delay(attempt, httpx.ConnectError("")) for attempt in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+    assert retry_policy.get_delay(1, httpx.Response(503, headers={"Retry-After": "3"})) == 3.0
+    assert retry_policy.get_delay(1, httpx.Response(503, headers={"Retry-After": "60"})) == 5.0
+    assert 0.0 <= RetryPolicy(backoff=1.0).get_delay(1, httpx.ConnectError("")) <= 1.0
@@ -0,0 +1,136 @@
+"""Unit tests for the SingleFlight class."""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ..mocks import mock_fee_recipient, mock_pubkey, mock_response_list_keys_200
+
+other_pubkey = "0xa3247f2209abcacf57b75a51dafae777f9dd38bc7053d1af526f220a7489a6d3a2753e5f3e8b1cfe39b56f43611df74a"
+
+
+def slow_callback(release: asyncio.Event):
+    async def callback(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        if request.url.path == "/eth/v1/keystores":
+            return httpx.Response(status_code=200, json=mock_response_list_keys_200)
+        pubkey_in_path = request.url.path.split("/")[4]
+        return httpx.Response(status_code=200, json={"data": {"pubkey": pubkey_in_path, "ethaddress": mock_fee_recipient}})
+
+    return callback
+
+
+async def gather_released(release: asyncio.Event, *coroutines):
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    await asyncio.sleep(0.01)
+    release.set()
+    return await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_disabled_by_default(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    release = asyncio.Event()
+    httpx_mock.add_callback(slow_callback(release))
+
+    eth_2_key_manager = eth_2_key_manager_with()
+    await gather_released(release, *(eth_2_key_manager.list_keys.asyncio_detailed() for _ in range(3)))
+
+    assert eth_2_key_manager.client.single_flight is None
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_request(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    release = asyncio.Event()
+    httpx_mock.add_callback(slow_callback(release))
+
+    eth_2_key_manager = eth_2_key_manager_with(single_flight=True)
+    responses = await gather_released(release, *(eth_2_key_manager.list_keys.asyncio_detailed() for _ in range(10)))
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert all(response is responses[0] for response in responses)
+    assert responses[0].parsed.data[0].validating_pubkey == mock_pubkey
+    assert eth_2_key_manager.client.single_flight.requests == 1
+    assert eth_2_key_manager.client.single_flight.shared == 9
+
+
+@pytest.mark.asyncio
+async def test_single_flight_keys_on_endpoint(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    release = asyncio.Event()
+    httpx_mock.add_callback(slow_callback(release))
+
+    eth_2_key_manager = eth_2_key_manager_with(single_flight=True)
+    responses = await gather_released(
+        release,
+        eth_2_key_manager.list_fee_recipient.asyncio(mock_pubkey),
+        eth_2_key_manager.list_fee_recipient.asyncio(other_pubkey),
+        eth_2_key_manager.list_fee_recipient.asyncio(mock_pubkey),
+    )
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert [response.data.pubkey for response in responses] == [mock_pubkey, other_pubkey, mock_pubkey]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_sends_sequential_requests(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    release = asyncio.Event()
+    release.set()
+    httpx_mock.add_callback(slow_callback(release))
+
+    eth_2_key_manager = eth_2_key_manager_with(single_flight=True)
+    first = await eth_2_key_manager.list_keys.asyncio_detailed()
+    second = await eth_2_key_manager.list_keys.asyncio_detailed()
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_exceptions(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    release = asyncio.Event()
+
+    async def failing_callback(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        raise httpx.ReadTimeout("Read timed out", request=request)
+
+    httpx_mock.add_callback(failing_callback)
+
+    eth_2_key_manager = eth_2_key_manager_with(single_flight=True)
+    tasks = [asyncio.ensure_future(eth_2_key_manager.list_keys.asyncio_detailed()) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert all(isinstance(result, httpx.ReadTimeout) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_caller(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    release = asyncio.Event()
+    httpx_mock.add_callback(slow_callback(release))
+
+    eth_2_key_manager = eth_2_key_manager_with(single_flight=True)
+    first = asyncio.ensure_future(eth_2_key_manager.list_keys.asyncio_detailed())
+    second = asyncio.ensure_future(eth_2_key_manager.list_keys.asyncio_detailed())
+    await asyncio.sleep(0.01)
+    first.cancel()
+    release.set()
+    response = await second
+
+    assert first.cancelled()
+    assert response.parsed.data[0].validating_pubkey == mock_pubkey
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_does_not_merge_writes(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(method="POST", status_code=202)
+
+    eth_2_key_manager = eth_2_key_manager_with(single_flight=True)
+    await asyncio.gather(*(eth_2_key_manager.set_fee_recipient.asyncio_detailed(mock_pubkey, mock_fee_recipient) for _ in range(3)))
+
+    assert len(httpx_mock.get_requests()) == 3
+    assert eth_2_key_manager.client.single_flight.requests == 0
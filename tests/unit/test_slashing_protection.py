@@ -0,0 +1,151 @@
+"""Unit tests for the slashing_protection module."""
+
+import json
+
+import pytest
+
+from eth_2_key_manager_api_client.errors import InterchangeMismatch
+from eth_2_key_manager_api_client.models.delete_keys_response import DeleteKeysResponse
+from eth_2_key_manager_api_client.pubkey import Pubkey
+from eth_2_key_manager_api_client.slashing_protection import (
+    InterchangeMerger,
+    SlashingProtectionIndex,
+    minimize_slashing_protection,
+)
+
+genesis_validators_root = "0x043db0d9a83813551ee2f33450d23797757d430911a9320530ad8a0eabc43efb"
+pubkeys = [f"0x{i:096x}" for i in range(1, 4)]
+
+
+def interchange(pubkeys, genesis_validators_root=genesis_validators_root):
+    return json.dumps(
+        {
+            "metadata": {"interchange_format_version": "5", "genesis_validators_root": genesis_validators_root},
+            "data": [
+                {
+                    "pubkey": pubkey,
+                    "signed_blocks": [{"slot": "4866645"}],
+                    "signed_attestations": [{"source_epoch": "154315", "target_epoch": "154316"}],
+                }
+                for pubkey in pubkeys
+            ],
+        }
+    )
+
+
+def test_slashing_protection_index_from_str(slashing_protection_str):
+    slashing_protection_index = SlashingProtectionIndex.from_str(slashing_protection_str)
+
+    assert len(slashing_protection_index) == 1
+    assert "0x876A9A7FADB5B9D2114A5180F9FE50B451CBAB5F241B42E476B724A3575E5A8277767BC5A7C831C63F066A9A725C53D6" in slashing_protection_index
+    assert json.loads(slashing_protection_index.to_str()) == json.loads(slashing_protection_str)
+
+
+def test_slashing_protection_index_subset():
+    slashing_protection_index = SlashingProtectionIndex.from_str(interchange(pubkeys))
+
+    subset = json.loads(slashing_protection_index.subset([pubkeys[2][2:].upper(), pubkeys[0], "0xunknown"]))
+
+    assert subset["metadata"]["genesis_validators_root"] == genesis_validators_root
+    assert [record["pubkey"] for record in subset["data"]] == [pubkeys[2], pubkeys[0]]
+    assert json.loads(slashing_protection_index.subset([]))["data"] == []
+    assert all(pubkey is Pubkey.intern(pubkey) for pubkey in slashing_protection_index.records)
+
+
+@pytest.mark.parametrize("document", ["not json", "[]", '{"data": []}', '{"metadata": {}, "data": [{}]}'])
+def test_slashing_protection_index_invalid(document):
+    with pytest.raises(ValueError):
+        SlashingProtectionIndex.from_str(document)
+
+
+def test_interchange_merger(tmp_path):
+    path = tmp_path / "slashing_protection_db.json"
+
+    with InterchangeMerger(path) as merger:
+        assert merger.add(interchange(pubkeys[:2])) == 2
+        assert merger.add(DeleteKeysResponse(data=[], slashing_protection=interchange([]))) == 0
+        assert merger.add(interchange(pubkeys[2:])) == 1
+
+    merged = json.loads(path.read_text())
+
+    assert merger.record_count == 3
+    assert merged["metadata"]["genesis_validators_root"] == genesis_validators_root
+    assert [record["pubkey"] for record in merged["data"]] == pubkeys
+    assert merged["data"][0]["signed_blocks"] == [{"slot": "4866645"}]
+
+
+def test_interchange_merger_genesis_validators_root_mismatch(tmp_path):
+    path = tmp_path / "slashing_protection_db.json"
+
+    with InterchangeMerger(path) as merger:
+        merger.add(interchange(pubkeys[:1]))
+        with pytest.raises(InterchangeMismatch):
+            merger.add(interchange(pubkeys[1:], genesis_validators_root="0x00"))
+
+    assert [record["pubkey"] for record in json.loads(path.read_text())["data"]] == pubkeys[:1]
+
+
+def test_interchange_merger_no_documents(tmp_path):
+    path = tmp_path / "slashing_protection_db.json"
+
+    InterchangeMerger(path).close()
+
+    assert not path.exists()
+
+
+def test_interchange_merger_closed(tmp_path):
+    merger = InterchangeMerger(tmp_path / "slashing_protection_db.json")
+    merger.close()
+
+    with pytest.raises(ValueError):
+        merger.add(interchange(pubkeys))
+
+
+def test_minimize_slashing_protection(slashing_protection_str):
+    minimal = json.loads(minimize_slashing_protection(slashing_protection_str))
+
+    assert minimal["metadata"] == json.loads(slashing_protection_str)["metadata"]
+    assert minimal["data"] == [
+        {
+            "pubkey": "0x876a9a7fadb5b9d2114a5180f9fe50b451cbab5f241b42e476b724a3575e5a8277767bc5a7c831c63f066a9a725c53d6",
+            "signed_blocks": [{"slot": "4866645", "signing_root": "0xc24c384a4b9ecef533b6d838691d83ac3e4b06c2903fb09200957583ea291c3d"}],
+            "signed_attestations": [
+                {
+                    "source_epoch": "154316",
+                    "target_epoch": "154317",
+                    "signing_root": "0x9d731a700e06f0999b6964d65b6858022690387a47d25919f6e01daa6173dfc9",
+                }
+            ],
+        }
+    ]
+
+
+def test_minimize_slashing_protection_merges_records():
+    document = {
+        "metadata": {"interchange_format_version": "5", "genesis_validators_root": genesis_validators_root},
+        "data": [
+            {
+                "pubkey": pubkeys[0],
+                "signed_blocks": [{"slot": "9"}, {"slot": "10"}],
+                "signed_attestations": [{"source_epoch": "5", "target_epoch": "6"}],
+            },
+            {
+                "pubkey": pubkeys[0].upper().replace("0X", "0x"),
+                "signed_blocks": [{"slot": "8"}],
+                "signed_attestations": [{"source_epoch": "4", "target_epoch": "7"}],
+            },
+            {"pubkey": pubkeys[1], "signed_blocks": [], "signed_attestations": []},
+        ],
+    }
+
+    minimal = json.loads(minimize_slashing_protection(json.dumps(document)))
+
+    assert minimal["data"] == [
+        {"pubkey": pubkeys[0], "signed_blocks": [{"slot": "10"}], "signed_attestations": [{"source_epoch": "5", "target_epoch": "7"}]},
+        {"pubkey": pubkeys[1], "signed_blocks": [], "signed_attestations": []},
+    ]
+
+
+def test_minimize_slashing_protection_invalid():
+    with pytest.raises(ValueError):
+        minimize_slashing_protection('{"metadata": {}}')
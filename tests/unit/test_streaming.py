@@ -0,0 +1,118 @@
+"""Unit tests for the streaming module."""
+
+import json
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import eth_2_key_manager_api_client
+from eth_2_key_manager_api_client.json_codec import STDLIB_JSON_CODEC
+from eth_2_key_manager_api_client.models.import_keystores_response import ImportKeystoresResponse
+from eth_2_key_manager_api_client.models.import_remote_keys_response import ImportRemoteKeysResponse
+from eth_2_key_manager_api_client.streaming import iter_import_keystores_body, iter_import_remote_keys_body
+
+pubkeys = [f"0x{i:096x}" for i in range(3)]
+remote_keys = [{"pubkey": pubkey, "url": "https://remote.signer"} for pubkey in pubkeys]
+
+
+def write_keystores(tmp_path):
+    keystore_files = []
+    for i, pubkey in enumerate(pubkeys):
+        keystore_file = tmp_path / f"keystore-{i}.json"
+        keystore_file.write_text(json.dumps({"pubkey": pubkey[2:], "description": 'quote "'}), encoding="utf-8")
+        keystore_files.append(keystore_file)
+    return keystore_files
+
+
+def import_response(body: bytes) -> httpx.Response:
+    decoded_body = json.loads(body)
+    items = decoded_body["keystores"] if "keystores" in decoded_body else decoded_body["remote_keys"]
+    return httpx.Response(status_code=200, json={"data": [{"status": "imported"} for _ in items]})
+
+
+def import_callback(request: httpx.Request) -> httpx.Response:
+    return import_response(request.read())
+
+
+async def async_import_callback(request: httpx.Request) -> httpx.Response:
+    return import_response(await request.aread())
+
+
+def test_iter_import_keystores_body(tmp_path):
+    keystore_files = write_keystores(tmp_path)
+
+    pieces = list(iter_import_keystores_body(STDLIB_JSON_CODEC, iter(keystore_files), iter(["a", "b", "c"]), '{"data": []}'))
+
+    assert len(pieces) == len(keystore_files) + 1
+    assert json.loads(b"".join(pieces)) == {
+        "keystores": [keystore_file.read_text() for keystore_file in keystore_files],
+        "passwords": ["a", "b", "c"],
+        "slashing_protection": '{"data": []}',
+    }
+    assert json.loads(b"".join(iter_import_keystores_body(STDLIB_JSON_CODEC, [], []))) == {"keystores": [], "passwords": []}
+
+
+def test_iter_import_keystores_body_length_mismatch(tmp_path):
+    keystore_files = write_keystores(tmp_path)
+
+    with pytest.raises(ValueError):
+        list(iter_import_keystores_body(STDLIB_JSON_CODEC, keystore_files, ["a", "b"]))
+    with pytest.raises(ValueError):
+        list(iter_import_keystores_body(STDLIB_JSON_CODEC, keystore_files, ["a", "b", "c", "d"]))
+
+
+def test_iter_import_remote_keys_body():
+    assert json.loads(b"".join(iter_import_remote_keys_body(STDLIB_JSON_CODEC, iter(remote_keys)))) == {"remote_keys": remote_keys}
+    assert json.loads(b"".join(iter_import_remote_keys_body(STDLIB_JSON_CODEC, []))) == {"remote_keys": []}
+
+
+def test_import_keystores_streaming_sync(httpx_mock: HTTPXMock, tmp_path):
+    httpx_mock.add_callback(import_callback)
+    keystore_files = write_keystores(tmp_path)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    response = eth_2_key_manager.import_keystores_streaming.sync_detailed(keystore_files, ["a", "b", "c"])
+
+    request = httpx_mock.get_requests()[0]
+    assert request.headers["Transfer-Encoding"] == "chunked"
+    assert request.headers["Content-Type"] == "application/json"
+    assert isinstance(response.parsed, ImportKeystoresResponse)
+    assert len(response.parsed.data) == len(keystore_files)
+
+
+@pytest.mark.asyncio
+async def test_import_keystores_streaming_asyncio(httpx_mock: HTTPXMock, tmp_path):
+    httpx_mock.add_callback(async_import_callback)
+    keystore_files = write_keystores(tmp_path)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    parsed = await eth_2_key_manager.import_keystores_streaming.asyncio(keystore_files, ["a", "b", "c"], '{"data": []}')
+
+    assert json.loads(httpx_mock.get_requests()[0].content)["slashing_protection"] == '{"data": []}'
+    assert len(parsed.data) == len(keystore_files)
+
+
+def test_import_remote_keys_streaming_sync(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(import_callback)
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    parsed = eth_2_key_manager.import_remote_keys_streaming.sync(remote_key for remote_key in remote_keys)
+
+    assert isinstance(parsed, ImportRemoteKeysResponse)
+    assert len(parsed.data) == len(remote_keys)
+
+
+@pytest.mark.asyncio
+async def test_import_remote_keys_streaming_asyncio(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(async_import_callback)
+
+    async def remote_keys_source():
+        for remote_key in remote_keys:
+            yield remote_key
+
+    eth_2_key_manager = eth_2_key_manager_api_client.Eth2KeyManager(base_url="http://localhost:8080", token="test_token")
+    response = await eth_2_key_manager.import_remote_keys_streaming.asyncio_detailed(remote_keys_source())
+
+    assert json.loads(httpx_mock.get_requests()[0].content) == {"remote_keys": remote_keys}
+    assert len(response.parsed.data) == len(remote_keys)
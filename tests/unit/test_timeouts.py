@@ -0,0 +1,133 @@
+"""Unit tests for split timeouts, per endpoint class timeouts and deadlines."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from eth_2_key_manager_api_client.concurrency_limiter import AIMDConcurrencyLimiter
+from eth_2_key_manager_api_client.errors import DeadlineExceeded
+from eth_2_key_manager_api_client.retry import RetryPolicy
+from eth_2_key_manager_api_client.timeouts import deadline, default_endpoint_timeouts, get_remaining
+
+from ..mocks import mock_base_url, mock_response_list_keys_200
+
+import_response = {"data": [{"status": "imported", "message": ""}]}
+
+
+def sent_timeouts(httpx_mock: HTTPXMock):
+    return [request.extensions["timeout"] for request in httpx_mock.get_requests()]
+
+
+def test_split_timeouts_and_endpoint_defaults(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(method="GET", status_code=200, json=mock_response_list_keys_200)
+    httpx_mock.add_response(method="POST", status_code=200, json=import_response)
+
+    eth_2_key_manager = eth_2_key_manager_with(timeout=httpx.Timeout(10.0, connect=2.0))
+    eth_2_key_manager.list_keys.sync()
+    eth_2_key_manager.import_keystores.sync(["{}"], ["password"])
+
+    assert sent_timeouts(httpx_mock) == [
+        {"connect": 2.0, "read": 10.0, "write": 10.0, "pool": 10.0},
+        {"connect": 2.0, "read": 300.0, "write": 300.0, "pool": 10.0},
+    ]
+
+
+def test_endpoint_timeouts(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(method="GET", status_code=200, json=mock_response_list_keys_200)
+    httpx_mock.add_response(method="POST", status_code=200, json=import_response)
+
+    eth_2_key_manager = eth_2_key_manager_with(timeout=5.0, endpoint_timeouts={"ListKeys": 1.0})
+    eth_2_key_manager.list_keys.sync()
+    eth_2_key_manager.import_keystores.sync(["{}"], ["password"])
+
+    assert [timeout["read"] for timeout in sent_timeouts(httpx_mock)] == [1.0, 5.0]
+    with pytest.raises(ValueError, match="ListKey"):
+        eth_2_key_manager_with(endpoint_timeouts={"ListKey": 1.0})
+
+
+def test_default_endpoint_timeouts():
+    assert default_endpoint_timeouts(600.0) == {"ImportKeystores": httpx.Timeout(600.0)}
+    assert default_endpoint_timeouts(httpx.Timeout(None, connect=3.0)) == {"ImportKeystores": httpx.Timeout(None, connect=3.0)}
+
+
+def test_deadline_caps_timeouts(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(status_code=200, json=mock_response_list_keys_200)
+
+    eth_2_key_manager = eth_2_key_manager_with(timeout=10.0)
+    with deadline(2.0):
+        with deadline(60.0):
+            assert get_remaining() <= 2.0
+            eth_2_key_manager.list_keys.sync()
+    assert get_remaining() is None
+
+    assert all(0.0 < value <= 2.0 for value in sent_timeouts(httpx_mock)[0].values())
+
+
+def test_deadline_exceeded(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    eth_2_key_manager = eth_2_key_manager_with()
+
+    with deadline(0.0):
+        with pytest.raises(DeadlineExceeded):
+            eth_2_key_manager.list_keys.sync()
+
+    assert httpx_mock.get_requests() == []
+
+
+def test_deadline_stops_retries(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(status_code=503)
+
+    eth_2_key_manager = eth_2_key_manager_with(retry_policy=RetryPolicy(backoff=1.0, jitter=False))
+    with deadline(0.5):
+        response = eth_2_key_manager.list_keys.sync_detailed()
+
+    assert response.status_code == 503
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_deadline_bulk_import(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    keystores = [json.dumps({"pubkey": f"{i:096x}"}) for i in range(4)]
+
+    eth_2_key_manager = eth_2_key_manager_with()
+    with deadline(0.0):
+        response = eth_2_key_manager.bulk_import_keystores.sync(keystores, ["password"] * 4)
+
+    assert [data_item.status.value for data_item in response.data] == ["error"] * 4
+    assert response.data[0].message.startswith("DeadlineExceeded")
+    assert httpx_mock.get_requests() == []
+
+
+@pytest.mark.asyncio
+async def test_deadline_asyncio(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    httpx_mock.add_response(status_code=200, json=mock_response_list_keys_200)
+
+    eth_2_key_manager = eth_2_key_manager_with(timeout=10.0)
+    with deadline(3.0):
+        # tasks created in the scope inherit the deadline
+        await asyncio.gather(*(eth_2_key_manager.list_keys.asyncio() for _ in range(2)))
+
+    assert all(timeout["read"] <= 3.0 for timeout in sent_timeouts(httpx_mock))
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_asyncio_requests(httpx_mock: HTTPXMock, eth_2_key_manager_with):
+    async def slow_callback(request: httpx.Request) -> httpx.Response:
+        # e.g. a node sending its response slowly, no single read times out
+        await asyncio.sleep(1.0)
+        return httpx.Response(status_code=200, json=mock_response_list_keys_200)
+
+    httpx_mock.add_callback(slow_callback)
+    concurrency_limiter = AIMDConcurrencyLimiter()
+
+    eth_2_key_manager = eth_2_key_manager_with(timeout=10.0, concurrency_limiter=concurrency_limiter)
+    start = time.monotonic()
+    with deadline(0.05):
+        with pytest.raises(DeadlineExceeded):
+            await eth_2_key_manager.list_keys.asyncio()
+
+    assert time.monotonic() - start < 0.5
+    assert concurrency_limiter.get_in_flight(mock_base_url) == 0